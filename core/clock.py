@@ -0,0 +1,49 @@
+"""
+Módulo com o relógio virtual do jogo.
+
+Todos os temporizadores do gameplay (power-ups, efeitos, rastros, paralisação)
+leem o tempo deste relógio, por game.now(). Ele avança apenas nos passos de
+lógica e fica parado enquanto o jogo está pausado. A velocidade define quantos
+passos o loop principal executa por segundo real: 10 avança a partida dez
+vezes mais rápido, sem mudar o comportamento. Sem janela, os passos não
+esperam o tempo real e a velocidade não se aplica.
+"""
+
+
+class GameClock:
+    """Relógio virtual: tempo simulado (ms) que avança a cada passo de lógica."""
+
+    def __init__(self, tick_ms, speed=1.0):
+        """
+        :param tick_ms: Duração simulada de cada passo (ms).
+        :param speed: Escala do tempo simulado em relação ao tempo real, no loop principal.
+        """
+        self.tick_ms = tick_ms
+        self.speed = speed
+        self.ticks = 0  # Passos de lógica executados (inclusive durante a pausa)
+        self.running_ticks = 0  # Passos executados fora da pausa
+        self.paused = False
+
+    def now(self):
+        """Tempo simulado (ms), parado durante a pausa."""
+        return self.running_ticks * self.tick_ms
+
+    def advance(self):
+        """Avança um passo de lógica."""
+        self.ticks += 1
+        if not self.paused:
+            self.running_ticks += 1
+
+    def pause(self):
+        """Para o tempo simulado."""
+        self.paused = True
+
+    def resume(self):
+        """Retoma o tempo simulado."""
+        self.paused = False
+
+    def reset(self):
+        """Zera o relógio e retoma o tempo simulado (início de uma partida)."""
+        self.ticks = 0
+        self.running_ticks = 0
+        self.paused = False
@@ -0,0 +1,224 @@
+"""
+Módulo com um ECS (entidades, componentes e sistemas) simples.
+
+Uma entidade é apenas um número inteiro (índice + geração); seus dados ficam
+em armazenamentos densos, um por tipo de componente, e a lógica fica nos
+sistemas registrados no mundo, executados em ordem a cada atualização.
+"""
+import time
+
+
+INDEX_BITS = 24
+INDEX_MASK = (1 << INDEX_BITS) - 1
+
+
+class ComponentStore:
+    """Armazenamento denso de um tipo de componente (remoção trocando com o último)."""
+
+    __slots__ = ('entities', 'values', 'index')
+
+    def __init__(self):
+        self.entities = []  # Entidade de cada posição
+        self.values = []  # Componente de cada posição
+        self.index = {}  # Entidade -> posição
+
+    def add(self, entity, value):
+        """Adiciona (ou substitui) o componente de uma entidade."""
+        position = self.index.get(entity)
+        if position is not None:
+            self.values[position] = value
+            return
+        self.index[entity] = len(self.entities)
+        self.entities.append(entity)
+        self.values.append(value)
+
+    def remove(self, entity):
+        """Remove o componente de uma entidade, se existir."""
+        position = self.index.pop(entity, None)
+        if position is None:
+            return
+        last_entity = self.entities.pop()
+        last_value = self.values.pop()
+        if last_entity != entity:
+            self.entities[position] = last_entity
+            self.values[position] = last_value
+            self.index[last_entity] = position
+
+    def get(self, entity, default=None):
+        """Retorna o componente da entidade."""
+        position = self.index.get(entity)
+        return default if position is None else self.values[position]
+
+    def __contains__(self, entity):
+        return entity in self.index
+
+    def __len__(self):
+        return len(self.entities)
+
+
+class Velocity:
+    """Deslocamento por atualização (guarda também a posição anterior, para interpolar a renderização)."""
+
+    __slots__ = ('dx', 'dy', 'previous_x', 'previous_y')
+
+    def __init__(self, dx=0, dy=0):
+        self.dx = dx
+        self.dy = dy
+        self.previous_x = None  # Ainda não se moveu
+        self.previous_y = None
+
+
+class Sprite:
+    """Imagem (possivelmente compartilhada) desenhada no retângulo da entidade, em uma camada."""
+
+    __slots__ = ('image', 'layer')
+
+    def __init__(self, image, layer=0):
+        self.image = image
+        self.layer = layer
+
+
+class World:
+    """Mundo do ECS: cria e remove entidades e executa os sistemas registrados."""
+
+    def __init__(self, bounds=None):
+        self.bounds = bounds  # Área fora da qual as entidades em movimento são removidas
+        self.generations = []  # Geração atual de cada índice
+        self.free = []  # Índices livres para reaproveitamento
+        self.stores = {}  # Nome do componente -> ComponentStore
+        self.systems = []  # (nome, função(world)) na ordem de execução
+        self.pending = []  # Remoções adiadas para o fim da atualização
+        self.timings = {}  # Nome do sistema -> duração da última execução (ms)
+
+    def spawn(self, **components):
+        """Cria uma entidade com os componentes informados e retorna seu identificador."""
+        if self.free:
+            index = self.free.pop()
+        else:
+            index = len(self.generations)
+            self.generations.append(0)
+        entity = (self.generations[index] << INDEX_BITS) | index
+        for name, value in components.items():
+            self.store(name).add(entity, value)
+        return entity
+
+    def alive(self, entity):
+        """Indica se a entidade ainda existe (IDs de entidades removidas nunca voltam a valer)."""
+        index = entity & INDEX_MASK
+        return index < len(self.generations) and self.generations[index] == entity >> INDEX_BITS
+
+    def despawn(self, entity):
+        """Agenda a remoção da entidade para o fim da atualização."""
+        self.pending.append(entity)
+
+    def flush(self):
+        """Remove as entidades agendadas."""
+        for entity in self.pending:
+            if not self.alive(entity):
+                continue  # Agendada mais de uma vez
+            for store in self.stores.values():
+                store.remove(entity)
+            index = entity & INDEX_MASK
+            self.generations[index] += 1
+            self.free.append(index)
+        self.pending.clear()
+
+    def despawn_all(self, name):
+        """Agenda a remoção de todas as entidades que têm o componente informado."""
+        self.pending.extend(self.store(name).entities)
+
+    def clear(self):
+        """Remove todas as entidades."""
+        for store in self.stores.values():
+            self.pending.extend(store.entities)
+        self.flush()
+
+    def store(self, name):
+        """Retorna o armazenamento de um tipo de componente."""
+        store = self.stores.get(name)
+        if store is None:
+            store = self.stores[name] = ComponentStore()
+        return store
+
+    def get(self, entity, name):
+        """Retorna um componente da entidade (None se ela não o tiver)."""
+        return self.store(name).get(entity)
+
+    def query(self, *names):
+        """
+        Percorre as entidades que têm todos os componentes informados.
+
+        Gera tuplas (entidade, componente1, componente2, ...). Entidades criadas
+        durante a iteração ficam para a próxima consulta.
+        """
+        stores = [self.store(name) for name in names]
+        first, others = stores[0], stores[1:]
+        entities, values = first.entities, first.values
+        for position in range(len(entities)):
+            entity = entities[position]
+            found = [values[position]]
+            for store in others:
+                value = store.get(entity)
+                if value is None:
+                    break
+                found.append(value)
+            else:
+                yield (entity, *found)
+
+    def add_system(self, name, function):
+        """Registra um sistema, executado a cada atualização após os já registrados."""
+        self.systems.append((name, function))
+
+    def update(self):
+        """Executa os sistemas em ordem, medindo cada um, e aplica as remoções adiadas."""
+        for name, function in self.systems:
+            start = time.perf_counter()
+            function(self)
+            self.timings[name] = (time.perf_counter() - start) * 1000
+        self.flush()
+
+    def save_positions(self):
+        """Guarda as posições atuais das entidades em movimento, usadas para interpolar a renderização."""
+        for entity, velocity, rect in self.query('velocity', 'rect'):
+            velocity.previous_x = rect.x
+            velocity.previous_y = rect.y
+
+    def draw_rect(self, entity, rect, alpha=1.0):
+        """Retângulo da entidade interpolado entre as duas últimas atualizações."""
+        velocity = self.store('velocity').get(entity)
+        if velocity is None or velocity.previous_x is None:
+            return rect
+        return rect.move(round((velocity.previous_x - rect.x) * (1 - alpha)),
+                         round((velocity.previous_y - rect.y) * (1 - alpha)))
+
+    def rects(self, alpha=1.0):
+        """Retângulos em que as entidades com sprite são desenhadas."""
+        return [self.draw_rect(entity, rect, alpha) for entity, sprite, rect in self.query('sprite', 'rect')]
+
+    def draw_list(self, layer, alpha=1.0):
+        """Sprites e posições das entidades de uma camada, interpolando as posições."""
+        return [(sprite.image, self.draw_rect(entity, rect, alpha))
+                for entity, sprite, rect in self.query('sprite', 'rect') if sprite.layer == layer]
+
+    def render(self, screen, layer, alpha=1.0):
+        """Desenha as sprites de uma camada (sistema de renderização) em um único lote de blits."""
+        start = time.perf_counter()
+        screen.blits(self.draw_list(layer, alpha), doreturn=False)
+        self.timings[f'render {layer}'] = (time.perf_counter() - start) * 1000
+
+    def stats(self):
+        """Retorna a contagem de entidades, de componentes e o tempo de cada sistema."""
+        return {
+            'entities': len(self.generations) - len(self.free),
+            'components': {name: len(store) for name, store in self.stores.items()},
+            'timings': {name: round(ms, 3) for name, ms in self.timings.items()},
+        }
+
+
+def movement_system(world):
+    """Move as entidades com velocidade, removendo as que saíram da área do mundo."""
+    bounds = world.bounds
+    for entity, velocity, rect in world.query('velocity', 'rect'):
+        rect.move_ip(velocity.dx, velocity.dy)
+        if bounds is not None and not bounds.colliderect(rect):
+            world.despawn(entity)
@@ -1,22 +1,68 @@
+import math
+import os
+import random
+import time
+
 import pygame
 
 from core.state_manager import StateManager
 from core.menu_state import MenuState
+from core.input import PygameInput
+from core.clock import GameClock
 from utils.settings import Settings
 from utils.powerup_manager import PowerUpManager
 from utils.audio_manager import audio_manager
+from utils.profiling import startup_profile
 
 
 class Game:
     
-    def __init__(self):
-        pygame.init()
+    def __init__(self, headless=False, seed=None, record=None, speed=None):
+        """
+        :param headless: Sem janela: a tela é uma superfície fora da tela e nenhum estado é
+                         iniciado (ver core/headless.py).
+        :param seed: Semente do gerador aleatório de cada partida (None para uma semente aleatória).
+        :param record: Arquivo em que cada partida é gravada (ver core/replay.py).
+        :param speed: Velocidade do relógio do jogo no loop principal (None para SCREEN['speed']).
+        """
         self.config = Settings() # Configurações do jogo
-        self.screen = pygame.display.set_mode((self.config.SCREEN['width'], self.config.SCREEN['height']))
-        pygame.display.set_icon(pygame.image.load('graphics/images/icon.png'))
-        pygame.display.set_caption("Invasão Alienigena")
+        self.headless = headless
+        self.renders = not headless  # O estado é desenhado (sem janela, apenas se pedido ao HeadlessRunner)
+        self.seed = seed
+        self.record = record
+
+        with startup_profile.phase('pygame init'):
+            # Apenas os módulos usados em todos os modos: o mixer é aberto pelo
+            # audio_manager no primeiro som (e nunca sem janela)
+            pygame.display.init()
+            pygame.font.init()
+
+        with startup_profile.phase('display init'):
+            size = (self.config.SCREEN['width'], self.config.SCREEN['height'])
+            if headless:
+                # Janela mínima no driver sem vídeo, apenas para que as imagens sejam convertidas
+                # ao formato de exibição; cada jogo desenha em sua própria superfície
+                if pygame.display.get_surface() is None:
+                    pygame.display.set_mode((1, 1))
+                self.screen = pygame.Surface(size)
+            else:
+                self.screen = pygame.display.set_mode(size)
+                pygame.display.set_icon(pygame.image.load('graphics/images/icon.png'))
+                pygame.display.set_caption("Invasão Alienigena")
+
+        audio_manager.enabled = not headless  # Sem janela, nenhum som é tocado nem decodificado
 
-        self.clock = pygame.time.Clock()
+        self.frame_clock = pygame.time.Clock()  # Limitador da taxa de quadros
+        self.input = PygameInput()  # Fonte da entrada do gameplay (teclado ou roteiro)
+        # Relógio virtual lido por todos os temporizadores do gameplay
+        self.clock = GameClock(1000 / self.config.SCREEN['tick_rate'],
+                               self.config.SCREEN['speed'] if speed is None else speed)
+        audio_manager.clock = self.clock  # O intervalo mínimo entre os sons também segue o relógio do jogo
+        self.render_alpha = 1.0  # Fração do passo de lógica já decorrida, usada para interpolar a renderização
+        self.rng = random.Random(seed)  # Gerador aleatório do gameplay (reproduzível a partir da semente)
+        self.match_seed = None  # Semente da partida em andamento
+        self.recorder = None  # Gravação da partida em andamento
+        self.matches = 0  # Partidas iniciadas
         self.running = True  # Atributo que garante que o jogo esteja em execução
         self.paused = False  # Atributo para controlar o estado de pausa
         self.powerup_manager = PowerUpManager(self)  # Inicializa o gerenciador de power-ups
@@ -25,34 +71,120 @@ class Game:
 
         # Gerenciador de estados
         self.state_manager = StateManager()
-        self.state_manager.set_state(MenuState(self))
+        if not headless:
+            with startup_profile.phase('asset load'):
+                self.state_manager.set_state(MenuState(self))
+
+    @property
+    def ticks(self):
+        """Passos de lógica executados na partida"""
+        return self.clock.ticks
+
+    def now(self):
+        """Tempo simulado do jogo (ms), que avança a cada passo de lógica e para durante a pausa"""
+        return self.clock.now()
+
+    def step(self):
+        """Avança a lógica do jogo em um passo de duração fixa"""
+        self.clock.advance()
+        self.state_manager.update()
+        if self.recorder is not None:
+            self.recorder.after_step()
+
+    def begin_match(self, state):
+        """Prepara uma nova partida: reinicia o tempo simulado, a semente e a gravação"""
+        self.clock.reset()
+        self.paused = False  # O relógio reiniciado não está pausado
+        self.matches += 1
+        self.powerup_manager.active_powerups.clear()  # Os tempos de expiração eram da partida anterior
+        self.powerup_freeze = False
+        seed = self.match_seed = self.seed if self.seed is not None else random.randrange(1 << 32)
+        self.rng.seed(seed)
+
+        if self.record:
+            from core.replay import ReplayRecorder  # Importado apenas ao gravar
+
+            self.end_recording()
+            # A partir da segunda partida, cada uma ganha seu próprio arquivo (partida-2.ifr, ...)
+            path = self.record
+            if self.matches > 1:
+                root, ext = os.path.splitext(path)
+                path = f"{root}-{self.matches}{ext}"
+            self.recorder = ReplayRecorder(self, state, self.input, path, seed)
+            self.input = self.recorder
+
+    def end_recording(self):
+        """Encerra a gravação da partida, se houver"""
+        if self.recorder is not None:
+            self.recorder.close()
+            self.input = self.recorder.source
+            self.recorder = None
 
     def toggle_pause(self):
         """Alterna entre pausar e retomar o jogo"""
         if self.paused:
-            pygame.mixer.music.unpause()
+            audio_manager.unpause_music()
         else:
-            pygame.mixer.music.pause()
+            audio_manager.pause_music()
 
         if not self.powerup_freeze:  # Só permite pausar se não houver paralização de power-up ativa
             self.paused = not self.paused
+            # Os temporizadores param junto com o jogo
+            if self.paused:
+                self.clock.pause()
+            else:
+                self.clock.resume()
 
     def update_powerup_freeze(self):
         """Verifica se o tempo de paralisação do power-up acabou e libera o jogo"""
-        if self.powerup_freeze and pygame.time.get_ticks() >= self.powerup_freeze_end_time:
+        if self.powerup_freeze and self.now() >= self.powerup_freeze_end_time:
             self.powerup_freeze = False  # Libera o jogo para continuar
             self.powerup_manager.activate_powerup(self.active_powerup.type)  # Agora ativa o efeito
             self.active_powerup = None  # Remove o power-up ativo
 
-    def run(self):
-        """Loop principal do jogo."""
+    def run(self, max_frames=None):
+        """
+        Loop principal do jogo (max_frames encerra após alguns quadros, usado na medição).
+
+        A lógica avança em passos fixos (SCREEN['tick_rate']), independentes da taxa
+        de quadros; a renderização interpola as posições entre os dois últimos passos.
+        Com a velocidade do relógio acima de 1, cada segundo real executa mais passos.
+        """
+        step = 1 / self.config.SCREEN['tick_rate']
+        max_steps = self.config.SCREEN['max_steps'] * math.ceil(self.clock.speed)
+        accumulator = step  # Garante um passo de lógica antes do primeiro quadro
+        previous = time.perf_counter()
+        frames = 0
         while self.running:
+            now = time.perf_counter()
+            accumulator += (now - previous) * self.clock.speed
+            previous = now
+
             self.state_manager.handle_events()
-            self.state_manager.update()
-            self.state_manager.render(self.screen)
-            pygame.display.flip()
-            self.clock.tick(self.config.SCREEN['fps'])
 
+            steps = 0
+            while accumulator >= step and self.running:
+                if steps == max_steps:
+                    accumulator = 0  # Máquina lenta: descarta o atraso em vez de tentar recuperá-lo
+                    break
+                self.step()
+                accumulator -= step
+                steps += 1
+            self.render_alpha = accumulator / step
+
+            dirty_rects = self.state_manager.render(self.screen)
+            if dirty_rects is None:
+                pygame.display.flip()
+            else:
+                pygame.display.update(dirty_rects)  # Modo de retângulos sujos
+            startup_profile.first_frame()
+            self.frame_clock.tick(self.config.SCREEN['fps'])
+
+            frames += 1
+            if max_frames is not None and frames >= max_frames:
+                self.running = False
+
+        self.end_recording()
         pygame.quit()
 
         
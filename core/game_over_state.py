@@ -1,6 +1,7 @@
 import pygame
 
 from utils.settings import Settings
+from graphics.text import text_renderer
 
 
 class GameOverState:
@@ -10,21 +11,21 @@ class GameOverState:
         self.game = game
         self.config = Settings()
         self.win = win
-        self.font_1 = pygame.font.Font("fonts/conthrax-sb.otf", 50)
-        self.font_2 = pygame.font.Font("fonts/conthrax-sb.otf", 22)
+        self.font_1 = ("fonts/conthrax-sb.otf", 50)
+        self.font_2 = ("fonts/conthrax-sb.otf", 22)
         self.text_rect = None
 
         # Configurações do texto
         if self.win:
-            self.text = self.font_1.render("Parabéns! Você venceu!", True, (0, 255, 0), )
+            self.text = text_renderer.render(self.font_1, "Parabéns! Você venceu!", (0, 255, 0))
         else:
-            self.text = self.font_1.render("GAME OVER", True, (255, 0, 0))
+            self.text = text_renderer.render(self.font_1, "GAME OVER", (255, 0, 0))
             self.text_render = self.text.get_rect()
         self.text_rect = self.text.get_rect()
         self.text_rect.center = (self.config.SCREEN['width'] // 2, (self.config.SCREEN['height'] // 2) - 80)
 
         # Configurações das instruções
-        self.instruction = self.font_2.render("Pressione ENTER para voltar ao Menu", True, (255, 255, 255))
+        self.instruction = text_renderer.render(self.font_2, "Pressione ENTER para voltar ao Menu", (255, 255, 255))
         self.inst_rect = self.instruction.get_rect()
         self.inst_rect.center = (self.config.SCREEN['width'] // 2, (self.config.SCREEN['height'] // 2) + 80)
 
@@ -0,0 +1,107 @@
+"""
+Módulo do modo sem janela (headless) do gameplay.
+
+Executa o PlayingState o mais rápido que a CPU permitir: sem renderização, sem
+apresentação da tela e sem limitador de quadros, com a entrada vinda de um
+roteiro ou de uma função (ver core/input.py). A lógica é a mesma do jogo
+normal, passo a passo. Para uma execução com o piloto automático:
+
+    python -m core.headless --ticks 36000
+"""
+import argparse
+import os
+import time
+
+import pygame
+
+from core.game import Game
+from core.input import ScriptedInput
+from core.playing_state import PlayingState
+
+
+def autopilot(game, tick):
+    """Controle automático simples: segue o alienigena mais próximo e atira sempre que possível."""
+    keys = set()
+    ship = game.ship.rect
+    bodies = game.aliens.bodies()
+    if bodies:
+        target = min(bodies, key=lambda body: abs(body[0].centerx - ship.centerx))[0]
+        if target.centerx < ship.centerx - 5:
+            keys.add(pygame.K_LEFT)
+        elif target.centerx > ship.centerx + 5:
+            keys.add(pygame.K_RIGHT)
+    if tick % 2 == 0:
+        keys.add(pygame.K_SPACE)  # Solta e pressiona de novo: um tiro a cada dois passos
+    return keys
+
+
+class HeadlessRunner:
+    """Executa partidas sem janela, com a entrada de um roteiro ou de uma função."""
+
+    def __init__(self, script=None, controller=None, seed=None, record=None, render=False):
+        """
+        :param render: O estado será desenhado (ex: reprodução com --render ou observações em imagem);
+                       sem isso, o trabalho feito apenas para a renderização é evitado.
+        """
+        # Drivers sem janela e sem som (precisam estar definidos antes de pygame.init)
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+        os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+        self.game = Game(headless=True, seed=seed, record=record)
+        self.game.renders = render
+        self.game.input = ScriptedInput(self.game, script, controller)
+        self.state = PlayingState(self.game)
+        self.game.state_manager.set_state(self.state)
+        self.elapsed = 0.0  # Tempo real gasto nos passos (s)
+
+    @property
+    def playing(self):
+        """Indica se a partida ainda está em andamento."""
+        return self.game.running and self.game.state_manager.state is self.state
+
+    def step(self):
+        """Executa um passo de lógica (entrada e atualização, sem renderização)."""
+        self.game.state_manager.handle_events()
+        self.game.step()
+
+    def run(self, max_ticks):
+        """Executa passos até o fim da partida ou até max_ticks, e retorna o resultado."""
+        start = time.perf_counter()
+        while self.playing and self.game.ticks < max_ticks:
+            self.step()
+        self.elapsed += time.perf_counter() - start
+        self.game.end_recording()
+        return self.result()
+
+    def result(self):
+        """Resumo da partida e da velocidade da simulação."""
+        ticks = self.game.ticks
+        return {
+            'ticks': ticks,
+            'simulated_seconds': round(self.game.now() / 1000, 2),
+            'elapsed_seconds': round(self.elapsed, 3),
+            'ticks_per_second': round(ticks / self.elapsed, 1) if self.elapsed else 0.0,
+            'level': self.state.level.lvl,
+            'score': self.state.score.score,
+            'lives': self.state.lives.lives,
+            'game_over': self.game.state_manager.state is not self.state,
+        }
+
+
+def main(argv=None):
+    """Executa uma partida sem janela com o piloto automático e mostra o resultado."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (sem janela)")
+    parser.add_argument('--ticks', type=int, default=36000, help="máximo de passos de lógica (padrão: 10 minutos simulados)")
+    parser.add_argument('--idle', action='store_true', help="sem entrada (a nave fica parada)")
+    parser.add_argument('--seed', type=int, help="semente do gerador aleatório da partida")
+    parser.add_argument('--record', metavar='ARQUIVO', help="grava a partida (reproduzível com python -m core.replay)")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(controller=None if args.idle else autopilot, seed=args.seed, record=args.record)
+    result = runner.run(args.ticks)
+    for name, value in result.items():
+        print(f"{name:<18}{value}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""
+Módulo com as fontes de entrada do gameplay.
+
+O estado de jogo lê a entrada apenas por game.input: poll() retorna os eventos
+do passo e atualiza keys (teclas pressionadas). No jogo normal, a entrada vem
+do pygame; sem janela, vem de um roteiro ou de uma função.
+"""
+import pygame
+
+
+class HeldKeys(frozenset):
+    """Conjunto de teclas pressionadas, consultado como o retorno de pygame.key.get_pressed()."""
+
+    def __getitem__(self, key):
+        return key in self
+
+
+class PygameInput:
+    """Entrada do teclado e da janela, lida do pygame."""
+
+    def __init__(self):
+        self.keys = HeldKeys()
+
+    def poll(self):
+        """Retorna os eventos pendentes e atualiza as teclas pressionadas."""
+        events = pygame.event.get()
+        self.keys = pygame.key.get_pressed()
+        return events
+
+
+class ScriptedInput:
+    """
+    Entrada gerada sem teclado: por um roteiro ou por uma função chamada a cada passo.
+
+    :param script: Dicionário {passo: teclas}; as teclas ficam pressionadas até a próxima entrada do roteiro.
+    :param controller: Função controller(game, passo) que retorna as teclas pressionadas no passo.
+
+    Os eventos KEYDOWN/KEYUP são gerados a partir das mudanças nas teclas, como no teclado real.
+    """
+
+    def __init__(self, game, script=None, controller=None):
+        self.game = game
+        self.script = script or {}
+        self.controller = controller
+        self.keys = HeldKeys()
+        self.tick = 0
+
+    def held(self):
+        """Teclas pressionadas no passo atual."""
+        if self.controller is not None:
+            return HeldKeys(self.controller(self.game, self.tick))
+        if self.tick in self.script:
+            return HeldKeys(self.script[self.tick])
+        return self.keys
+
+    def poll(self):
+        """Retorna os eventos do passo (teclas pressionadas e soltas) e avança o roteiro."""
+        keys = self.held()
+        events = [pygame.event.Event(pygame.KEYDOWN, key=key) for key in sorted(keys - self.keys)]
+        events.extend(pygame.event.Event(pygame.KEYUP, key=key) for key in sorted(self.keys - keys))
+        self.keys = keys
+        self.tick += 1
+        return events
@@ -3,6 +3,9 @@ from utils.settings import Settings
 from utils.audio_manager import audio_manager
 from core.playing_state import PlayingState
 from entities.buttons import MenuButton
+from graphics.assets import assets
+from graphics.text import text_renderer
+from graphics.preloader import preloader
 
 
 class Baseboard:
@@ -10,8 +13,7 @@ class Baseboard:
         self.game = game
         self.config = Settings()
         self.color = (180, 180, 255)
-        self.font = pygame.font.Font(*self.config.BASEBOARD['font'])
-        self.text = self.font.render(self.config.BASEBOARD['text'], True, self.color)
+        self.text = text_renderer.render(self.config.BASEBOARD['font'], self.config.BASEBOARD['text'], self.color)
         self.rect = self.text.get_rect()
         self.rect.centerx, self.rect.bottom = (x, y)
 
@@ -24,11 +26,11 @@ class MenuState:
         self.game = game
         self.config = Settings()
 
-        self.font = pygame.font.Font("fonts/conthrax-sb.otf", 28)
+        self.font = text_renderer.font(("fonts/conthrax-sb.otf", 28))
 
         # Fundo e logo
-        self.background = pygame.image.load('graphics/backgrounds/title_menu_bg.jpg')
-        self.logo = pygame.image.load('graphics/images/logo.png')
+        self.background = assets.image(self.config.BACKGROUND['menu'], alpha=False)
+        self.logo = assets.image(self.config.TITLE_MENU['logo_image'])
         self.logo_rect = self.logo.get_rect(center=(self.config.SCREEN['width'] // 2, self.config.SCREEN['height'] // 4))
 
         # Rodapé
@@ -37,6 +39,9 @@ class MenuState:
         # Música
         audio_manager.play_music('title_bg')
 
+        # Começa a aquecer os recursos do gameplay enquanto o menu está ocioso
+        preloader.start(PlayingState.preload_manifest(self.config))
+
         # Botões
         center_x = self.config.SCREEN['width'] // 2
         self.buttons = [
@@ -46,6 +51,7 @@ class MenuState:
         ]
 
     def start_game(self):
+        preloader.finish()  # Espera apenas pelos recursos que ainda não ficaram prontos
         self.game.state_manager.set_state(PlayingState(self.game))
 
     def go_to_options(self):
@@ -64,6 +70,7 @@ class MenuState:
                     button.handle_click()
 
     def update(self):
+        preloader.pump()  # Prepara uma pequena parte dos recursos do gameplay por quadro
         mouse_pos = pygame.mouse.get_pos()
         for button in self.buttons:
             button.update(mouse_pos)
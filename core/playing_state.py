@@ -1,17 +1,23 @@
+import numpy as np
 import pygame
-import random
 import time
 
 from core.game_over_state import GameOverState
 from utils.settings import Settings
 from utils.audio_manager import audio_manager
-from utils.hud import Score, Lives, Level, PowerUpTimer
+from utils.hud import Score, Lives, Level, PowerUpTimer, HudLayer
 from utils.transitions import NextLevelTransition
+from utils.spatial_hash import SpatialHash
+from graphics.text import text_renderer
+from graphics.preloader import preloader
 from entities.background import GameBackground
 from entities.ships import Ship
-from entities.enemies import Alien
-from entities.powerups import PowerUp
-from entities.effects import AlienExplosionEffect, ScoreUpEffect
+from entities.enemies import Fleet
+from entities.bullets import BulletPool
+from entities.powerups import spawn_powerup
+from entities.particles import ParticleSystem
+from entities.effects import spawn_explosion, spawn_scoreup, register_particle_effects, warm_circles, TRAIL_LAYER, EXPLOSION_LAYER, POWERUP_LAYER, SCOREUP_LAYER
+from core.ecs import World, movement_system
 
 
 class PlayingState:
@@ -20,137 +26,209 @@ class PlayingState:
     def __init__(self, game):
         self.game = game
         self.config = Settings()
+        self.game.begin_match(self) # Reinicia o tempo, a semente e a gravação da partida
 
         self.game.background = GameBackground(self.game)  # Adiciona o fundo animado
+
+        # Mundo do ECS: os power-ups são entidades
+        self.game.world = World(self.game.screen.get_rect())
+
+        # Partículas: rastros, explosões e pontuações
+        self.game.particles = ParticleSystem(bounds=self.game.screen.get_rect(), seed=self.game.match_seed)
+        register_particle_effects(self.game.particles)
         
         self.game.ship = Ship(self.game) # Cria a nave do jogador
-        self.game.speed_trails = [] # Lista de rastros do power-up de velocidade
-        self.game.bullets = [] # Cria a lista de tiros
-
-        # Listas para armazenar objetos referentes aos inimigos
-        self.game.aliens = [] # Cria a lista de alienigenas
-        self.game.explosions = [] # Cria a lista para armazenar as explosões
-        self.game.scoreups = [] # Cria a lista para armazenar os scoreup
+        warm_circles(self.game) # Desenha antecipadamente os círculos dos efeitos
+        self.game.bullets = BulletPool() # Cria o conjunto de tiros
+        self.game.aliens = Fleet(self.game) # Cria a frota de alienigenas
 
         # Define a direção inicial da frota de inimigos
         self.game.fleet_direction = 1 # 1 para a direita, -1 para a esquerda
 
+        # Sistemas executados a cada atualização, nesta ordem
+        self.game.world.add_system('movement', movement_system)
+        self.game.world.add_system('particles', self.update_particles)
+        self.game.world.add_system('bullets', self.update_bullets)
+        self.game.world.add_system('fleet', self.update_fleet)
+        self.game.world.add_system('collision', self.update_collisions)
+
         # Definições dos powerups
-        self.game.powerups = [] # Lista de power-ups
         self.powerup_timer = PowerUpTimer(self.game, 425) # Inicializa o temporizador dos power-ups
 
         # Definições da HUD
-        self.hud_bg = pygame.Surface((self.config.SCREEN['width'], 45)) # Cria o fundo da HUD
-        self.hud_bg.set_alpha(160) # Define a opacidade da HUD
+        self.pause_overlay = None # Fundo semi-transparente da pausa, criado no primeiro uso
         self.score = Score(self.game) # Incializa o sistema de pontuação
         self.lives = Lives(self.game) # Incializa o sistema de vidas
         self.level = Level(self.game) # Define o nível inicial
+        self.hud = HudLayer(self.game, self.score, self.lives, self.level, self.powerup_timer) # Barra da HUD pré-composta
+
+        # Grades espaciais das colisões (reconstruídas a cada quadro)
+        self.alien_grid = SpatialHash(self.config.COLLISION['cell_size'])
+        self.powerup_grid = SpatialHash(self.config.COLLISION['cell_size'])
 
         self.game.playing_state = self  # Permite acesso pelo alien
         self.level_transition = None
 
+        # Estado do modo de retângulos sujos
+        self.previous_rects = [] # Áreas ocupadas pelas entidades no quadro anterior
+        self.rendered_background_version = None # Versão do fundo presente na tela
+        self.rendered_paused = False
+        self.background_cache = pygame.Surface((self.config.SCREEN['width'], self.config.SCREEN['height']))
+        self.background_cache_version = None
+
         self.create_fleet() # Cria a frota de alienigenas inicial
+        self.prefetch_transitions() # Pré-renderiza os textos das próximas transições
         audio_manager.play_music('gameplay_bg') # Executa a música de gameplay
 
+    @staticmethod
+    def preload_manifest(config):
+        """Recursos usados ao entrar no gameplay, para serem aquecidos enquanto o menu está ocioso"""
+        size = (config.SCREEN['width'], config.SCREEN['height'])
+        images = [
+            ("graphics/backgrounds/space_bg.png", size, None, False),
+            ("graphics/backgrounds/stars_far.png", size, None, True),
+            ("graphics/backgrounds/stars_mid.png", size, None, True),
+            ("graphics/backgrounds/stars_near.png", size, None, True),
+            (config.SHIP['image'], None, 3, True),
+            (config.SHIP['image'], (28, 28), None, True),
+            (config.ALIEN['image'], None, 3, True),
+            ('graphics/sprites/powerups/powerup_bg.png', (32, 32), None, True),
+        ]
+        for path in (config.SPEED['image'], config.SHIELD['image'], config.DOUBLE_BULLET['image']):
+            images.append((path, (40, 40), None, True))
+            images.append((path, (32, 32), None, True))
+
+        fonts = [config.HUD['score_font'], config.HUD['lvl_font'], config.SCOREUP['font'], ("fonts/BITSUMIS.TTF", 60)]
+        return {'images': images, 'fonts': fonts}
+
     def create_fleet(self):
         """Cria uma grade de alienigenas na tela"""
         cols = 6 # Quantidade de alienigenas por linha
         rows = 4 # Quantidade de linhas
         
-        # Criamos um alienígena temporário para obter sua largura e altura
-        temp_alien = Alien(self.game, 0, 0)
-        alien_width = temp_alien.rect.width
-        alien_height = temp_alien.rect.height
-
-        spacing_x = alien_width + 20  # Espaçamento horizontal (20 pixels entre aliens)
-        spacing_y = alien_height + 20  # Espaçamento vertical (20 pixels entre linhas)
-
-        for row in range(rows):
-            for col in range(cols):
-                x = 100 + col * spacing_x  # Calcula a posição horizontal com espaçamento
-                y = 50 + row * spacing_y  # Calcula a posição vertical com espaçamento
-                alien = Alien(self.game, x, y)
-                # Aumenta a velocidade a cada nível
-                alien.speed_x += (self.level.lvl - 1) * self.config.ALIEN['speedup_scale']
-                self.game.aliens.append(alien)
+        spacing_x = self.game.aliens.width + 20  # Espaçamento horizontal (20 pixels entre aliens)
+        spacing_y = self.game.aliens.height + 20  # Espaçamento vertical (20 pixels entre linhas)
+
+        # Posições da grade inteira, linha por linha
+        cols_index, rows_index = np.meshgrid(np.arange(cols), np.arange(rows))
+        xs = 100 + cols_index.ravel() * spacing_x
+        ys = 50 + rows_index.ravel() * spacing_y
+
+        # Aumenta a velocidade a cada nível
+        speed_x = 1 + (self.level.lvl - 1) * self.config.ALIEN['speedup_scale']
+        self.game.aliens.spawn(xs, ys, speed_x)
+
+    def prefetch_transitions(self):
+        """Agenda a pré-renderização dos textos das transições que podem ocorrer a seguir (montados por quadro)"""
+        if not self.game.renders:
+            return  # Sem renderização (ex: simulações sem janela), os textos nunca são desenhados
+        NextLevelTransition.prefetch(f"Level {self.level.lvl + 1}", background=True)
+        NextLevelTransition.prefetch(f"Wave {self.level.lvl}", background=True)
+
+    def update_particles(self, world):
+        """Sistema das partículas: move e desvanece todas de uma vez"""
+        self.game.particles.update()
+
+    def update_bullets(self, world):
+        """Sistema dos tiros: move todos de uma vez"""
+        self.game.bullets.update()
+
+    def update_fleet(self, world):
+        """Sistema da frota: movimenta a frota inteira de uma vez e verifica as bordas"""
+        self.game.aliens.update()
+        self.check_fleet_edges()
+
+    def update_collisions(self, world):
+        """Sistema de colisões"""
+        self.check_collisions()
+        self.check_powerup_collisions()
 
     def check_fleet_edges(self):
         """Verifica se algum alienigena atingiu a borda"""
-        for alien in self.game.aliens:
-            if alien.rect.right >= self.config.SCREEN['width'] or alien.rect.left <= 0:
-                self.drop_fleet()
-                break # Todos os alienigenas já desceram
+        if self.game.aliens.at_edge(self.config.SCREEN['width']):
+            self.drop_fleet()
 
     def drop_fleet(self):
         """Faz todos os alienigenas descerem e inverte a direção"""
-        for alien in self.game.aliens:
-            alien.rect.y += 20 # Todos descem 20 pixels
+        self.game.aliens.drop(self.config.ALIEN['drop_speed']) # Todos descem 20 pixels
         self.game.fleet_direction *= -1 # Inverte o movimento da frota
 
     def check_collisions(self):
         """Verifica as colisões entre tiros e alienigenas"""
-        # iteramos sobre cópias das listas
-        for bullet in self.game.bullets[:]:
-            for alien in self.game.aliens[:]:
-                if bullet.rect.colliderect(alien.rect): # Se houver colisão
-                    self.game.bullets.remove(bullet)
-                    self.game.aliens.remove(alien)
-                    self.game.explosions.append(AlienExplosionEffect(self.game, alien.rect.centerx, alien.rect.centery))
-                    self.game.scoreups.append(ScoreUpEffect(self.game, alien.rect.centerx, alien.rect.centery))
-                    self.score.add_points(self.config.ALIEN['points']) # Ganha pontos por cada alienigena destruido
-                    # Chance de soltar um power-up (5%)
-                    if random.randint(1, 100) <= 5:
-                        powerup_type = random.choice(["speed", "shield", "double_shoot"])
-                        self.game.powerups.append(PowerUp(self.game, alien.rect.centerx, alien.rect.centery, powerup_type))
-                    break # O tiro só atinge uma alienigena por vez
+        if not self.game.bullets:
+            return
+
+        # Fase ampla: os tiros só são comparados com os alienigenas das células que ocupam
+        self.alien_grid.rebuild(self.game.aliens.bodies())
+        hits = self.alien_grid.first_hits((bullet.rect, bullet) for bullet in self.game.bullets)
+        if not hits:
+            return
+
+        # Resolve as colisões do quadro de uma vez (cada tiro atinge um alienigena por vez)
+        for bullet, alien in hits:
+            alien_rect = alien.rect
+            self.game.bullets.remove(bullet)
+            self.game.aliens.kill(alien)
+            spawn_explosion(self.game.particles, alien_rect.centerx, alien_rect.centery)
+            spawn_scoreup(self.game.particles, alien_rect.centerx, alien_rect.centery)
+            self.score.add_points(self.config.ALIEN['points']) # Ganha pontos por cada alienigena destruido
+            # Chance de soltar um power-up (5% por padrão)
+            if self.game.rng.randint(1, 100) <= self.config.POWERUP['drop_chance']:
+                powerup_type = self.game.rng.choice(["speed", "shield", "double_shoot"])
+                spawn_powerup(self.game.world, alien_rect.centerx, alien_rect.centery, powerup_type)
     
     def check_powerup_collisions(self):
         """Verifica se a nave coletou um power-up"""
-        for powerup in self.game.powerups[:]:
-            if self.game.ship.rect.colliderect(powerup.rect):
-                # Ativa a paralisação temporária por 500ms (0,5 segundos)
-                self.game.powerup_freeze = True
-                # Salva o power-up que será ativado após a paralisação
-                self.game.active_powerup = powerup
-                # Ativa a animação do power-up
-                self.game.ship.powerup_effect.activate()
-                # Remove o power-up da tela
-                self.game.powerups.remove(powerup)
+        world = self.game.world
+        if not len(world.store('powerup')):
+            return
+
+        self.powerup_grid.rebuild((rect, (entity, powerup)) for entity, powerup, rect in world.query('powerup', 'rect'))
+        for entity, powerup in self.powerup_grid.query(self.game.ship.rect):
+            # Ativa a paralisação temporária por 500ms (0,5 segundos)
+            self.game.powerup_freeze = True
+            # Salva o power-up que será ativado após a paralisação
+            self.game.active_powerup = powerup
+            # Ativa a animação do power-up
+            self.game.ship.powerup_effect.activate()
+            # Remove o power-up da tela
+            world.despawn(entity)
     
     def check_next_level(self):
         """Verifica se o jogador passou para o próximo nível"""
         # Se todos os alienigenas forem destruídos, o jogador sobe de nível
         if len(self.game.aliens) == 0:
-            self.game.bullets = []
-            self.game.powerups = []
+            self.game.bullets.clear()
+            self.game.world.despawn_all('powerup')
+            self.game.world.flush()
             self.level.lvl += 1  # Aumenta o nível
             self.level.update_level(self.level.lvl) # Atualiza a exibição do nível
             self.level_transition = NextLevelTransition(self.game, f"Level {self.level.lvl}")
             self.game.alien_direction = 1  # Reseta a direção dos aliens
             self.create_fleet()  # Cria uma nova frota mais difícil
+            self.prefetch_transitions()
 
     def check_game_over(self):
         """Verifica se o jogo terminou"""
-        for alien in self.game.aliens:
-            if alien.rect.bottom >= self.game.ship.rect.top:
-                if self.lives.lives == 0: # Se o jogador estiver sem vidas
-                    # Se um alienigena tocar a nave, o jogador perde
-                    audio_manager.stop_music() # Interrompe a música de fundo
-                    audio_manager.play_sound('game_over') # Executa o som de fim de jogo
-                    self.game.state_manager.set_state(GameOverState(self.game))
-                    break # Evita múltiplos ocasionamentos
-                elif self.lives.lives > 0: # Reinicia o nível e diminui uma vida do jogador
-                    self.lives.lives -= 1
-                    self.game.aliens = []
-                    self.game.alien_direction = 1  # Reseta a direção dos aliens
-                    self.create_fleet()  # Cria uma nova frota mais difícil
-                    self.level_transition = True
-                    self.level_transition = NextLevelTransition(self.game, f"Wave {self.level.lvl}")
-                    break # Evita múltiplos ocasionamentos
+        # Apenas a linha mais baixa da frota pode alcançar a nave
+        bottom = self.game.aliens.bottom()
+        if bottom is not None and bottom >= self.game.ship.rect.top:
+            if self.lives.lives == 0: # Se o jogador estiver sem vidas
+                # Se um alienigena tocar a nave, o jogador perde
+                audio_manager.stop_music() # Interrompe a música de fundo
+                audio_manager.play_sound('game_over') # Executa o som de fim de jogo
+                self.game.state_manager.set_state(GameOverState(self.game))
+            elif self.lives.lives > 0: # Reinicia o nível e diminui uma vida do jogador
+                self.lives.lives -= 1
+                self.game.aliens.clear()
+                self.game.alien_direction = 1  # Reseta a direção dos aliens
+                self.create_fleet()  # Cria uma nova frota mais difícil
+                self.level_transition = True
+                self.level_transition = NextLevelTransition(self.game, f"Wave {self.level.lvl}")
 
     def handle_events(self):
         """Captura movimentos do usúario movimentação e ações"""
-        events = pygame.event.get() # Obtém a lista de eventos
+        events = self.game.input.poll() # Obtém a lista de eventos (do teclado ou de um roteiro)
         for event in events:
             if event.type == pygame.QUIT:
                 self.game.running = False
@@ -165,11 +243,20 @@ class PlayingState:
 
         # Se o jogo não está pausado, processa os inputs da nave normalmente
         if not self.game.paused:
-            keys = pygame.key.get_pressed()
-            self.game.ship.handle_input(keys, events)
+            self.game.ship.handle_input(self.game.input.keys, events)
+
+    def save_positions(self):
+        """Guarda as posições atuais, usadas para interpolar a renderização até a próxima atualização"""
+        self.game.background.save_positions()
+        self.game.ship.previous_x = self.game.ship.rect.x
+        self.game.aliens.save_positions()
+        self.game.bullets.save_positions()
+        self.game.world.save_positions()
+        self.game.particles.save_positions()
 
     def update(self):
-        """Atualiza a lógica do jogo"""
+        """Atualiza a lógica do jogo (um passo de duração fixa)"""
+        self.save_positions()
         self.game.update_powerup_freeze()
 
         if self.game.paused:
@@ -182,32 +269,13 @@ class PlayingState:
 
         # Atualiza normalmente caso o jogo não esteja paralisado
         self.game.background.update()
-
-        for powerup in self.game.powerups[:]:
-            powerup.update()
-            
         self.game.ship.update()
 
-        for trail in self.game.speed_trails[:]:
-            trail.update()
-
-        for bullet in self.game.bullets[:]:
-            bullet.update()
-
-        for alien in self.game.aliens[:]:
-            alien.update()
-
-        for explosion in self.game.explosions[:]:
-            explosion.update()
-
-        for scoreup in self.game.scoreups[:]:
-            scoreup.update()
+        # Movimento, tempo de vida, tiros, frota e colisões
+        self.game.world.update()
 
         self.game.powerup_manager.update()
 
-        self.check_fleet_edges()
-        self.check_collisions()
-        self.check_powerup_collisions()
         self.check_next_level()
         self.check_game_over()
 
@@ -219,59 +287,117 @@ class PlayingState:
             else:
                 return  # Evita atualizar o jogo enquanto a transição ocorre
 
-    def render(self, screen):
-        """Renderiza os elementos do jogo"""
-        self.game.background.render(screen)  # Renderiza o fundo antes de tudo
-
-        # Renderiza os rastros da nave primeiro (para ficarem abaixo da nave)
-        for trail in self.game.speed_trails:
-            trail.render(screen)
-
-        # Renderiza a nave do jogador na tela
-        self.game.ship.render(screen)
-
-        # Renderiza todos os tiros
-        for bullet in self.game.bullets:
-            bullet.render(screen)
+    def entity_rects(self):
+        """Retorna as áreas da tela ocupadas pelas entidades (e seus efeitos) neste quadro"""
+        alpha = self.game.render_alpha
+        ship = self.game.ship
+        ship_rect = ship.draw_rect(alpha)
+        if ship.shield_active or ship.powerup_effect.active:
+            # Os círculos do escudo e do power-up se estendem além da nave
+            rects = [ship_rect.inflate(ship_rect.width * 4, ship_rect.width * 4)]
+        else:
+            rects = [ship_rect]
+
+        rects.extend(self.game.aliens.rects(alpha))
+        rects.extend(self.game.bullets.rects(alpha))
+        rects.extend(self.game.world.rects(alpha))
+        rects.extend(self.game.particles.rects(alpha))
 
-        # Renderiza todos os alienigenas
-        for alien in self.game.aliens:
-            alien.render(screen)
+        if self.level_transition:
+            rects.append(self.level_transition.dirty_rect())
 
-        # Renderiza as explosões
-        for explosion in self.game.explosions:
-            explosion.render(screen)
+        screen_rect = self.game.screen.get_rect()
+        return [rect.clip(screen_rect) for rect in rects if rect.colliderect(screen_rect)]
 
-        # Renderiza os power-ups
-        for powerup in self.game.powerups:
-            powerup.render(screen)
+    def render(self, screen):
+        """
+        Renderiza os elementos do jogo.
+
+        Retorna None quando a tela inteira deve ser apresentada, ou a lista de
+        retângulos alterados no modo de retângulos sujos.
+        """
+        preloader.pump()  # Monta uma pequena parte dos textos das próximas transições por quadro
+
+        if self.config.RENDER['dirty_rects']:
+            return self.render_dirty(screen)
+
+        self.game.background.render(screen, self.game.render_alpha)  # Renderiza o fundo antes de tudo
+        self.render_entities(screen)
+        return None
+
+    def render_dirty(self, screen):
+        """Restaura o fundo e redesenha apenas sob as áreas anteriores e atuais das entidades"""
+        background = self.game.background
+        rects = self.entity_rects()
+        dirty = self.previous_rects + rects
+        self.previous_rects = rects
+
+        # Com o fundo rolando, ao (des)pausar ou com muita área suja, a tela inteira é redesenhada
+        screen_area = screen.get_width() * screen.get_height()
+        full = (background.version != self.rendered_background_version
+                or self.game.paused != self.rendered_paused
+                or sum(rect.width * rect.height for rect in dirty) > self.config.RENDER['dirty_threshold'] * screen_area)
+        self.rendered_paused = self.game.paused
+
+        if full:
+            self.rendered_background_version = background.version
+            background.render(screen)
+            self.render_entities(screen)
+            return None
 
-        # Renderiza o scoreup
-        for scoreup in self.game.scoreups:
-            scoreup.render(screen)
+        if self.game.paused:
+            return []  # Nada se move enquanto o jogo está pausado
+
+        # Cópia do fundo parado, usada para restaurar as áreas sujas
+        if self.background_cache_version != background.version:
+            background.render(self.background_cache)
+            self.background_cache_version = background.version
+
+        # A HUD é redesenhada se mudou ou se alguma entidade passou por baixo dela
+        hud = self.hud.signature != self.hud.state() or self.hud.rect.collidelist(dirty) != -1
+        if hud:
+            dirty.append(self.hud.rect)
+
+        for rect in dirty:
+            screen.blit(self.background_cache, rect, rect)
+        self.render_entities(screen, hud=hud)
+        return dirty
+
+    def draw_layers(self, alpha=1.0):
+        """Sprites e posições de cada camada de entidades, na ordem de desenho"""
+        particles = self.game.particles
+        return (
+            particles.draw_list(TRAIL_LAYER, alpha),  # Rastros da nave primeiro (para ficarem abaixo da nave)
+            self.game.ship.draw_list(alpha),  # Nave do jogador e seus efeitos
+            self.game.bullets.draw_list(alpha),  # Tiros
+            self.game.aliens.draw_list(alpha),  # Alienigenas e efeitos de surgimento
+            particles.draw_list(EXPLOSION_LAYER, alpha),  # Explosões
+            self.game.world.draw_list(POWERUP_LAYER, alpha),  # Power-ups
+            particles.draw_list(SCOREUP_LAYER, alpha),  # Scoreup
+        )
+
+    def render_entities(self, screen, hud=True):
+        """Renderiza as entidades, a HUD e a pausa por cima do fundo"""
+        # Cada camada é desenhada com um único lote de blits
+        alpha = self.game.render_alpha # Fração do passo de lógica usada na interpolação das posições
+        for blits in self.draw_layers(alpha):
+            screen.blits(blits, doreturn=False)
 
         # Renderiza a transição de nível
         if self.level_transition:
             self.level_transition.render(screen)
         
-        # Exibe o fundo da HUD
-        screen.blit(self.hud_bg, (0, 0))
-        # Exibe a pontuação na tela
-        self.score.render(screen)
-        # Exibe as vidas na tela
-        self.lives.render(screen)
-        # Exibe o nível na tela
-        self.level.render(screen)
-        # Exibe o temporizador do power-up
-        self.powerup_timer.render(screen)
+        # Exibe a HUD (pontuação, vidas, nível e temporizadores) já composta
+        if hud:
+            self.hud.render(screen)
 
         # Se o jogo estiver pausado, exibe a mensagem de pausa
         if self.game.paused:
-            pause_overlay = pygame.Surface((self.game.config.SCREEN['width'], self.game.config.SCREEN['height']), pygame.SRCALPHA)
-            pause_overlay.fill((0, 0, 0, 150))  # Fundo semi-transparente
-            screen.blit(pause_overlay, (0, 0))
+            if self.pause_overlay is None:
+                self.pause_overlay = pygame.Surface((self.game.config.SCREEN['width'], self.game.config.SCREEN['height']), pygame.SRCALPHA)
+                self.pause_overlay.fill((0, 0, 0, 150))  # Fundo semi-transparente
+            screen.blit(self.pause_overlay, (0, 0))
 
-            font = pygame.font.Font("fonts/BITSUMIS.TTF", 60)
-            text = font.render("PAUSADO", True, (255, 255, 255))
+            text = text_renderer.render(("fonts/BITSUMIS.TTF", 60), "PAUSADO", (255, 255, 255))
             text_rect = text.get_rect(center=(self.game.config.SCREEN['width'] // 2, self.game.config.SCREEN['height'] // 2))
             screen.blit(text, text_rect)
@@ -0,0 +1,79 @@
+"""
+Módulo de medição da renderização das entidades.
+
+Joga uma partida sem janela com o piloto automático e, a cada quadro, desenha
+as mesmas camadas do PlayingState (ver PlayingState.draw_layers) de duas
+formas: um blit por sprite e um lote de blits (Surface.blits) por camada.
+Mostra as chamadas de desenho e o tempo médio de cada forma por quadro. Para
+medir com algumas centenas de sprites:
+
+    python -m core.render_bench --particles 300
+"""
+import argparse
+import time
+
+import numpy as np
+
+from core.headless import HeadlessRunner, autopilot
+
+
+def blit_each(screen, layers):
+    """Desenha cada sprite com uma chamada de blit; retorna as chamadas feitas."""
+    calls = 0
+    for blits in layers:
+        for surface, position in blits:
+            screen.blit(surface, position)
+        calls += len(blits)
+    return calls
+
+
+def blit_batched(screen, layers):
+    """Desenha cada camada com uma única chamada de blits; retorna as chamadas feitas."""
+    for blits in layers:
+        screen.blits(blits, doreturn=False)
+    return len(layers)
+
+
+def main(argv=None):
+    """Compara o desenho sprite a sprite com o desenho em lotes por camada."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (medição da renderização)")
+    parser.add_argument('--ticks', type=int, default=3600, help="passos de lógica da partida (um quadro por passo)")
+    parser.add_argument('--particles', type=int, default=0, help="explosões mantidas vivas além das do gameplay")
+    parser.add_argument('--seed', type=int, default=0, help="semente do gerador aleatório da partida")
+    args = parser.parse_args(argv)
+
+    runner = HeadlessRunner(controller=autopilot, seed=args.seed, render=True)
+    game = runner.game
+    screen = game.screen
+    rng = np.random.default_rng(args.seed)
+    width, height = screen.get_size()
+
+    totals = {'frames': 0, 'sprites': 0, 'each_calls': 0, 'batched_calls': 0, 'each_ms': 0.0, 'batched_ms': 0.0}
+    while runner.playing and game.ticks < args.ticks:
+        # Mantém as explosões extras (espalhadas pela tela)
+        while len(game.particles) < args.particles:
+            game.particles.emit('explosion', *rng.uniform((0, 0), (width, height)))
+        runner.step()
+
+        layers = [blits for blits in runner.state.draw_layers(0.5) if blits]
+        game.background.render(screen)
+        start = time.perf_counter()
+        totals['each_calls'] += blit_each(screen, layers)
+        totals['each_ms'] += (time.perf_counter() - start) * 1000
+
+        game.background.render(screen)
+        start = time.perf_counter()
+        totals['batched_calls'] += blit_batched(screen, layers)
+        totals['batched_ms'] += (time.perf_counter() - start) * 1000
+
+        totals['sprites'] += sum(map(len, layers))
+        totals['frames'] += 1
+
+    frames = totals.pop('frames') or 1
+    print(f"{'frames':<18}{frames}")
+    for name, value in totals.items():
+        print(f"{name:<18}{value / frames:.3f}")
+
+
+if __name__ == '__main__':
+    main()
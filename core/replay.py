@@ -0,0 +1,320 @@
+"""
+Módulo de gravação e reprodução de partidas.
+
+Uma partida é reproduzível a partir da semente do gerador aleatório do jogo
+(game.rng), das configurações substituídas e da entrada lida a cada quadro.
+A gravação é feita em um arquivo binário compacto, escrito à medida que a
+partida avança:
+
+    cabeçalho   MAGIC, versão e JSON {seed, tick_rate, overrides, checksum_interval}
+    INPUT       entradas omitidas, passos desde a entrada anterior, teclas que mudaram
+                (máscara XOR) e eventos
+    CHECKSUM    entradas omitidas, passos desde o checksum anterior e CRC32 do estado do jogo
+    END         entradas omitidas, passos desde o checksum anterior e CRC32 do estado final
+
+Todos os inteiros são varints. Uma entrada lida um passo após a anterior, sem
+teclas novas nem eventos, não é gravada: o registro seguinte informa apenas
+quantas foram omitidas, pois o gameplay reage a cada leitura (ex: a
+desaceleração da nave). A reprodução roda sem janela, o mais rápido
+possível, e confere os checksums; assim um pico de tempo relatado pode ser
+reproduzido exatamente:
+
+    python main.py --record partida.ifr
+    python -m core.replay partida.ifr --render
+"""
+import argparse
+import heapq
+import json
+import struct
+import time
+import zlib
+
+import pygame
+
+from core.input import HeldKeys
+from utils import settings
+
+
+MAGIC = b'IFMR'
+VERSION = 2
+INPUT, CHECKSUM, END = 1, 2, 3
+
+# Teclas lidas pelo gameplay (a posição na tupla é o bit na máscara das teclas pressionadas)
+KEYS = (pygame.K_LEFT, pygame.K_RIGHT, pygame.K_a, pygame.K_d, pygame.K_SPACE, pygame.K_p)
+QUIT_CODE = 0  # Códigos de eventos: 0 = QUIT, 1 + 2i = KEYDOWN de KEYS[i], 2 + 2i = KEYUP de KEYS[i]
+
+
+class ReplayDesync(RuntimeError):
+    """O estado reproduzido diverge do estado gravado."""
+
+
+def write_varint(buffer, value):
+    """Acrescenta um inteiro não negativo ao buffer, 7 bits por byte."""
+    while value >= 0x80:
+        buffer.append((value & 0x7f) | 0x80)
+        value >>= 7
+    buffer.append(value)
+
+
+def read_varint(file):
+    """Lê um varint do arquivo (None no fim do arquivo)."""
+    value = shift = 0
+    while True:
+        byte = file.read(1)
+        if not byte:
+            return None
+        value |= (byte[0] & 0x7f) << shift
+        if byte[0] < 0x80:
+            return value
+        shift += 7
+
+
+def key_mask(keys):
+    """Máscara de bits das teclas de KEYS pressionadas."""
+    mask = 0
+    for bit, key in enumerate(KEYS):
+        if keys[key]:
+            mask |= 1 << bit
+    return mask
+
+
+def event_code(event):
+    """Código do evento na gravação (None para eventos que o gameplay não lê)."""
+    if event.type == pygame.QUIT:
+        return QUIT_CODE
+    if event.type in (pygame.KEYDOWN, pygame.KEYUP) and event.key in KEYS:
+        return 1 + 2 * KEYS.index(event.key) + (event.type == pygame.KEYUP)
+    return None
+
+
+def code_event(code):
+    """Evento correspondente a um código da gravação."""
+    if code == QUIT_CODE:
+        return pygame.event.Event(pygame.QUIT)
+    key = KEYS[(code - 1) // 2]
+    return pygame.event.Event(pygame.KEYUP if (code - 1) % 2 else pygame.KEYDOWN, key=key)
+
+
+def state_checksum(game):
+    """CRC32 do estado da partida: tempo, HUD, nave, frota, tiros e entidades."""
+    state = game.playing_state
+    ship = game.ship
+    aliens = game.aliens
+    count = aliens.count
+    crc = zlib.crc32(struct.pack('<qqqqiidd??', game.ticks, state.score.score, state.lives.lives, state.level.lvl,
+                                 game.fleet_direction, ship.rect.x, ship.velocity, ship.speed,
+                                 game.paused, game.powerup_freeze))
+    for name in ('x', 'y', 'alive', 'spawning'):
+        crc = zlib.crc32(getattr(aliens, name)[:count].tobytes(), crc)
+    for bullet in game.bullets:
+        crc = zlib.crc32(struct.pack('<ii', bullet.rect.x, bullet.rect.y), crc)
+    for entity, rect in game.world.query('rect'):
+        crc = zlib.crc32(struct.pack('<qiiii', entity, *rect), crc)
+    return crc
+
+
+class ReplayRecorder:
+    """
+    Entrada que grava a partida enquanto repassa a entrada de outra fonte.
+
+    O gameplay vê apenas as teclas de KEYS pressionadas, exatamente como na
+    reprodução. O arquivo é escrito aos poucos; os checksums periódicos
+    também descarregam o buffer, então uma gravação interrompida continua
+    reproduzível até o último checksum.
+    """
+
+    def __init__(self, game, state, source, path, seed):
+        self.game = game
+        self.state = state  # Estado da partida gravada (a gravação termina quando ele deixa de ser o atual)
+        self.source = source
+        self.keys = HeldKeys()
+        self.mask = 0  # Máscara das teclas pressionadas na entrada anterior
+        self.input_tick = game.ticks  # Passo da entrada anterior
+        self.skipped = 0  # Entradas repetidas omitidas desde o último registro
+        self.checksum_tick = game.ticks  # Passo do checksum anterior
+        self.interval = game.config.REPLAY['checksum_interval']
+        self.file = open(path, 'wb')
+
+        header = json.dumps({'seed': seed, 'tick_rate': game.config.SCREEN['tick_rate'],
+                             'overrides': settings.OVERRIDES, 'checksum_interval': self.interval}).encode()
+        buffer = bytearray(MAGIC)
+        buffer.append(VERSION)
+        write_varint(buffer, len(header))
+        self.file.write(bytes(buffer) + header)
+
+    def poll(self):
+        """Lê a entrada da fonte e grava as teclas que mudaram e os eventos do gameplay."""
+        events = self.source.poll()
+        mask = key_mask(self.source.keys)
+        codes = [code for code in map(event_code, events) if code is not None]
+        ticks = self.game.ticks - self.input_tick
+        self.input_tick = self.game.ticks
+
+        if ticks == 1 and mask == self.mask and not codes:
+            self.skipped += 1  # Nada mudou desde o passo anterior: contada no próximo registro
+            return events
+
+        buffer = bytearray((INPUT,))
+        write_varint(buffer, self.skipped)
+        write_varint(buffer, ticks)
+        write_varint(buffer, mask ^ self.mask)
+        write_varint(buffer, len(codes))
+        for code in codes:
+            write_varint(buffer, code)
+        self.file.write(buffer)
+
+        self.skipped = 0
+        self.mask = mask
+        self.keys = HeldKeys(key for bit, key in enumerate(KEYS) if mask >> bit & 1)
+        return events
+
+    def write_checksum(self, kind):
+        """Grava o checksum do estado atual e descarrega o buffer do arquivo."""
+        buffer = bytearray((kind,))
+        write_varint(buffer, self.skipped)
+        write_varint(buffer, self.game.ticks - self.checksum_tick)
+        buffer += struct.pack('<I', state_checksum(self.game))
+        self.file.write(buffer)
+        self.file.flush()
+        self.skipped = 0
+        self.checksum_tick = self.game.ticks
+
+    def after_step(self):
+        """Chamado após cada passo de lógica: grava os checksums periódicos e encerra com a partida."""
+        if self.game.state_manager.state is not self.state:
+            self.close()  # Fim de jogo
+        elif self.game.ticks - self.checksum_tick >= self.interval:
+            self.write_checksum(CHECKSUM)
+
+    def close(self):
+        """Grava o estado final e fecha o arquivo."""
+        if not self.file.closed:
+            self.write_checksum(END)
+            self.file.close()
+
+
+class ReplayInput:
+    """Entrada lida de uma gravação (preenchida pelo ReplayPlayer)."""
+
+    def __init__(self):
+        self.keys = HeldKeys()
+        self.events = []
+
+    def poll(self):
+        """Retorna os eventos da entrada gravada."""
+        events, self.events = self.events, []
+        return events
+
+
+def read_header(file):
+    """Lê e valida o cabeçalho de uma gravação."""
+    if file.read(len(MAGIC)) != MAGIC:
+        raise ValueError("Arquivo não é uma gravação de partida")
+    version = file.read(1)[0]
+    if version != VERSION:
+        raise ValueError(f"Versão de gravação não suportada: {version}")
+    return json.loads(file.read(read_varint(file)))
+
+
+class ReplayPlayer:
+    """Reproduz uma gravação sem janela, conferindo os checksums e medindo o custo de cada quadro."""
+
+    def __init__(self, path, render=False):
+        from core.headless import HeadlessRunner  # core.game importa este módulo ao gravar
+
+        self.file = open(path, 'rb')
+        self.header = read_header(self.file)
+        settings.OVERRIDES.clear()
+        settings.OVERRIDES.update(self.header['overrides'])
+        settings.OVERRIDES['SCREEN.tick_rate'] = self.header['tick_rate']
+
+        self.runner = HeadlessRunner(seed=self.header['seed'], render=render)
+        self.game = self.runner.game
+        self.game.input = self.input = ReplayInput()
+        self.render = render
+        self.mask = 0  # Máscara das teclas pressionadas
+        self.frames = []  # (duração do quadro em ms, passo)
+        self.input_tick = 0  # Passo da entrada anterior (gravada ou omitida)
+        self.checksums = 0  # Checksums conferidos
+        self.complete = False  # A gravação terminou com o registro END
+
+    def advance(self, ticks):
+        """Executa a quantidade informada de passos de lógica, medindo cada um como um quadro."""
+        for _ in range(ticks):
+            start = time.perf_counter()
+            self.game.step()
+            if self.render:
+                self.game.state_manager.render(self.game.screen)
+            self.frames.append(((time.perf_counter() - start) * 1000, self.game.ticks))
+
+    def replay_skipped(self, count):
+        """Repete as entradas omitidas na gravação: um passo depois da anterior, sem mudanças."""
+        for _ in range(count):
+            self.input_tick += 1
+            self.advance(self.input_tick - self.game.ticks)
+            self.game.state_manager.handle_events()
+
+    def verify(self):
+        """Confere o checksum gravado com o estado reproduzido."""
+        expected = struct.unpack('<I', self.file.read(4))[0]
+        if state_checksum(self.game) != expected:
+            raise ReplayDesync(f"Estado divergente no passo {self.game.ticks}")
+        self.checksums += 1
+
+    def run(self):
+        """Reproduz a gravação inteira e retorna o resultado."""
+        file = self.file
+        start = time.perf_counter()
+        checksum_tick = 0  # Os passos gravados são relativos ao registro anterior do mesmo tipo
+        while True:
+            kind = file.read(1)
+            if not kind:
+                break  # Gravação interrompida: reproduz até o último registro completo
+            kind = kind[0]
+            self.replay_skipped(read_varint(file))
+            if kind == INPUT:
+                self.input_tick += read_varint(file)
+                self.advance(self.input_tick - self.game.ticks)
+
+                self.mask ^= read_varint(file)
+                self.input.keys = HeldKeys(key for bit, key in enumerate(KEYS) if self.mask >> bit & 1)
+                self.input.events = [code_event(read_varint(file)) for _ in range(read_varint(file))]
+                self.game.state_manager.handle_events()
+            else:
+                checksum_tick += read_varint(file)
+                self.advance(checksum_tick - self.game.ticks)
+                self.verify()
+                if kind == END:
+                    self.complete = True
+                    break
+        self.runner.elapsed = time.perf_counter() - start
+        file.close()
+        return self.result()
+
+    def slowest(self, count=5):
+        """Passos mais lentos da reprodução: (duração em ms, passo)."""
+        return heapq.nlargest(count, self.frames)
+
+    def result(self):
+        """Resumo da partida reproduzida."""
+        return {**self.runner.result(), 'checksums': self.checksums, 'complete': self.complete}
+
+
+def main(argv=None):
+    """Reproduz uma gravação e mostra o resultado e os quadros mais lentos."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (reprodução de partidas)")
+    parser.add_argument('path', help="arquivo gravado com --record")
+    parser.add_argument('--render', action='store_true', help="renderiza cada quadro (inclui o desenho no custo dos quadros)")
+    parser.add_argument('--slowest', type=int, default=5, help="quantidade de quadros mais lentos a mostrar")
+    args = parser.parse_args(argv)
+
+    player = ReplayPlayer(args.path, render=args.render)
+    result = player.run()
+    for name, value in result.items():
+        print(f"{name:<18}{value}")
+    for ms, tick in player.slowest(args.slowest):
+        print(f"passo {tick:<10}{ms:.3f} ms")
+
+
+if __name__ == '__main__':
+    main()
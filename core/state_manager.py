@@ -21,7 +21,8 @@ class StateManager:
             self.state.update()
 
     def render(self, screen):
-        """Renderiza o estado atual na tela"""
+        """Renderiza o estado atual e retorna as áreas alteradas (None para a tela inteira)"""
         if self.state:
-            self.state.render(screen)
+            return self.state.render(screen)
+        return None
             
\ No newline at end of file
@@ -0,0 +1,145 @@
+"""
+Módulo de varreduras de parâmetros das configurações.
+
+Executa muitas partidas sem janela (ver core/headless.py), cada uma com um
+conjunto de substituições das configurações (ver OVERRIDES em utils/settings.py),
+distribuídas entre os núcleos da CPU. Cada partida tem uma semente fixa, então
+o mesmo comando sempre produz os mesmos resultados. Os resultados são gravados
+em um CSV, uma linha por partida, à medida que as partidas terminam.
+
+Grade com todas as combinações dos valores:
+
+    python -m core.sweep --set ALIEN.speedup_scale=.1,.2,.3 --set POWERUP.drop_chance=5,10 --repeats 20
+
+Amostra aleatória de intervalos (inteiros se os dois limites forem inteiros):
+
+    python -m core.sweep --set ALIEN.speedup_scale=.1:.5 --set SHIP_BULLET.allowed=1:6 --samples 500
+"""
+import argparse
+import ast
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+
+COLUMNS = ['session', 'seed', 'level', 'score', 'lives', 'game_over', 'ticks', 'seconds_alive',
+           'frame_ms_mean', 'frame_ms_max']
+
+
+def parse_value(text):
+    """Converte um valor da linha de comando (número, lista, etc.), mantendo como texto se não for um literal."""
+    try:
+        return ast.literal_eval(text)
+    except (ValueError, SyntaxError):
+        return text
+
+
+def parse_assignments(assignments):
+    """Converte 'SEÇÃO.chave=valores' em {'SEÇÃO.chave': valores}."""
+    parsed = {}
+    for assignment in assignments:
+        name, separator, values = assignment.partition('=')
+        if not separator:
+            raise ValueError(f"Substituição inválida (use SEÇÃO.chave=valores): {assignment}")
+        parsed[name] = values
+    return parsed
+
+
+def grid(assignments):
+    """Todas as combinações dos valores separados por vírgula."""
+    names = list(assignments)
+    values = [[parse_value(value) for value in assignments[name].split(',')] for name in names]
+    return [dict(zip(names, combination)) for combination in itertools.product(*values)]
+
+
+def sample(assignments, count, rng):
+    """Sorteia count conjuntos de valores nos intervalos 'mínimo:máximo' (ou entre valores separados por vírgula)."""
+    choices = {}
+    for name, values in assignments.items():
+        if ':' in values:
+            low, high = (parse_value(value) for value in values.split(':', 1))
+            if isinstance(low, int) and isinstance(high, int):
+                choices[name] = lambda low=low, high=high: rng.randint(low, high)
+            else:
+                choices[name] = lambda low=low, high=high: round(rng.uniform(low, high), 4)
+        else:
+            options = [parse_value(value) for value in values.split(',')]
+            choices[name] = lambda options=options: rng.choice(options)
+    return [{name: choose() for name, choose in choices.items()} for _ in range(count)]
+
+
+def run_session(session, overrides, seed, max_ticks):
+    """Executa uma partida sem janela com o piloto automático e retorna uma linha de resultado."""
+    from utils import settings
+    from core.headless import HeadlessRunner, autopilot
+
+    settings.OVERRIDES.clear()
+    settings.OVERRIDES.update(overrides)
+
+    runner = HeadlessRunner(controller=autopilot, seed=seed)
+    frame_max = 0.0
+    start = time.perf_counter()
+    while runner.playing and runner.game.ticks < max_ticks:
+        step_start = time.perf_counter()
+        runner.step()
+        frame_max = max(frame_max, time.perf_counter() - step_start)
+    runner.elapsed = time.perf_counter() - start
+
+    result = runner.result()
+    ticks = result['ticks']
+    return {
+        'session': session,
+        'seed': seed,
+        **overrides,
+        'level': result['level'],
+        'score': result['score'],
+        'lives': result['lives'],
+        'game_over': result['game_over'],
+        'ticks': ticks,
+        'seconds_alive': result['simulated_seconds'],
+        'frame_ms_mean': round(runner.elapsed * 1000 / ticks, 4) if ticks else 0.0,
+        'frame_ms_max': round(frame_max * 1000, 4),
+    }
+
+
+def main(argv=None):
+    """Distribui as partidas da varredura entre os processos e grava os resultados no CSV."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (varredura de parâmetros)")
+    parser.add_argument('--set', action='append', default=[], metavar='SEÇÃO.chave=valores',
+                        help="valores separados por vírgula (grade) ou intervalo mínimo:máximo (com --samples)")
+    parser.add_argument('--samples', type=int, default=0, help="sorteia N conjuntos de valores em vez da grade")
+    parser.add_argument('--repeats', type=int, default=1, help="partidas por conjunto de valores")
+    parser.add_argument('--ticks', type=int, default=36000, help="máximo de passos de lógica por partida")
+    parser.add_argument('--seed', type=int, default=0, help="semente base (a partida i usa seed + i)")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(), help="processos em paralelo")
+    parser.add_argument('--out', default='sweep.csv', help="arquivo CSV de saída")
+    args = parser.parse_args(argv)
+
+    assignments = parse_assignments(args.set)
+    if args.samples:
+        combinations = sample(assignments, args.samples, random.Random(args.seed))
+    else:
+        combinations = grid(assignments)
+    sessions = [overrides for overrides in combinations for _ in range(args.repeats)]
+
+    columns = COLUMNS[:2] + list(assignments) + COLUMNS[2:]
+    start = time.perf_counter()
+    with open(args.out, 'w', newline='') as file, ProcessPoolExecutor(args.workers) as executor:
+        writer = csv.DictWriter(file, columns)
+        writer.writeheader()
+        futures = [executor.submit(run_session, index, overrides, args.seed + index, args.ticks)
+                   for index, overrides in enumerate(sessions)]
+        for done, future in enumerate(as_completed(futures), 1):
+            writer.writerow(future.result())
+            file.flush()  # Resultados parciais ficam disponíveis durante a varredura
+            print(f"\r{done}/{len(sessions)} partidas", end='', file=sys.stderr)
+
+    print(f"\n{len(sessions)} partidas em {time.perf_counter() - start:.1f} s -> {args.out}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,394 @@
+"""
+Módulo do ambiente vetorizado para o treino de jogadores automáticos.
+
+O VecEnv executa N partidas independentes sem janela (ver core/headless.py)
+em passo único: a cada step() todas recebem uma ação, avançam um passo de
+lógica e escrevem sua observação em arrays NumPy alocados uma única vez.
+As partidas podem rodar no próprio processo ou divididas entre processos;
+nesse caso os arrays ficam em memória compartilhada e apenas um comando
+curto passa pelo pipe de cada processo a cada passo.
+
+Observações:
+
+    'state'  vetor (N, STATE_SIZE): nave, frota, tiros e power-ups, em coordenadas normalizadas
+    'frame'  imagem (N, altura, largura, 3) reduzida a partir dos pixels da tela, sem cópia intermediária
+
+Medição da vazão com ações aleatórias:
+
+    python -m core.vec_env --envs 8 --workers 4 --steps 5000
+"""
+import argparse
+import multiprocessing
+import os
+import time
+from multiprocessing import shared_memory
+
+import numpy as np
+import pygame
+
+from core.headless import HeadlessRunner
+from core.input import HeldKeys
+from core.playing_state import PlayingState
+from utils.settings import Settings
+
+
+# Ações: teclas pressionadas em cada uma (o tiro acontece quando o espaço passa a ser pressionado)
+ACTIONS = (
+    HeldKeys(),                                # 0: nada
+    HeldKeys((pygame.K_LEFT,)),                # 1: esquerda
+    HeldKeys((pygame.K_RIGHT,)),               # 2: direita
+    HeldKeys((pygame.K_SPACE,)),               # 3: atira
+    HeldKeys((pygame.K_LEFT, pygame.K_SPACE)),  # 4: esquerda e atira
+    HeldKeys((pygame.K_RIGHT, pygame.K_SPACE)),  # 5: direita e atira
+)
+POWERUP_TYPES = ('speed', 'shield', 'double_shoot')
+
+# Formato do vetor de estado
+MAX_ALIENS = 64
+MAX_BULLETS = 16
+MAX_POWERUPS = 8
+HEADER_SIZE = 5 + len(POWERUP_TYPES)  # Nave (x, velocidade), direção da frota, nível, vidas e power-ups ativos
+STATE_SIZE = HEADER_SIZE + MAX_ALIENS * 3 + MAX_BULLETS * 3 + MAX_POWERUPS * 3
+
+
+class ActionInput:
+    """Entrada do gameplay controlada pela ação do passo (sem alocar eventos)."""
+
+    FIRE = [pygame.event.Event(pygame.KEYDOWN, key=pygame.K_SPACE)]
+    NONE = []
+
+    def __init__(self):
+        self.action = 0
+        self.keys = ACTIONS[0]
+
+    def poll(self):
+        """Aplica a ação atual: teclas pressionadas e o disparo ao pressionar o espaço."""
+        keys = ACTIONS[self.action]
+        fire = pygame.K_SPACE in keys and pygame.K_SPACE not in self.keys
+        self.keys = keys
+        return self.FIRE if fire else self.NONE
+
+
+class GameEnv:
+    """
+    Uma partida sem janela que escreve sua observação em uma linha dos arrays do VecEnv.
+
+    :param observation: Linha do array de observações (vetor de estado ou imagem).
+    :param frame_scale: Redução da imagem em cada eixo (apenas para as observações 'frame').
+    :param max_ticks: Passos por partida antes de reiniciar (0 para jogar até o fim de jogo).
+    """
+
+    def __init__(self, observation, seed, frame_scale=None, max_ticks=0):
+        self.runner = HeadlessRunner(seed=seed, render=frame_scale is not None)
+        self.game = self.runner.game
+        self.game.input = self.input = ActionInput()
+        self.seed = seed
+        self.episodes = 0
+        self.frame_scale = frame_scale
+        self.max_ticks = max_ticks
+        self.observation = observation
+        self.score = 0
+
+        if frame_scale is None:
+            # Visões fixas de cada parte do vetor de estado
+            self.header = observation[:HEADER_SIZE]
+            offset = HEADER_SIZE
+            self.aliens = observation[offset:offset + MAX_ALIENS * 3].reshape(MAX_ALIENS, 3)
+            offset += MAX_ALIENS * 3
+            self.bullets = observation[offset:offset + MAX_BULLETS * 3].reshape(MAX_BULLETS, 3)
+            offset += MAX_BULLETS * 3
+            self.powerups = observation[offset:].reshape(MAX_POWERUPS, 3)
+            width, height = self.game.screen.get_size()
+            self.scale_x, self.scale_y = 1 / width, 1 / height
+
+    @property
+    def state(self):
+        return self.runner.state
+
+    def reset(self):
+        """Começa uma nova partida (com uma semente diferente a cada partida) e escreve a observação."""
+        self.episodes += 1
+        self.game.seed = self.seed + self.episodes * 1000003
+        self.runner.state = PlayingState(self.game)
+        self.game.state_manager.set_state(self.runner.state)
+        self.input.keys = ACTIONS[0]
+        self.score = 0
+        self.observe()
+
+    def step(self, action):
+        """Executa um passo com a ação informada; retorna a recompensa (pontos ganhos) e se a partida terminou."""
+        self.input.action = action
+        self.runner.step()
+        score = self.state.score.score
+        reward = score - self.score
+        self.score = score
+        if not self.runner.playing or (self.max_ticks and self.game.ticks >= self.max_ticks):
+            self.reset()  # Reinício automático: a observação já é a da nova partida
+            return reward, True
+        self.observe()
+        return reward, False
+
+    def observe(self):
+        """Escreve a observação atual na linha do array."""
+        if self.frame_scale is None:
+            self.observe_state()
+        else:
+            self.observe_frame()
+
+    def observe_frame(self):
+        """Renderiza a tela e copia os pixels reduzidos para a observação (sem cópia da tela inteira)."""
+        self.game.state_manager.render(self.game.screen)
+        pixels = pygame.surfarray.pixels3d(self.game.screen)  # Visão dos pixels (largura, altura, 3)
+        scale = self.frame_scale
+        np.copyto(self.observation, pixels[::scale, ::scale].transpose(1, 0, 2))
+        del pixels  # Libera a trava da tela antes da próxima renderização
+
+    def observe_state(self):
+        """Escreve o vetor de estado: nave, frota, tiros e power-ups."""
+        game = self.game
+        state = self.state
+        scale_x, scale_y = self.scale_x, self.scale_y
+
+        header = self.header
+        header[0] = game.ship.rect.centerx * scale_x
+        header[1] = game.ship.velocity
+        header[2] = game.fleet_direction
+        header[3] = state.level.lvl
+        header[4] = state.lives.lives
+        active = game.powerup_manager.active_powerups
+        for position, powerup_type in enumerate(POWERUP_TYPES, 5):
+            header[position] = powerup_type in active
+
+        # Frota: posições normalizadas e se cada alienigena está vivo
+        fleet = game.aliens
+        count = min(fleet.count, MAX_ALIENS)
+        aliens = self.aliens
+        np.multiply(fleet.x[:count], scale_x, out=aliens[:count, 0])
+        np.multiply(fleet.y[:count], scale_y, out=aliens[:count, 1])
+        aliens[:count, 2] = fleet.alive[:count]
+        aliens[count:] = 0
+
+        bullets = self.bullets
+        count = 0
+        for bullet in game.bullets:
+            if count == MAX_BULLETS:
+                break
+            bullets[count, 0] = bullet.rect.centerx * scale_x
+            bullets[count, 1] = bullet.rect.centery * scale_y
+            bullets[count, 2] = 1
+            count += 1
+        bullets[count:] = 0
+
+        # Power-ups caindo: posição e tipo (1, 2 ou 3)
+        powerups = self.powerups
+        count = 0
+        for entity, powerup, rect in game.world.query('powerup', 'rect'):
+            if count == MAX_POWERUPS:
+                break
+            powerups[count, 0] = rect.centerx * scale_x
+            powerups[count, 1] = rect.centery * scale_y
+            powerups[count, 2] = POWERUP_TYPES.index(powerup.type) + 1
+            count += 1
+        powerups[count:] = 0
+
+
+def observation_shape(observation, frame_scale):
+    """Formato da observação de uma partida."""
+    if observation == 'state':
+        return (STATE_SIZE,), np.float32
+    if observation == 'frame':
+        screen = Settings().SCREEN
+        width, height = -(-screen['width'] // frame_scale), -(-screen['height'] // frame_scale)  # Arredonda para cima, como o fatiamento
+        return (height, width, 3), np.uint8
+    raise ValueError(f"Observação desconhecida: {observation}")
+
+
+class SharedArrays:
+    """Arrays do VecEnv em memória compartilhada, acessíveis pelos processos das partidas."""
+
+    def __init__(self, specs, names=None):
+        """
+        :param specs: Dicionário {nome: (formato, dtype)}.
+        :param names: Nomes dos blocos de memória já criados (None para criá-los).
+        """
+        self.owner = names is None
+        self.blocks = {}
+        self.arrays = {}
+        for name, (shape, dtype) in specs.items():
+            size = max(1, int(np.prod(shape)) * np.dtype(dtype).itemsize)
+            if self.owner:
+                block = shared_memory.SharedMemory(create=True, size=size)
+            else:
+                block = shared_memory.SharedMemory(name=names[name])
+            self.blocks[name] = block
+            self.arrays[name] = np.ndarray(shape, dtype=dtype, buffer=block.buf)
+
+    @property
+    def names(self):
+        return {name: block.name for name, block in self.blocks.items()}
+
+    def close(self):
+        """Libera os blocos (e os remove, no processo que os criou)."""
+        self.arrays.clear()
+        for block in self.blocks.values():
+            block.close()
+            if self.owner:
+                block.unlink()
+
+
+def shard_worker(connection, specs, names, start, stop, options):
+    """Processo de um grupo de partidas: executa os comandos do VecEnv sobre os arrays compartilhados."""
+    shared = SharedArrays(specs, names)
+    arrays = shared.arrays
+    envs = [GameEnv(arrays['observations'][index], seed=options['seed'] + index,
+                    frame_scale=options['frame_scale'], max_ticks=options['max_ticks'])
+            for index in range(start, stop)]
+    actions, rewards, dones = arrays['actions'], arrays['rewards'], arrays['dones']
+    connection.send(True)
+    try:
+        while True:
+            command = connection.recv()
+            if command == 'step':
+                for index, env in enumerate(envs, start):
+                    rewards[index], dones[index] = env.step(actions[index])
+            elif command == 'reset':
+                for env in envs:
+                    env.reset()
+            elif command == 'close':
+                break
+            connection.send(True)
+    finally:
+        del envs, actions, rewards, dones, arrays
+        shared.close()
+        pygame.quit()
+
+
+class VecEnv:
+    """
+    N partidas sem janela executadas em passo único, com observações em arrays pré-alocados.
+
+    :param num_envs: Quantidade de partidas.
+    :param observation: 'state' (vetor de estado) ou 'frame' (imagem reduzida).
+    :param workers: Processos entre os quais as partidas são divididas (0 para o próprio processo).
+    :param seed: Semente base (a partida i usa seed + i).
+    :param frame_scale: Redução da imagem em cada eixo (observações 'frame').
+    :param max_ticks: Passos por partida antes de reiniciar (0 para jogar até o fim de jogo).
+
+    step() retorna os próprios arrays (observações, recompensas, fins de partida),
+    reescritos a cada passo; partidas terminadas reiniciam automaticamente.
+    """
+
+    def __init__(self, num_envs, observation='state', workers=0, seed=0, frame_scale=4, max_ticks=0):
+        self.num_envs = num_envs
+        shape, dtype = observation_shape(observation, frame_scale)
+        specs = {
+            'observations': ((num_envs, *shape), dtype),
+            'actions': ((num_envs,), np.int64),
+            'rewards': ((num_envs,), np.float32),
+            'dones': ((num_envs,), np.bool_),
+        }
+        options = {'seed': seed, 'frame_scale': frame_scale if observation == 'frame' else None,
+                   'max_ticks': max_ticks}
+        self.workers = min(workers, num_envs)
+        self.connections = []
+        self.processes = []
+
+        if not self.workers:
+            self.shared = None
+            arrays = {name: np.zeros(*spec) for name, spec in specs.items()}
+            self.envs = [GameEnv(arrays['observations'][index], seed=seed + index,
+                                 frame_scale=options['frame_scale'], max_ticks=max_ticks)
+                         for index in range(num_envs)]
+        else:
+            self.shared = SharedArrays(specs)
+            arrays = self.shared.arrays
+            self.envs = []
+            bounds = np.linspace(0, num_envs, self.workers + 1).astype(int)
+            for start, stop in zip(bounds[:-1], bounds[1:]):
+                parent, child = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=shard_worker, daemon=True,
+                                                  args=(child, specs, self.shared.names, start, stop, options))
+                process.start()
+                self.connections.append(parent)
+                self.processes.append(process)
+            for connection in self.connections:
+                connection.recv()  # Aguarda a criação das partidas
+
+        self.observations = arrays['observations']
+        self.actions = arrays['actions']
+        self.rewards = arrays['rewards']
+        self.dones = arrays['dones']
+
+    def broadcast(self, command):
+        """Envia um comando a todos os processos e aguarda a conclusão."""
+        for connection in self.connections:
+            connection.send(command)
+        for connection in self.connections:
+            connection.recv()
+
+    def reset(self):
+        """Reinicia todas as partidas e retorna as observações."""
+        if self.workers:
+            self.broadcast('reset')
+        else:
+            for env in self.envs:
+                env.reset()
+        return self.observations
+
+    def step(self, actions):
+        """Aplica uma ação em cada partida e avança todas um passo."""
+        self.actions[:] = actions
+        if self.workers:
+            self.broadcast('step')
+        else:
+            rewards, dones = self.rewards, self.dones
+            for index, env in enumerate(self.envs):
+                rewards[index], dones[index] = env.step(self.actions[index])
+        return self.observations, self.rewards, self.dones
+
+    def close(self):
+        """Encerra os processos e libera a memória compartilhada."""
+        if self.workers:
+            for connection in self.connections:
+                connection.send('close')
+            for process in self.processes:
+                process.join()
+            self.connections.clear()
+            self.processes.clear()
+            self.observations = self.actions = self.rewards = self.dones = None
+            self.shared.close()
+            self.workers = 0
+
+
+def main(argv=None):
+    """Mede a vazão do ambiente vetorizado (passos de partida por segundo) com ações aleatórias."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (ambiente vetorizado)")
+    parser.add_argument('--envs', type=int, default=8, help="quantidade de partidas")
+    parser.add_argument('--workers', type=int, default=0, help="processos (0 para o próprio processo)")
+    parser.add_argument('--steps', type=int, default=5000, help="passos medidos")
+    parser.add_argument('--frame', action='store_true', help="observações como imagem reduzida")
+    parser.add_argument('--seed', type=int, default=0, help="semente base")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    env = VecEnv(args.envs, 'frame' if args.frame else 'state', workers=args.workers, seed=args.seed)
+    actions = np.random.default_rng(args.seed).integers(0, len(ACTIONS), size=(args.steps, args.envs))
+    env.reset()
+
+    episodes = 0
+    start = time.perf_counter()
+    for step_actions in actions:
+        observations, rewards, dones = env.step(step_actions)
+        episodes += int(dones.sum())
+    elapsed = time.perf_counter() - start
+    env.close()
+
+    print(f"{'env_steps':<18}{args.steps * args.envs}")
+    print(f"{'elapsed_seconds':<18}{elapsed:.3f}")
+    print(f"{'env_steps_per_sec':<18}{args.steps * args.envs / elapsed:.1f}")
+    print(f"{'episodes':<18}{episodes}")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,4 +1,4 @@
-import pygame
+from graphics.assets import assets
 
 class GameBackground:
     """Anima camadas de estrelas para criar um efeito de profundidade no fundo do jogo"""
@@ -8,24 +8,34 @@ class GameBackground:
         self.screen_width = self.game.config.SCREEN["width"]
         self.screen_height = self.game.config.SCREEN["height"]
 
-        # Carregar imagens das camadas
+        # Obtém as imagens das camadas já no tamanho da tela
+        size = (self.screen_width, self.screen_height)
         self.layers = [
-            {"image": pygame.image.load("graphics/backgrounds/space_bg.png").convert(), "speed": 0.5, "y": 0},  # Fundo móvel
-            {"image": pygame.image.load("graphics/backgrounds/stars_far.png").convert_alpha(), "speed": 0.3, "y": 0},
-            {"image": pygame.image.load("graphics/backgrounds/stars_mid.png").convert_alpha(), "speed": 0.6, "y": 0},
-            {"image": pygame.image.load("graphics/backgrounds/stars_near.png").convert_alpha(), "speed": 1.2, "y": 0},
+            {"image": assets.image("graphics/backgrounds/space_bg.png", size, alpha=False), "speed": 0.5, "y": 0},  # Fundo móvel
+            {"image": assets.image("graphics/backgrounds/stars_far.png", size), "speed": 0.3, "y": 0},
+            {"image": assets.image("graphics/backgrounds/stars_mid.png", size), "speed": 0.6, "y": 0},
+            {"image": assets.image("graphics/backgrounds/stars_near.png", size), "speed": 1.2, "y": 0},
         ]
 
-        # Ajustar tamanho das imagens para cobrir a tela
         for layer in self.layers:
-            layer["image"] = pygame.transform.scale(layer["image"], (self.screen_width, self.screen_height))
             layer["y2"] = -self.screen_height  # Adiciona uma segunda posição para garantir o loop
 
+        self.scroll = not self.game.config.RENDER['static_background'] # Fundo parado em máquinas modestas
+        self.version = 0  # Incrementado sempre que o fundo se move
+        self.moved = False  # Indica se as camadas se moveram na última atualização (para interpolar)
+
+    def save_positions(self):
+        """Marca o início de uma atualização: sem movimento, não há o que interpolar"""
+        self.moved = False
+
     def update(self):
         """Atualiza a posição das camadas para criar o efeito de movimento contínuo"""
-        if self.game.paused or self.game.powerup_freeze:
-            return  # Se estiver pausado ou em paralisação, não move o fundo
-    
+        if self.game.paused or self.game.powerup_freeze or not self.scroll:
+            return  # Se estiver pausado, em paralisação ou com o fundo fixo, não move o fundo
+
+        self.version += 1
+        self.moved = True
+
         for layer in self.layers:
             if layer["speed"] > 0:  # Apenas move camadas que devem se deslocar
                 layer["y"] += layer["speed"]
@@ -38,8 +48,16 @@ class GameBackground:
                 if layer["y2"] >= self.screen_height:
                     layer["y2"] = layer["y"] - self.screen_height
 
-    def render(self, screen):
-        """Renderiza as camadas na tela, garantindo um loop contínuo"""
+    def render(self, screen, alpha=1.0):
+        """Renderiza as camadas na tela, garantindo um loop contínuo (alpha interpola o último movimento)"""
+        if not self.moved or alpha >= 1:
+            for layer in self.layers:
+                screen.blit(layer["image"], (0, layer["y"]))  
+                screen.blit(layer["image"], (0, layer["y2"]))  # Segunda posição para continuidade
+            return
+
         for layer in self.layers:
-            screen.blit(layer["image"], (0, layer["y"]))  
-            screen.blit(layer["image"], (0, layer["y2"]))  # Segunda posição para continuidade
+            # As duas posições estão sempre a uma altura de tela de distância
+            y = (layer["y"] - layer["speed"] * (1 - alpha)) % self.screen_height
+            screen.blit(layer["image"], (0, y))
+            screen.blit(layer["image"], (0, y - self.screen_height))
@@ -3,61 +3,110 @@ import pygame
 from utils.settings import Settings
 
 
-class ShipBullet:
-    """Classe que representa os projéteis disparados pela nave."""
+class Bullet:
+    """Projétil disparado pela nave (uma posição reaproveitada do BulletPool)."""
 
-    def __init__(self, game, x, y, color=None):
-        self.game = game
-        self.config = Settings()
-
-        self.image = pygame.Surface((5, 15)) # Criamos um retângulo como tiro
-
-        # Define a cor dos projéteis
-        if color:
-            self.color = color
-        else:
-            self.color = self.config.SHIP_BULLET['color']
-
-        self.image.fill(self.color) # Cor do projetil
+    __slots__ = ('rect', 'previous_y', 'sprite', 'index')
 
-        self.rect = self.image.get_rect(midbottom=(x, y)) # Posição inicial
-        self.speed = 7 # Velocidade do tiro
+    def __init__(self, index, size):
+        self.rect = pygame.Rect((0, 0), size)
+        self.previous_y = 0 # Posição na atualização anterior (para interpolar a renderização)
+        self.sprite = None # Sprite compartilhada da cor do tiro
+        self.index = index # Posição atual no pool
 
-    def update(self):
-        """Move o tiro para cima"""
-        self.rect.y -= self.speed
-
-        # Se o tiro sair da tela, remove ele da lista
-        if self.rect.bottom < 0:
-            self.game.bullets.remove(self)
+    def draw_rect(self, alpha=1.0):
+        """Retângulo do tiro interpolado entre as duas últimas atualizações"""
+        return self.rect.move(0, round((self.previous_y - self.rect.y) * (1 - alpha)))
 
-    def render(self, screen):
-        """Desenha o tiro na tela"""
-        pygame.draw.ellipse(screen, self.config.SHIP_BULLET['color'], self.rect)
 
+class BulletPool:
+    """
+    Conjunto pré-alocado dos projéteis da nave.
 
-class DoubleBullet:
-    """Projéteis duplos disparados pela nave quando o power-up de Double Shoot está ativo."""
+    Os tiros ativos ocupam as primeiras posições da lista; um tiro removido
+    troca de lugar com o último ativo, então disparar e remover tiros não
+    cria objetos novos. Cada cor tem uma única sprite pré-renderizada.
+    """
 
-    def __init__(self, game, left_xy, right_xy, color=None):
-        self.game = game
+    def __init__(self, capacity=None, size=(5, 15), speed=7):
         self.config = Settings()
-
-        # Define a cor dos projéteis
-        if color:
-            self.color = color
-        else:
-            self.color = self.config.DOUBLE_BULLET['color']
-
-        self.left_bullet = ShipBullet(self.game, left_xy[0], left_xy[1], color=self.color)
-        self.right_bullet = ShipBullet(self.game, right_xy[0], right_xy[1], color=self.color)
+        capacity = capacity or self.config.DOUBLE_BULLET['allowed'] + 2 # O tiro duplo pode passar do limite em um
+        self.size = size
+        self.speed = speed # Velocidade dos tiros
+        self.slots = [Bullet(index, size) for index in range(capacity)]
+        self.count = 0 # Quantidade de tiros ativos
+        self.sprites = {} # Sprites pré-renderizadas, por cor
+
+    def sprite(self, color):
+        """Retorna a sprite do tiro na cor informada, renderizando-a apenas uma vez"""
+        color = tuple(color)
+        sprite = self.sprites.get(color)
+        if sprite is None:
+            sprite = pygame.Surface(self.size, pygame.SRCALPHA)
+            pygame.draw.ellipse(sprite, color, sprite.get_rect())
+            self.sprites[color] = sprite
+        return sprite
+
+    def fire(self, x, y, color=None):
+        """Ativa um tiro com a base centralizada em (x, y)"""
+        if self.count == len(self.slots):
+            self.slots.append(Bullet(self.count, self.size)) # Pool cheio: cresce (raro)
+
+        bullet = self.slots[self.count]
+        bullet.rect.midbottom = (x, y)
+        bullet.previous_y = bullet.rect.y
+        bullet.sprite = self.sprite(color or self.config.SHIP_BULLET['color'])
+        self.count += 1
+        return bullet
+
+    def remove(self, bullet):
+        """Desativa um tiro, trocando-o de lugar com o último tiro ativo"""
+        index = bullet.index
+        if index >= self.count or self.slots[index] is not bullet:
+            return # Tiro já removido
+        last = self.count - 1
+        other = self.slots[last]
+        self.slots[index], self.slots[last] = other, bullet
+        other.index, bullet.index = index, last
+        self.count = last
+
+    def clear(self):
+        """Desativa todos os tiros"""
+        self.count = 0
+
+    def save_positions(self):
+        """Guarda as posições atuais, usadas para interpolar a renderização"""
+        slots = self.slots
+        for index in range(self.count):
+            slots[index].previous_y = slots[index].rect.y
 
     def update(self):
-        """Move os tiros duplos para cima."""
-        self.left_bullet.update()
-        self.right_bullet.update()
-
-    def render(self, screen):
-        """Desenha o tiro na tela."""
-        self.left_bullet.render(screen)
-        self.right_bullet.render(screen)
+        """Move todos os tiros para cima, removendo os que saíram da tela"""
+        speed = self.speed
+        slots = self.slots
+        # Percorre do fim para o início, pois a remoção traz o último tiro para a posição atual
+        for index in range(self.count - 1, -1, -1):
+            rect = slots[index].rect
+            rect.y -= speed
+            if rect.bottom < 0:
+                self.remove(slots[index])
+
+    def rects(self, alpha=1.0):
+        """Retângulos dos tiros na posição em que são desenhados"""
+        slots = self.slots
+        return [slots[index].draw_rect(alpha) for index in range(self.count)]
+
+    def draw_list(self, alpha=1.0):
+        """Sprites e posições dos tiros, interpolando suas posições"""
+        slots = self.slots
+        return [(slots[index].sprite, slots[index].draw_rect(alpha)) for index in range(self.count)]
+
+    def render(self, screen, alpha=1.0):
+        """Desenha todos os tiros em um único lote de blits"""
+        screen.blits(self.draw_list(alpha), doreturn=False)
+
+    def __len__(self):
+        return self.count
+
+    def __iter__(self):
+        return iter(self.slots[:self.count])
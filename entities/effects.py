@@ -2,65 +2,56 @@
 """ Um módulo para armazenar efeitos do jogo.
 
 """
+import itertools
+
 import pygame
 
 from utils.settings import Settings
 from utils.audio_manager import audio_manager
+from graphics.assets import assets
+from graphics.circles import circles
+from graphics.text import text_renderer
 
 
-class ScoreUpEffect:
-    """Classe para criar uma exibição de pontuação"""
-    
-    def __init__(self, game, x, y):
-        self.game = game
-        self.config = Settings()
-        # Configurações da pontuação
-        self.font = pygame.font.Font(*self.config.SCOREUP['font'])
-        self.text = self.font.render("+" + str(self.config.ALIEN['points']),
-                                       True, self.config.SCOREUP['color'])
-        self.rect = self.text.get_rect()
-        self.rect.center = (x, y)
-        
-    def update(self):
-        """Atualiza a animação dos pontos"""
-        if self.text.get_alpha() == 0:
-            self.game.scoreups.remove(self)
-        self.rect.y -= int(self.config.SCOREUP['speed'])
-        self.text.set_alpha(self.text.get_alpha() - 15)
-    
-    def render(self, screen):
-        """Exibe a animação na tela """
-        screen.blit(self.text, self.rect)
-        
-        
-class AlienExplosionEffect:
-    """Uma explosão ao destruir um alienigena"""
-    
-    def __init__(self, game, x, y):
-        self.game = game
-        # Configurações da explosão
-        self.explosion_color = (200, 200, 60)
-        self.image = pygame.Surface((60, 60)) 
-        self.image.set_colorkey((0, 0, 0))
-        self.rect = self.image.get_rect()
-        self.rect.center = (x, y)
-        self.alpha = 255
-        self.explosion_rect = (0, 0, 60, 60)
-        audio_manager.play_sound("explosion") # Executa o som da explosão
-        
-    def update(self):
-        """Atualiza a animação da explosão"""
-        if self.alpha <= 0 :
-            self.game.explosions.remove(self) # Remove o disparo da lista de tiros
-        self.alpha -= 60
-        self.image.set_alpha(self.alpha)
-        
-    def render(self, screen):
-        """Rebderiza a explosão"""
-        pygame.draw.ellipse(self.image, self.explosion_color,
-                            self.explosion_rect)
-        
-        screen.blit(self.image, self.rect)
+# Camadas de desenho das partículas e das entidades do ECS (da mais baixa para a mais alta)
+TRAIL_LAYER, EXPLOSION_LAYER, POWERUP_LAYER, SCOREUP_LAYER = range(4)
+
+
+def _explosion_image():
+    """Desenha a imagem da explosão"""
+    image = pygame.Surface((60, 60))
+    image.set_colorkey((0, 0, 0))
+    pygame.draw.ellipse(image, (200, 200, 60), (0, 0, 60, 60))
+    return image
+
+
+def register_particle_effects(particles):
+    """Registra os emissores dos efeitos de partículas: explosões, rastros e pontuações"""
+    config = Settings()
+    particles.add_emitter('explosion', assets.generated('explosion', _explosion_image), EXPLOSION_LAYER, fade=60)
+    # Sprite azulada da nave (metade do vermelho e do verde, azul no máximo)
+    trail = assets.tinted(config.SHIP['image'], (127, 127, 255), (0, 0, 255), divisor=3)
+    particles.add_emitter('trail', trail, TRAIL_LAYER, alpha=200, fade=10)  # Transparência inicial reduzida de maneira suave
+    scoreup = text_renderer.render(config.SCOREUP['font'], "+" + str(config.ALIEN['points']), config.SCOREUP['color'])
+    particles.add_emitter('scoreup', scoreup, SCOREUP_LAYER, fade=15, velocity=(0, -int(config.SCOREUP['speed'])))
+
+
+def warm_circles(game):
+    """Desenha antecipadamente os círculos dos efeitos (power-up, escudo e surgimento dos aliens)"""
+    ship = game.ship
+    circles.warm(itertools.chain(ship.powerup_effect.circle_frames(), ship.shield_effect.circle_frames(),
+                                 AlienSpawnEffect.circle_frames(game.clock.tick_ms)))
+
+
+def spawn_scoreup(particles, x, y):
+    """Cria a exibição de pontuação que sobe e desaparece"""
+    particles.emit('scoreup', x, y)
+
+
+def spawn_explosion(particles, x, y):
+    """Cria uma explosão ao destruir um alienigena"""
+    audio_manager.play_sound("explosion") # Executa o som da explosão
+    particles.emit('explosion', x, y)
 
 
 class FlashScreenEffect:
@@ -119,13 +110,12 @@ class PowerUpEffect:
 
         # Flash da nave
         self.flash_alpha = 0
-        self.flash_image = pygame.image.load("graphics/sprites/ships/ship_white.png").convert_alpha()
-        self.flash_image = pygame.transform.scale(self.flash_image, ship.image.get_size())
+        self.flash_image = assets.image("graphics/sprites/ships/ship_white.png", size=ship.image.get_size())
 
     def activate(self):
         """Ativa o efeito ao coletar um power-up"""
         self.active = True
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.now()
         
         # Executa o som do power-up
         audio_manager.play_sound('power_up')
@@ -141,17 +131,11 @@ class PowerUpEffect:
         if not self.active:
             return
 
-        elapsed_time = pygame.time.get_ticks() - self.start_time
+        elapsed_time = self.game.now() - self.start_time
 
         # Crescimento do brilho do círculo e redução progressiva do tamanho
-        if elapsed_time < 300:  # Primeira fase (crescimento da opacidade)
-            self.circle_alpha = min(255, self.circle_alpha + 15)
-            self.circle_radius = max(1, self.circle_radius - self.circle_shrink_speed)  # Evita valores negativos
-            self.circle_shrink_speed *= 1.1  # Aumenta a velocidade de redução
-
-        elif elapsed_time < 500:  # Segunda fase (redução de opacidade)
-            self.circle_alpha = max(0, self.circle_alpha - 20)
-            self.circle_radius = max(1, self.circle_radius - self.circle_shrink_speed)  # Evita valores negativos
+        self.circle_alpha, self.circle_radius, self.circle_shrink_speed = self.circle_step(
+            elapsed_time, self.circle_alpha, self.circle_radius, self.circle_shrink_speed)
 
         # Flash da nave: aumento da opacidade
         if elapsed_time < 400:
@@ -164,37 +148,63 @@ class PowerUpEffect:
             self.active = False
             self.game.powerup_freeze = False  # Libera o jogo para continuar normalmente
 
-    def render(self, screen):
-        """Renderiza o efeito visual"""
+    @staticmethod
+    def circle_step(elapsed_time, alpha, radius, shrink_speed):
+        """Avança o círculo de energia em um passo; retorna (opacidade, raio, velocidade de redução)"""
+        if elapsed_time < 300:  # Primeira fase (crescimento da opacidade)
+            # Aumenta a velocidade de redução (o raio nunca fica negativo)
+            return min(255, alpha + 15), max(1, radius - shrink_speed), shrink_speed * 1.1
+        if elapsed_time < 500:  # Segunda fase (redução de opacidade)
+            return max(0, alpha - 20), max(1, radius - shrink_speed), shrink_speed
+        return alpha, radius, shrink_speed
+
+    def circle_frames(self):
+        """Círculos (raio, cor, opacidade) desenhados durante o efeito, usados para aquecer o cache"""
+        alpha, radius, shrink_speed = 0, self.ship.rect.width * 2, 3
+        tick_ms = self.game.clock.tick_ms
+        for step in range(int(500 / tick_ms) + 2):
+            alpha, radius, shrink_speed = self.circle_step(step * tick_ms, alpha, radius, shrink_speed)
+            if alpha > 0 and radius > 1:
+                yield radius, (255, 255, 255), alpha
+
+    def draw_list(self, rect=None):
+        """Sprites e posições do efeito visual (rect é a posição da nave desenhada no quadro)"""
         if not self.active:
-            return
+            return []
+        rect = rect or self.ship.rect
+        blits = []
 
-        # Renderizar círculo de energia
+        # Círculo de energia (do cache de círculos)
         if self.circle_alpha > 0 and self.circle_radius > 1:
-            circle_surface = pygame.Surface((self.circle_radius * 2, self.circle_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(circle_surface, (255, 255, 255, int(self.circle_alpha)), 
-                               (self.circle_radius, self.circle_radius), self.circle_radius)
-            screen.blit(circle_surface, (self.ship.rect.centerx - self.circle_radius, 
-                                         self.ship.rect.centery - self.circle_radius))
+            blits.append(circles.blit_args(rect.center, self.circle_radius, (255, 255, 255), self.circle_alpha))
 
-        # Renderizar flash da nave
+        # Flash da nave
         if self.flash_alpha > 0:
-            self.flash_image.set_alpha(self.flash_alpha)
-            screen.blit(self.flash_image, self.ship.rect)
+            self.flash_image.set_alpha(self.flash_alpha)  # Imagem compartilhada: desenhada apenas neste lote
+            blits.append((self.flash_image, rect))
+        return blits
+
+    def render(self, screen, rect=None):
+        """Renderiza o efeito visual (rect é a posição da nave desenhada no quadro)"""
+        screen.blits(self.draw_list(rect), doreturn=False)
 
 
 class AlienSpawnEffect:
-    """Efeito visual para o surgimento dos alienígenas (teleporte dimensional)."""
+    """Efeito visual para o surgimento dos alienígenas (teleporte dimensional), compartilhado pelos aliens que surgem juntos."""
+
+    CIRCLE_GROWTH_SPEED = 2  # Crescimento do raio do círculo de energia por passo
+    CIRCLE_FADE_SPEED = 10  # Redução da opacidade do círculo por passo
 
-    def __init__(self, alien):
-        self.alien = alien
+    def __init__(self, game, image):
+        self.game = game
+        self.image = image
         self.active = True
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.now()
 
-        # Carrega e redimensiona a sprite branca do alien
-        self.original_white = pygame.image.load("graphics/sprites/aliens/alien_1_flash.png").convert_alpha()
-        self.original_white = pygame.transform.scale(self.original_white, alien.image.get_size())
-        self.white_image = self.original_white.copy()
+        # Sprite branca do alien (cada escala intermediária fica no cache de imagens)
+        self.white_path = "graphics/sprites/aliens/alien_1_flash.png"
+        self.white_image = assets.image(self.white_path, size=image.get_size())
+        self.faded_image = None  # Cópia própria da imagem branca, com a opacidade do efeito
 
         # Fase 1: fade-in + escala crescente
         self.alpha = 0
@@ -204,91 +214,86 @@ class AlienSpawnEffect:
         # Círculo de energia
         self.circle_alpha = 255
         self.circle_radius = 1
-        self.circle_max_radius = alien.rect.width * 1.5
-        self.circle_growth_speed = 2
+        self.circle_max_radius = image.get_width() * 1.5
+        self.circle_growth_speed = self.CIRCLE_GROWTH_SPEED
 
     def update(self):
         """Atualiza o efeito de surgimento."""
         if not self.active:
             return
 
-        elapsed = pygame.time.get_ticks() - self.start_time
+        elapsed = self.game.now() - self.start_time
 
         if elapsed < 400:
             # Fase 1: Fade-in e crescimento
             self.alpha = min(255, self.alpha + 10)
             self.scale_factor = min(1.0, self.scale_factor + 0.05)
             scaled_size = (
-                int(self.alien.image.get_width() * self.scale_factor),
-                int(self.alien.image.get_height() * self.scale_factor),
+                int(self.image.get_width() * self.scale_factor),
+                int(self.image.get_height() * self.scale_factor),
             )
-            self.white_image = pygame.transform.scale(self.original_white, scaled_size)
-            self.white_image.set_alpha(self.alpha)
+            self.white_image = assets.image(self.white_path, size=scaled_size)
 
         elif elapsed < 700:
             # Fase 2: Fade-out da imagem branca e início do círculo
             self.alpha = max(0, self.alpha - 15)
-            self.white_image.set_alpha(self.alpha)
-            if not self.finished:
-                self.alien.image.set_alpha(255)
-                self.finished = True
+            self.finished = True
 
             self.circle_radius += self.circle_growth_speed
-            self.circle_alpha = max(0, self.circle_alpha - 10)
+            self.circle_alpha = max(0, self.circle_alpha - self.CIRCLE_FADE_SPEED)
 
         else:
             self.active = False  # Fim do efeito
-
-    def render(self, screen):
-        """Renderiza o efeito de surgimento."""
-        if not self.active:
             return
 
-        # Desenha a imagem branca em fade-in
-        if self.alpha > 0:
-            white_rect = self.white_image.get_rect(center=self.alien.rect.center)
-            screen.blit(self.white_image, white_rect)
+        self.fade_image()
+
+    def fade_image(self):
+        """Aplica a opacidade do efeito a uma cópia própria da imagem branca (a do cache é compartilhada)"""
+        if self.faded_image is None or self.faded_image.get_size() != self.white_image.get_size():
+            self.faded_image = self.white_image.copy()
+        self.faded_image.set_alpha(self.alpha)
+
+    @classmethod
+    def circle_frames(cls, tick_ms):
+        """Círculos (raio, cor, opacidade) desenhados durante o efeito, usados para aquecer o cache"""
+        # O círculo cresce na segunda fase (de 400 a 700ms)
+        for step in range(1, int(300 / tick_ms) + 2):
+            alpha = 255 - cls.CIRCLE_FADE_SPEED * step
+            if alpha > 0:
+                yield 1 + cls.CIRCLE_GROWTH_SPEED * step, (255, 255, 255), alpha
+
+    def draw_list(self, centers):
+        """Sprites e posições do efeito de surgimento centralizado em cada posição informada."""
+        if not self.active:
+            return []
 
-        # Desenha o círculo de energia
+        # Círculo de energia do cache, compartilhado por todos os aliens do grupo
+        circle_surface = None
         if self.circle_alpha > 0 and self.circle_radius > 0:
-            circle_surface = pygame.Surface((self.circle_radius * 2, self.circle_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(circle_surface, (255, 255, 255, int(self.circle_alpha)),
-                               (self.circle_radius, self.circle_radius), self.circle_radius)
-            screen.blit(circle_surface, (self.alien.rect.centerx - self.circle_radius,
-                                         self.alien.rect.centery - self.circle_radius))
-
+            circle_surface = circles.circle(self.circle_radius, (255, 255, 255), self.circle_alpha)
+            half = circle_surface.get_width() // 2
 
-class SpeedTrailEffect:
-    """Rastros da nave quando o power-up de velocidade está ativo"""
+        image = self.faded_image if self.alpha > 0 else None
+        blits = []
+        for center in centers:
+            # Imagem branca em fade-in
+            if image is not None:
+                blits.append((image, image.get_rect(center=center)))
 
-    def __init__(self, game, x, y):
-        self.game = game
-        self.config = Settings()
-        self.image = pygame.image.load(self.config.SHIP['image']).convert_alpha()
-        self.size = self.image.get_width() // 3, self.image.get_height() // 3 # Obtém a resolução proporcional
-        self.image = pygame.transform.scale(self.image, self.size) # Redimensiona a imagem
-
-        # Criar um efeito de coloração azulada na imagem
-        self.image = self.image.copy()
-        for px in range(self.image.get_width()):
-            for py in range(self.image.get_height()):
-                color = self.image.get_at((px, py))
-                self.image.set_at((px, py), (color.r // 2, color.g // 2, 255, color.a))
+            # Círculo de energia
+            if circle_surface is not None:
+                blits.append((circle_surface, (center[0] - half, center[1] - half)))
+        return blits
 
-        self.rect = self.image.get_rect(center=(x, y))
-        self.alpha = 200  # Transparência inicial
+    def render(self, screen, centers):
+        """Renderiza o efeito de surgimento centralizado em cada posição informada."""
+        screen.blits(self.draw_list(centers), doreturn=False)
 
-    def update(self):
-        """Reduz a opacidade gradualmente até desaparecer"""
-        self.alpha -= 10  # Reduz a opacidade de maneira suave
-        if self.alpha <= 0:
-            self.game.speed_trails.remove(self)  # Remove da lista quando invisível
-        else:
-            self.image.set_alpha(self.alpha)  # Aplica a opacidade na sprite
 
-    def render(self, screen):
-        """Desenha o rastro na tela"""
-        screen.blit(self.image, self.rect)
+def spawn_speed_trail(particles, x, y):
+    """Cria um rastro da nave quando o power-up de velocidade está ativo"""
+    particles.emit('trail', x, y)
 
 
 class DoubleShootEffect:
@@ -298,16 +303,13 @@ class DoubleShootEffect:
         self.game = game
         self.ship = ship
 
-        # Carregar as sprites da nave para o efeito de Double Shoot
-        self.normal_image = pygame.image.load("graphics/sprites/ships/ship_1.png").convert_alpha()
-        self.double_shoot_image = pygame.image.load("graphics/sprites/ships/ship_double_shoot.png").convert_alpha()
-        self.white_flash_image = pygame.image.load("graphics/sprites/ships/ship_double_shoot_white.png").convert_alpha()
+        # Obtém as sprites da nave para o efeito de Double Shoot
+        self.normal_image = assets.image("graphics/sprites/ships/ship_1.png", divisor=3)
+        size = self.normal_image.get_size()
 
-        # Ajustar tamanho das imagens
-        size = self.normal_image.get_width() // 3, self.normal_image.get_height() // 3
-        self.normal_image = pygame.transform.scale(self.normal_image, size)
-        self.double_shoot_image = pygame.transform.scale(self.double_shoot_image, size)
-        self.white_flash_image = pygame.transform.scale(self.white_flash_image, size)
+        # Cópias próprias, pois a opacidade destas sprites é alterada durante a transição
+        self.double_shoot_image = assets.image("graphics/sprites/ships/ship_double_shoot.png", size=size).copy()
+        self.white_flash_image = assets.image("graphics/sprites/ships/ship_double_shoot_white.png", size=size).copy()
 
         # Estados de efeito
         self.active = False
@@ -326,12 +328,12 @@ class DoubleShootEffect:
     def deactivate(self):
         """Inicia a transição de fade-out para voltar à nave normal"""
         self.transitioning = True
-        self.start_time = pygame.time.get_ticks()
+        self.start_time = self.game.now()
 
     def update(self):
         """Atualiza a transição entre as sprites"""
         if self.transitioning:
-            elapsed_time = pygame.time.get_ticks() - self.start_time
+            elapsed_time = self.game.now() - self.start_time
 
             if elapsed_time < 300:
                 # Aplicar fade-out da sprite de double shoot
@@ -363,7 +365,7 @@ class ShieldEffect:
         self.active = False
 
         self.spawn_interval = 250  # Tempo entre novos círculos (ms)
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.last_spawn_time = self.ship.game.now()
 
         # Parâmetros visuais
         self.color = (0, 255, 100)  # Verde brilhante
@@ -376,7 +378,7 @@ class ShieldEffect:
         """Ativa o escudo."""
         self.active = True
         self.circles.clear()
-        self.last_spawn_time = pygame.time.get_ticks()
+        self.last_spawn_time = self.ship.game.now()
 
     def deactivate(self):
         """Desativa o escudo."""
@@ -388,7 +390,7 @@ class ShieldEffect:
         if not self.active:
             return
 
-        now = pygame.time.get_ticks()
+        now = self.ship.game.now()
         if now - self.last_spawn_time >= self.spawn_interval:
             # Cria novo círculo no centro da nave
             self.circles.append({
@@ -405,15 +407,21 @@ class ShieldEffect:
         # Remove os círculos totalmente invisíveis
         self.circles = [c for c in self.circles if c["alpha"] > 0]
 
-    def render(self, screen):
-        """Renderiza o efeito de escudo."""
+    def circle_frames(self):
+        """Círculos (raio, cor, opacidade) desenhados pelo escudo, usados para aquecer o cache."""
+        radius, alpha = self.initial_radius, 100
+        while alpha > self.fade_speed:
+            radius += self.growth_speed
+            alpha -= self.fade_speed
+            yield radius, self.color, alpha
+
+    def draw_list(self, rect=None):
+        """Sprites e posições do efeito de escudo (rect é a posição da nave desenhada no quadro)."""
         if not self.active:
-            return
+            return []
+        center = (rect or self.ship.rect).center
+        return [circles.blit_args(center, circle["radius"], self.color, circle["alpha"]) for circle in self.circles]
 
-        for circle in self.circles:
-            radius = int(circle["radius"])
-            alpha = int(circle["alpha"])
-            surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(surface, (*self.color, alpha), (radius, radius), radius)
-            rect = surface.get_rect(center=self.ship.rect.center)
-            screen.blit(surface, rect)
+    def render(self, screen, rect=None):
+        """Renderiza o efeito de escudo (rect é a posição da nave desenhada no quadro)."""
+        screen.blits(self.draw_list(rect), doreturn=False)
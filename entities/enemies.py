@@ -1,45 +1,224 @@
+import numpy as np
 import pygame
 
 from utils.settings import Settings
+from graphics.assets import assets
 from entities.effects import AlienSpawnEffect
 
 
 class Alien:
-    """Classe que representa um alienigena inimigo."""
+    """Visão de um alienigena da frota (os dados ficam nos arrays da Fleet)."""
 
-    def __init__(self, game, x, y):
+    __slots__ = ('fleet', 'index')
+
+    def __init__(self, fleet, index):
+        self.fleet = fleet
+        self.index = index # Posição do alienigena nos arrays da frota
+
+    @property
+    def rect(self):
+        """Retângulo do alienigena na tela"""
+        return self.fleet.rect(self.index)
+
+    @property
+    def spawning(self):
+        """Indica se o alienigena ainda está surgindo"""
+        return bool(self.fleet.spawning[self.index])
+
+
+class Fleet:
+    """
+    Frota de alienigenas armazenada em arrays NumPy (um array por atributo).
+
+    As posições são de ponto flutuante, então velocidades fracionárias (ex: o
+    aumento de 0.2 por nível) não se perdem. Movimento, bordas e linha mais
+    baixa são calculados de uma vez para a frota inteira; iterar sobre a frota
+    retorna visões (Alien) dos alienigenas vivos, usadas pelas colisões.
+    """
+
+    ARRAYS = ('x', 'y', 'previous_x', 'previous_y', 'speed_x', 'alive', 'spawning')
+
+    def __init__(self, game, capacity=64):
         self.game = game
         self.config = Settings()
 
-        # carrega a imagem do alienigena
-        self.image = pygame.image.load(self.config.ALIEN['image'])
-        self.size = self.image.get_width() // 3, self.image.get_height() // 3 # Obtém a resolução proporcional
-        self.image = pygame.transform.scale(self.image, self.size) # Redimensiona a imagem
-        self.rect = self.image.get_rect(topleft=(x, y))
-        self.spawn_x = x
-        self.spawn_y = y
-        self.rect.topleft = (self.spawn_x, self.spawn_y)
-        self.image.set_alpha(0)  # Começa invisível
+        # Imagem compartilhada do alienigena (1/3 da resolução original)
+        self.image = assets.image(self.config.ALIEN['image'], divisor=3)
+        self.width, self.height = self.image.get_size()
 
-        self.spawn_effect = AlienSpawnEffect(self)
+        self.count = 0 # Quantidade de posições usadas nos arrays
+        self.alive_count = 0
+        self.x = np.zeros(0)
+        self.y = np.zeros(0)
+        self.previous_x = np.zeros(0) # Posições na atualização anterior (para interpolar a renderização)
+        self.previous_y = np.zeros(0)
+        self.speed_x = np.zeros(0) # Velocidade horizontal
+        self.alive = np.zeros(0, dtype=bool)
+        self.spawning = np.zeros(0, dtype=bool) # Parados enquanto o efeito de surgimento acontece
+        self.views = []
+        self.reserve(capacity)
 
-        # Configuraações de movimento
-        self.speed_x = 1 # Velocidade horizontal
+        # Efeitos de surgimento ativos e os índices dos alienigenas de cada um
+        self.spawn_effects = []
 
-    def update(self):
-        """Movimenta o alienigena lateralmente"""
-        if self.spawn_effect.active:
-            self.spawn_effect.update()
-            self.rect.topleft = (self.spawn_x, self.spawn_y)  # Fixa a posição durante o efeito
+    def reserve(self, capacity):
+        """Garante espaço nos arrays para a quantidade de alienigenas informada"""
+        if capacity <= len(self.x):
             return
+        capacity = max(capacity, len(self.x) * 2)
+        for name in self.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+        self.views.extend(Alien(self, index) for index in range(len(self.views), capacity))
+
+    def compact(self):
+        """Remove dos arrays as posições dos alienigenas destruídos"""
+        indices = np.flatnonzero(self.alive[:self.count])
+        if len(indices) == self.count:
+            return
+
+        # Nova posição de cada índice antigo (-1 para os destruídos)
+        mapping = np.full(self.count, -1)
+        mapping[indices] = np.arange(len(indices))
+        for name in self.ARRAYS:
+            array = getattr(self, name)
+            array[:len(indices)] = array[indices]
+        self.count = len(indices)
+
+        effects = []
+        for effect, members in self.spawn_effects:
+            members = mapping[members]
+            members = members[members >= 0]
+            if len(members):
+                effects.append((effect, members))
+        self.spawn_effects = effects
+
+    def spawn(self, xs, ys, speed_x):
+        """Adiciona um grupo de alienigenas que surgem juntos (com um único efeito de surgimento)"""
+        self.compact()
+        amount = len(xs)
+        self.reserve(self.count + amount)
+
+        members = np.arange(self.count, self.count + amount)
+        self.x[members] = xs
+        self.y[members] = ys
+        self.previous_x[members] = xs
+        self.previous_y[members] = ys
+        self.speed_x[members] = speed_x
+        self.alive[members] = True
+        self.spawning[members] = True
+        self.spawn_effects.append((AlienSpawnEffect(self.game, self.image), members))
+
+        self.count += amount
+        self.alive_count += amount
+
+    def kill(self, alien):
+        """Remove um alienigena da frota"""
+        if self.alive[alien.index]:
+            self.alive[alien.index] = False
+            self.spawning[alien.index] = False
+            self.alive_count -= 1
+
+    def clear(self):
+        """Remove todos os alienigenas"""
+        self.alive[:self.count] = False
+        self.spawning[:self.count] = False
+        self.count = 0
+        self.alive_count = 0
+        self.spawn_effects = []
+
+    def __len__(self):
+        return self.alive_count
+
+    def __iter__(self):
+        views = self.views
+        return iter([views[index] for index in np.flatnonzero(self.alive[:self.count]).tolist()])
+
+    def rect(self, index):
+        """Retângulo de um alienigena, a partir da sua posição nos arrays"""
+        return pygame.Rect(int(self.x[index]), int(self.y[index]), self.width, self.height)
+
+    def bodies(self):
+        """Pares (retângulo, alienigena) dos alienigenas vivos, usados nas colisões"""
+        alive = np.flatnonzero(self.alive[:self.count])
+        lefts = self.x[alive].astype(int).tolist()
+        tops = self.y[alive].astype(int).tolist()
+        views = self.views
+        return [(pygame.Rect(left, top, self.width, self.height), views[index])
+                for left, top, index in zip(lefts, tops, alive.tolist())]
+
+    def save_positions(self):
+        """Guarda as posições atuais, usadas para interpolar a renderização"""
+        self.previous_x[:self.count] = self.x[:self.count]
+        self.previous_y[:self.count] = self.y[:self.count]
+
+    def draw_positions(self, indices, alpha=1.0):
+        """Posições (esquerda, topo) dos alienigenas interpoladas entre as duas últimas atualizações"""
+        xs = self.previous_x[indices] + (self.x[indices] - self.previous_x[indices]) * alpha
+        ys = self.previous_y[indices] + (self.y[indices] - self.previous_y[indices]) * alpha
+        return xs.astype(int), ys.astype(int)
+
+    def rects(self, alpha=1.0):
+        """Retângulos em que os alienigenas vivos são desenhados (incluindo o círculo de surgimento)"""
+        alive = np.flatnonzero(self.alive[:self.count])
+        lefts, tops = self.draw_positions(alive, alpha)
+        lefts, tops = lefts.tolist(), tops.tolist()
+        spawning = self.spawning[alive].tolist()
+
+        rects = []
+        for left, top, is_spawning in zip(lefts, tops, spawning):
+            rect = pygame.Rect(left, top, self.width, self.height)
+            rects.append(rect.inflate(self.width, self.width) if is_spawning else rect)
+        return rects
+
+    def update(self):
+        """Movimenta lateralmente os alienigenas que já surgiram"""
+        moving = self.alive[:self.count] & ~self.spawning[:self.count]
+        self.x[:self.count][moving] += self.speed_x[:self.count][moving] * self.game.fleet_direction
+
+        effects = []
+        for effect, members in self.spawn_effects:
+            effect.update()
+            if effect.active:
+                effects.append((effect, members))
+            else:
+                self.spawning[members] = False # Fim do surgimento: o grupo passa a se mover
+        self.spawn_effects = effects
+
+    def at_edge(self, width):
+        """Indica se algum alienigena atingiu uma das bordas da tela"""
+        lefts = np.floor(self.x[:self.count][self.alive[:self.count]])
+        if not len(lefts):
+            return False
+        return lefts.max() + self.width >= width or lefts.min() <= 0
+
+    def drop(self, distance):
+        """Faz os alienigenas descerem"""
+        moving = self.alive[:self.count] & ~self.spawning[:self.count]
+        self.y[:self.count][moving] += distance
+
+    def bottom(self):
+        """Retorna a base da linha mais baixa da frota (None se não houver alienigenas)"""
+        tops = self.y[:self.count][self.alive[:self.count]]
+        if not len(tops):
+            return None
+        return int(np.floor(tops.max())) + self.height
+
+    def draw_list(self, alpha=1.0):
+        """Sprites e posições dos alienigenas e dos efeitos de surgimento, interpolando as posições"""
+        moving = np.flatnonzero(self.alive[:self.count] & ~self.spawning[:self.count])
+        lefts, tops = self.draw_positions(moving, alpha)
+        image = self.image
+        blits = [(image, position) for position in zip(lefts.tolist(), tops.tolist())]
 
-        # movimento normal do alien
-        self.rect.x += self.speed_x * self.game.fleet_direction
+        for effect, members in self.spawn_effects:
+            lefts, tops = self.draw_positions(members[self.alive[members]], alpha)
+            centers = zip((lefts + self.width // 2).tolist(), (tops + self.height // 2).tolist())
+            blits.extend(effect.draw_list(centers))
+        return blits
 
-    def render(self, screen):
-        """Desenha o alienigena na tela"""
-        if self.spawn_effect.active:
-            self.spawn_effect.render(screen)
-        else:
-            screen.blit(self.image, self.rect)
-            
\ No newline at end of file
+    def render(self, screen, alpha=1.0):
+        """Desenha os alienigenas e os efeitos de surgimento em um único lote de blits"""
+        screen.blits(self.draw_list(alpha), doreturn=False)
@@ -0,0 +1,218 @@
+"""
+Módulo do sistema de partículas.
+
+As partículas ficam em arrays NumPy de capacidade fixa (posição, velocidade,
+opacidade e emissor), atualizados de uma vez a cada passo de lógica. Cada
+emissor tem sua sprite pré-renderizada em alguns níveis de opacidade,
+compartilhados por todas as suas partículas, então desenhar uma partícula é
+apenas um blit. Com os arrays cheios, as novas partículas são descartadas e
+contadas como excedentes. Para medir o custo com milhares de partículas:
+
+    python -m entities.particles --particles 4000
+"""
+import argparse
+import os
+import time
+
+import numpy as np
+import pygame
+
+from utils.settings import Settings
+
+
+class Emitter:
+    """Tipo de partícula: sprite, camada, opacidade inicial, desvanecimento e velocidade."""
+
+    def __init__(self, image, layer, alpha=255, fade=10, velocity=(0, 0), speed=(0, 0), count=1, levels=16):
+        """
+        :param velocity: Velocidade comum a todas as partículas (px por passo).
+        :param speed: Intervalo da velocidade em direção aleatória somada a cada partícula.
+        :param count: Partículas criadas a cada emissão.
+        :param levels: Níveis de opacidade pré-renderizados da sprite.
+        """
+        self.layer = layer
+        self.alpha = alpha
+        self.fade = fade
+        self.velocity = velocity
+        self.speed = speed
+        self.count = count
+        self.size = image.get_size()
+        self.half_width, self.half_height = self.size[0] / 2, self.size[1] / 2
+
+        # Uma cópia da sprite por nível de opacidade (a última é a opacidade total)
+        self.frames = []
+        for level in range(1, levels + 1):
+            frame = image.copy()
+            frame.set_alpha(level * 255 // levels)
+            self.frames.append(frame)
+
+
+class ParticleSystem:
+    """Partículas em arrays de capacidade fixa, atualizadas e desenhadas por camada."""
+
+    ARRAYS = ('x', 'y', 'previous_x', 'previous_y', 'vx', 'vy', 'alpha', 'fade')
+
+    def __init__(self, capacity=None, bounds=None, seed=None):
+        self.config = Settings()
+        self.capacity = capacity or self.config.PARTICLES['capacity']
+        self.levels = self.config.PARTICLES['alpha_levels']
+        self.bounds = bounds  # Área fora da qual as partículas são removidas
+        self.rng = np.random.default_rng(seed)  # Apenas visual: não usa o gerador do gameplay
+
+        self.count = 0  # Partículas vivas (ocupam as primeiras posições dos arrays)
+        self.overflow = 0  # Partículas descartadas por falta de espaço
+        for name in self.ARRAYS:
+            setattr(self, name, np.zeros(self.capacity, dtype=np.float32))
+        self.emitter = np.zeros(self.capacity, dtype=np.int16)  # Índice do emissor de cada partícula
+        self.layer = np.zeros(self.capacity, dtype=np.int8)
+
+        self.emitters = []
+        self.names = {}  # Nome do emissor -> índice
+        self.update_ms = 0.0
+
+    def add_emitter(self, name, image, layer, **options):
+        """Registra um emissor (ver Emitter) e retorna seu índice."""
+        self.names[name] = len(self.emitters)
+        self.emitters.append(Emitter(image, layer, levels=self.levels, **options))
+        return self.names[name]
+
+    def emit(self, name, x, y):
+        """Cria as partículas de um emissor centralizadas em (x, y)."""
+        index = self.names[name]
+        emitter = self.emitters[index]
+        amount = min(emitter.count, self.capacity - self.count)
+        self.overflow += emitter.count - amount
+        if amount <= 0:
+            return
+
+        new = slice(self.count, self.count + amount)
+        self.x[new] = x
+        self.y[new] = y
+        self.previous_x[new] = x
+        self.previous_y[new] = y
+        self.vx[new], self.vy[new] = emitter.velocity
+        low, high = emitter.speed
+        if high:
+            # Espalha as partículas em direções aleatórias
+            angles = self.rng.uniform(0, 2 * np.pi, amount)
+            speeds = self.rng.uniform(low, high, amount)
+            self.vx[new] += np.cos(angles) * speeds
+            self.vy[new] += np.sin(angles) * speeds
+        self.alpha[new] = emitter.alpha
+        self.fade[new] = emitter.fade
+        self.emitter[new] = index
+        self.layer[new] = emitter.layer
+        self.count += amount
+
+    def clear(self):
+        """Remove todas as partículas."""
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def save_positions(self):
+        """Guarda as posições atuais, usadas para interpolar a renderização."""
+        self.previous_x[:self.count] = self.x[:self.count]
+        self.previous_y[:self.count] = self.y[:self.count]
+
+    def update(self):
+        """Move e desvanece todas as partículas de uma vez, removendo as que sumiram."""
+        start = time.perf_counter()
+        count = self.count
+        if count:
+            self.x[:count] += self.vx[:count]
+            self.y[:count] += self.vy[:count]
+            self.alpha[:count] -= self.fade[:count]
+
+            alive = self.alpha[:count] > 0
+            if self.bounds is not None:
+                alive &= ((self.x[:count] > self.bounds.left) & (self.x[:count] < self.bounds.right)
+                          & (self.y[:count] > self.bounds.top) & (self.y[:count] < self.bounds.bottom))
+            if not alive.all():
+                # Compacta os arrays mantendo a ordem de criação (as mais antigas são desenhadas primeiro)
+                kept = int(alive.sum())
+                for name in self.ARRAYS + ('emitter', 'layer'):
+                    array = getattr(self, name)
+                    array[:kept] = array[:count][alive]
+                self.count = kept
+        self.update_ms = (time.perf_counter() - start) * 1000
+
+    def draw_list(self, layer, alpha=1.0):
+        """Sprites e posições das partículas de uma camada, interpolando as posições."""
+        count = self.count
+        indices = np.flatnonzero(self.layer[:count] == layer)
+        if not len(indices):
+            return []
+        x = self.x[indices]
+        y = self.y[indices]
+        if alpha < 1:
+            x = self.previous_x[indices] + (x - self.previous_x[indices]) * alpha
+            y = self.previous_y[indices] + (y - self.previous_y[indices]) * alpha
+        levels = np.minimum((self.alpha[indices] * self.levels / 255).astype(np.int32), self.levels - 1)
+
+        emitters = self.emitters
+        return [(emitters[emitter].frames[level], (round(x - emitters[emitter].half_width),
+                                                   round(y - emitters[emitter].half_height)))
+                for emitter, level, x, y in zip(self.emitter[indices].tolist(), levels.tolist(), x.tolist(), y.tolist())]
+
+    def render(self, screen, layer, alpha=1.0):
+        """Desenha as partículas de uma camada em um único lote de blits."""
+        screen.blits(self.draw_list(layer, alpha), doreturn=False)
+
+    def rects(self, alpha=1.0):
+        """Retângulos em que as partículas são desenhadas."""
+        return [pygame.Rect(position, frame.get_size())
+                for layer in set(self.layer[:self.count].tolist())
+                for frame, position in self.draw_list(layer, alpha)]
+
+    def stats(self):
+        """Retorna as partículas vivas (total e por emissor), a capacidade, os excedentes e o tempo da atualização."""
+        counts = np.bincount(self.emitter[:self.count], minlength=len(self.emitters))
+        return {
+            'live': self.count,
+            'capacity': self.capacity,
+            'overflow': self.overflow,
+            'emitters': {name: int(counts[index]) for name, index in self.names.items()},
+            'update_ms': round(self.update_ms, 3),
+        }
+
+
+def main(argv=None):
+    """Mede a atualização e o desenho com milhares de partículas vivas."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (sistema de partículas)")
+    parser.add_argument('--particles', type=int, default=4000, help="partículas vivas mantidas")
+    parser.add_argument('--frames', type=int, default=300, help="quadros medidos")
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    pygame.display.set_mode((1, 1))
+    screen = pygame.Surface((800, 600))
+    spark = pygame.Surface((4, 4), pygame.SRCALPHA)
+    pygame.draw.circle(spark, (255, 200, 60), (2, 2), 2)
+
+    particles = ParticleSystem(capacity=args.particles, bounds=screen.get_rect(), seed=0)
+    particles.add_emitter('spark', spark.convert_alpha(), 0, fade=4, speed=(1, 3), count=20)
+    rng = np.random.default_rng(0)
+
+    update_ms = render_ms = 0.0
+    for _ in range(args.frames):
+        # Mantém os arrays cheios (o excesso é contado como excedente)
+        while len(particles) < args.particles:
+            particles.emit('spark', *rng.uniform((0, 0), (800, 600)))
+        particles.save_positions()
+        particles.update()
+        update_ms += particles.update_ms
+        start = time.perf_counter()
+        particles.render(screen, 0, 0.5)
+        render_ms += (time.perf_counter() - start) * 1000
+
+    print(f"{'live':<18}{len(particles)}")
+    print(f"{'overflow':<18}{particles.overflow}")
+    print(f"{'update_ms':<18}{update_ms / args.frames:.3f}")
+    print(f"{'render_ms':<18}{render_ms / args.frames:.3f}")
+
+
+if __name__ == '__main__':
+    main()
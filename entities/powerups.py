@@ -1,38 +1,31 @@
-import pygame
-import random
-
+from core.ecs import Sprite, Velocity
 from utils.settings import Settings
+from graphics.assets import assets
+from entities.effects import POWERUP_LAYER
 
 
 class PowerUp:
-    """Um Power Up para a nave do jogador"""
+    """Componente de um Power Up para a nave do jogador"""
+
+    __slots__ = ('type',)
 
-    def __init__(self, game, x, y, type):
-        self.game = game
-        self.config = Settings()
+    def __init__(self, type):
         self.type = type # Tipo do PowerUp (ex: 'speed', 'shield', 'double_shot')
 
-        # Carrega a imagem do PowerUp que aparecerá na tela
-        if self.type == 'double_shoot':
-            self.image = pygame.image.load(self.config.DOUBLE_BULLET['image'])
-        elif self.type == 'shield':
-            self.image = pygame.image.load(self.config.SHIELD['image'])
-        elif self.type == 'speed':
-            self.image = pygame.image.load(self.config.SPEED['image'])
-        
-        self.image = pygame.transform.scale(self.image, (40, 40))
-        self.rect = self.image.get_rect(center=(x, y))
-
-        self.speed = self.config.POWERUP['speed'] # Velocidade da queda do PowerUp
-
-    def update(self):
-        """Movimenta o PoweUp na tela"""
-        self.rect.y += self.speed
-
-        # Remove o power-up se sair da tela
-        if self.rect.top > self.game.config.SCREEN['height']:
-            self.game.powerups.remove(self)
-
-    def render(self, screen):
-        """Renderiza o PowerUp"""
-        screen.blit(self.image, self.rect)
+
+def spawn_powerup(world, x, y, type):
+    """Cria um PowerUp que cai pela tela (removido ao sair dela)"""
+    config = Settings()
+
+    # Obtém a imagem do PowerUp que aparecerá na tela
+    if type == 'double_shoot':
+        image = assets.image(config.DOUBLE_BULLET['image'], size=(40, 40))
+    elif type == 'shield':
+        image = assets.image(config.SHIELD['image'], size=(40, 40))
+    elif type == 'speed':
+        image = assets.image(config.SPEED['image'], size=(40, 40))
+
+    return world.spawn(rect=image.get_rect(center=(x, y)),
+                       velocity=Velocity(0, config.POWERUP['speed']), # Velocidade da queda do PowerUp
+                       sprite=Sprite(image, POWERUP_LAYER),
+                       powerup=PowerUp(type))
@@ -3,8 +3,8 @@ import pygame
 
 from utils.settings import Settings
 from utils.audio_manager import audio_manager
-from entities.bullets import ShipBullet, DoubleBullet
-from entities.effects import SpeedTrailEffect, PowerUpEffect, DoubleShootEffect, ShieldEffect
+from graphics.assets import assets
+from entities.effects import spawn_speed_trail, PowerUpEffect, DoubleShootEffect, ShieldEffect
 
 
 class Ship:
@@ -14,13 +14,9 @@ class Ship:
         self.game = game
         self.config = Settings()
 
-        # Carrega sprites da nave
-        self.image = pygame.image.load("graphics/sprites/ships/ship_1.png").convert_alpha()
-        # Ajusta o tamanho da imagem
-        self.size = self.image.get_width() // 3, self.image.get_height() // 3
-        self.image = pygame.transform.scale(self.image, self.size)
-        # Define a imagem inicial da nave
-        self.image = self.image
+        # Obtém a sprite compartilhada da nave (1/3 da resolução original)
+        self.image = assets.image("graphics/sprites/ships/ship_1.png", divisor=3)
+        self.size = self.image.get_size()
 
         # Obtém a posição da nave
         self.rect = self.image.get_rect()
@@ -49,11 +45,12 @@ class Ship:
         self.moving_left = False
         self.moving_right = False
 
+        self.previous_x = self.rect.x # Posição na atualização anterior (para interpolar a renderização)
+
     def shoot(self):
         """Dispara tiros, considerando se o power-up está ativo."""
         if len(self.game.bullets) < self.config.SHIP_BULLET['allowed']:
-            bullet = ShipBullet(self.game, self.rect.centerx, self.rect.top)
-            self.game.bullets.append(bullet)
+            self.game.bullets.fire(self.rect.centerx, self.rect.top, self.config.SHIP_BULLET['color'])
             audio_manager.play_sound('shoot')
             
     def activate_shield(self):
@@ -92,13 +89,13 @@ class Ship:
 
     def update(self):
         """Atualiza a posição da nave"""
-        keys = pygame.key.get_pressed()
+        keys = self.game.input.keys
 
         if self.speed_boost_active:
             # Criar rastro apenas a cada 50ms para evitar sobrecarga visual
-            if pygame.time.get_ticks() - self.trail_timer > 50:
-                self.game.speed_trails.append(SpeedTrailEffect(self.game, self.rect.centerx, self.rect.centery))
-                self.trail_timer = pygame.time.get_ticks()
+            if self.game.now() - self.trail_timer > 50:
+                spawn_speed_trail(self.game.particles, self.rect.centerx, self.rect.centery)
+                self.trail_timer = self.game.now()
                 
         # Se o power-up de velocidade estiver ativo, a nave responde mais rápido
         if self.speed_boost_active and self.speed < self.max_speed:
@@ -120,15 +117,24 @@ class Ship:
         # Atualiza o efeito de power-up
         self.powerup_effect.update()
 
-    def render(self, screen):
-        """Renderiza a nave e seus efeitos na tela."""
-        # Renderiza a imagem da nave
-        screen.blit(self.image, self.rect)
-        # Renderiza o efeito de power-up
-        self.powerup_effect.render(screen)
-        # Renderiza o efeito do power-up de escudo
+    def draw_rect(self, alpha=1.0):
+        """Retângulo da nave interpolado entre as duas últimas atualizações."""
+        return self.rect.move(round((self.previous_x - self.rect.x) * (1 - alpha)), 0)
+
+    def draw_list(self, alpha=1.0):
+        """Sprites e posições da nave e de seus efeitos."""
+        rect = self.draw_rect(alpha)
+        # Imagem da nave e efeito de power-up
+        blits = [(self.image, rect)]
+        blits.extend(self.powerup_effect.draw_list(rect))
+        # Efeito do power-up de escudo
         if self.shield_active:
-            self.shield_effect.render(screen)
+            blits.extend(self.shield_effect.draw_list(rect))
+        return blits
+
+    def render(self, screen):
+        """Renderiza a nave e seus efeitos na tela em um único lote de blits."""
+        screen.blits(self.draw_list(self.game.render_alpha), doreturn=False)
 
 
 class DoubleShootShip(Ship):
@@ -138,8 +144,7 @@ class DoubleShootShip(Ship):
         super().__init__(game)  # Chama o construtor da classe pai (Ship)
 
         # Aqui você pode modificar os atributos para diferenciar a nave
-        self.image = pygame.image.load("graphics/sprites/ships/ship_2.png").convert_alpha()
-        self.image = pygame.transform.scale(self.image, self.size)
+        self.image = assets.image("graphics/sprites/ships/ship_2.png", size=self.size)
         self.rect = self.image.get_rect()
 
         # Obtém a posição da nave
@@ -147,6 +152,7 @@ class DoubleShootShip(Ship):
             self.rect.midbottom = (xpos, self.config.SCREEN['height'] - 20)
         else:
             self.rect.midbottom = (self.config.SCREEN['width'] // 2, self.config.SCREEN['height'] - 20)
+        self.previous_x = self.rect.x
 
     def shoot(self):
         """Dispara tiros, considerando se o power-up está ativo."""
@@ -154,7 +160,6 @@ class DoubleShootShip(Ship):
             # Criar dois projéteis, um à esquerda e outro à direita da nave
             left_xy = self.game.ship.rect.centerx - 18, self.game.ship.rect.centery # Posição do disparo esquerdo
             right_xy = self.game.ship.rect.centerx + 18, self.game.ship.rect.centery # Posição do disparo direito
-            bullets = DoubleBullet(self.game, left_xy, right_xy, self.config.DOUBLE_BULLET['color'])
-            self.game.bullets.append(bullets.left_bullet)
-            self.game.bullets.append(bullets.right_bullet)
+            self.game.bullets.fire(*left_xy, self.config.DOUBLE_BULLET['color'])
+            self.game.bullets.fire(*right_xy, self.config.DOUBLE_BULLET['color'])
             audio_manager.play_sound('shoot')
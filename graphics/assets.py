@@ -0,0 +1,148 @@
+"""Módulo que contém o registro central de imagens do jogo."""
+import pygame
+
+from utils.settings import Settings
+from graphics.atlas import SpriteAtlas
+
+
+class AssetManager:
+    """Carrega, converte e redimensiona cada sprite uma única vez e compartilha o resultado."""
+
+    def __init__(self):
+        self.sources = {}  # Imagens originais decodificadas, por caminho
+        self.images = {}  # Sprites prontas, por (caminho, tamanho, divisor, alpha)
+        self.pending = {}  # Decodificações em andamento no pré-carregador, por caminho
+        self.atlas = SpriteAtlas(Settings().ATLAS['index'])  # Sprites pré-escaladas
+
+        # Contadores para acompanhar o uso do cache
+        self.hits = 0
+        self.misses = 0
+        self.disk_loads = 0
+        self.scales = 0
+
+    def _load_source(self, path):
+        """Lê uma imagem do disco apenas na primeira vez que ela é pedida."""
+        if path not in self.sources:
+            if path in self.pending:
+                # Já está sendo decodificada em segundo plano: espera apenas por ela
+                self.sources[path] = self.pending.pop(path).result()
+            else:
+                self.sources[path] = pygame.image.load(path)
+            self.disk_loads += 1
+        return self.sources[path]
+
+    def source_path(self, path, size=None, divisor=None, alpha=True):
+        """Retorna o arquivo que precisa ser decodificado para obter a sprite (a original ou o atlas)."""
+        if alpha and self.atlas.find(path, size, divisor):
+            return self.atlas.image_path
+        return path
+
+    def is_ready(self, path, size=None, divisor=None, alpha=True):
+        """Indica se a sprite já está pronta no cache."""
+        return (path, tuple(size) if size else None, divisor, alpha) in self.images
+
+    def _load_sheet(self, path):
+        """Carrega e converte a imagem do atlas."""
+        sheet = self._load_source(path)
+        if pygame.display.get_surface() is not None:
+            sheet = sheet.convert_alpha()
+        return sheet
+
+    def image(self, path, size=None, divisor=None, alpha=True):
+        """
+        Retorna a sprite compartilhada para a combinação pedida.
+
+        :param path: Caminho da imagem.
+        :param size: Tamanho final (largura, altura), se houver.
+        :param divisor: Divide as dimensões originais por este fator inteiro.
+        :param alpha: Usa convert_alpha() em vez de convert().
+
+        A superfície é compartilhada entre todas as entidades: não desenhe nela
+        e aplique set_alpha() apenas imediatamente antes do blit.
+        """
+        key = (path, tuple(size) if size else None, divisor, alpha)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+
+        # Sprites empacotadas no atlas são recortadas sem decodificar nem redimensionar
+        name = self.atlas.find(path, size, divisor) if alpha else None
+        if name:
+            image = self.atlas.subsurface(name, self._load_sheet)
+            self.images[key] = image
+            return image
+
+        image = self._load_source(path)
+
+        if divisor:
+            size = image.get_width() // divisor, image.get_height() // divisor
+        if size and tuple(size) != image.get_size():
+            image = pygame.transform.scale(image, size)
+            self.scales += 1
+
+        # A conversão depende do modo de vídeo, então só é feita se a tela existir
+        if pygame.display.get_surface() is not None:
+            image = image.convert_alpha() if alpha else image.convert()
+
+        self.images[key] = image
+        return image
+
+    def tinted(self, path, multiply, maximum=(0, 0, 0), size=None, divisor=None):
+        """
+        Retorna uma versão recolorida da sprite, gerada uma única vez por (sprite, cor).
+
+        :param multiply: Fator de cada canal RGB, de 0 a 255 (255 mantém o canal).
+        :param maximum: Valor mínimo de cada canal RGB após a multiplicação.
+
+        A recoloração é feita em bloco com blend flags, preservando o canal alpha.
+        """
+        key = ('tint', path, tuple(size) if size else None, divisor, tuple(multiply), tuple(maximum))
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = self.image(path, size, divisor).copy()
+        image.fill(multiply, special_flags=pygame.BLEND_RGB_MULT)
+        image.fill(maximum, special_flags=pygame.BLEND_RGB_MAX)
+
+        self.images[key] = image
+        return image
+
+    def generated(self, name, build):
+        """Retorna uma superfície desenhada por código (ex: formas), criando-a com build() apenas uma vez."""
+        key = ('generated', name)
+        image = self.images.get(key)
+        if image is not None:
+            self.hits += 1
+            return image
+
+        self.misses += 1
+        image = build()
+        self.images[key] = image
+        return image
+
+    def stats(self):
+        """Retorna os contadores de uso do cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'disk_loads': self.disk_loads,
+            'scales': self.scales,
+            'cached': len(self.images),
+        }
+
+    def clear(self):
+        """Descarta todas as imagens em cache."""
+        self.sources.clear()
+        self.images.clear()
+        self.pending.clear()
+        self.atlas = SpriteAtlas(Settings().ATLAS['index'])
+
+
+# Instância global do registro de imagens
+assets = AssetManager()
@@ -0,0 +1,203 @@
+"""
+Módulo do atlas de sprites.
+
+O atlas reúne, já nos tamanhos usados pelo jogo, as sprites de graphics/sprites
+em uma única imagem acompanhada de um índice (nome -> retângulo). Em tempo de
+execução, apenas o atlas e o índice são abertos: uma sprite cujo arquivo
+original mudou de tamanho é carregada do original. Para conferir pelo conteúdo
+se alguma arte foi alterada depois do empacotamento, e para gerar o atlas
+novamente, execute:
+
+    python -m graphics.atlas --check
+    python -m graphics.atlas
+"""
+import argparse
+import hashlib
+import json
+import os
+
+import pygame
+
+from utils.settings import Settings
+
+
+def sprite_name(path, size):
+    """Nome de uma sprite dentro do atlas."""
+    return f"{path}@{size[0]}x{size[1]}"
+
+
+def file_digest(path):
+    """Hash do conteúdo de um arquivo, usado para detectar sprites alteradas (apenas na verificação)."""
+    with open(path, 'rb') as source:
+        return hashlib.sha1(source.read()).hexdigest()
+
+
+def sprite_manifest():
+    """
+    Lista de sprites empacotadas, no formato (caminho, tamanho, divisor).
+
+    O divisor é registrado para que pedidos como assets.image(path, divisor=3)
+    encontrem a sprite sem precisar abrir a imagem original.
+    """
+    config = Settings()
+
+    def divided(path, divisor):
+        width, height = pygame.image.load(path).get_size()
+        return path, (width // divisor, height // divisor), divisor
+
+    alien = divided(config.ALIEN['image'], 3)
+    ship = divided(config.SHIP['image'], 3)
+    manifest = [alien, ship]
+
+    # Sprite branca do surgimento dos aliens e suas escalas intermediárias
+    # (mesma progressão usada em AlienSpawnEffect.update)
+    flash = "graphics/sprites/aliens/alien_1_flash.png"
+    manifest.append((flash, alien[1], None))
+    scale_factor = 0.2
+    while scale_factor < 1.0:
+        scale_factor = min(1.0, scale_factor + 0.05)
+        size = int(alien[1][0] * scale_factor), int(alien[1][1] * scale_factor)
+        manifest.append((flash, size, None))
+
+    # Variações da nave do jogador no mesmo tamanho da nave
+    for path in ("graphics/sprites/ships/ship_2.png",
+                 "graphics/sprites/ships/ship_white.png",
+                 "graphics/sprites/ships/ship_double_shoot.png",
+                 "graphics/sprites/ships/ship_double_shoot_white.png"):
+        manifest.append((path, ship[1], None))
+
+    # Ícone de vida na HUD
+    manifest.append((config.SHIP['image'], (28, 28), None))
+
+    # Power-ups caindo na tela (40x40) e no temporizador da HUD (32x32)
+    for path in (config.SPEED['image'], config.SHIELD['image'], config.DOUBLE_BULLET['image']):
+        manifest.append((path, (40, 40), None))
+        manifest.append((path, (32, 32), None))
+    manifest.append(("graphics/sprites/powerups/powerup_bg.png", (32, 32), None))
+
+    return manifest
+
+
+def build_atlas(max_width=512, padding=1):
+    """Empacota as sprites do manifesto em uma imagem e grava o índice."""
+    config = Settings()
+
+    # Redimensiona cada sprite uma única vez, ignorando repetições
+    sprites = {}
+    aliases = {}
+    sources = {}
+    for path, size, divisor in sprite_manifest():
+        name = sprite_name(path, size)
+        if name not in sprites:
+            image = pygame.image.load(path)
+            if image.get_size() != size:
+                image = pygame.transform.scale(image, size)  # Mesma escala usada em tempo de execução
+            sprites[name] = image
+        if divisor:
+            aliases[f"{path}//{divisor}"] = name
+        sources[path] = {'size': os.path.getsize(path), 'sha1': file_digest(path)}
+
+    # Empacotamento em prateleiras, das sprites mais altas para as mais baixas
+    rects = {}
+    x = y = shelf_height = 0
+    for name in sorted(sprites, key=lambda n: sprites[n].get_height(), reverse=True):
+        width, height = sprites[name].get_size()
+        if x + width > max_width:
+            x = 0
+            y += shelf_height + padding
+            shelf_height = 0
+        rects[name] = [x, y, width, height]
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+
+    sheet = pygame.Surface((max_width, y + shelf_height), pygame.SRCALPHA)
+    sheet.fill((0, 0, 0, 0))
+    for name, rect in rects.items():
+        sheet.blit(sprites[name], rect[:2])
+
+    os.makedirs(os.path.dirname(config.ATLAS['image']), exist_ok=True)
+    pygame.image.save(sheet, config.ATLAS['image'])
+    with open(config.ATLAS['index'], 'w', encoding='utf-8') as index_file:
+        json.dump({'image': config.ATLAS['image'], 'sources': sources,
+                   'sprites': rects, 'aliases': aliases}, index_file, indent=2, sort_keys=True)
+
+    return len(rects), sheet.get_size()
+
+
+class SpriteAtlas:
+    """Carrega o atlas de sprites e recorta subsuperfícies a partir dele."""
+
+    def __init__(self, index_path):
+        self.index_path = index_path
+        self.sheet = None
+        self.sprites = {}
+        self.aliases = {}
+        self.loaded = False
+
+    def load(self):
+        """Lê o índice do atlas, descartando sprites cuja imagem original mudou."""
+        self.loaded = True
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, encoding='utf-8') as index_file:
+            index = json.load(index_file)
+
+        # Uma sprite é considerada desatualizada se o arquivo original mudou de tamanho
+        # (sem abrir os originais; alterações do mesmo tamanho são apontadas por --check)
+        stale = {path for path, source in index['sources'].items()
+                 if not os.path.exists(path) or os.path.getsize(path) != source['size']}
+        self.sprites = {name: rect for name, rect in index['sprites'].items()
+                        if name.rsplit('@', 1)[0] not in stale}
+        self.aliases = {alias: name for alias, name in index['aliases'].items() if name in self.sprites}
+        self.image_path = index['image']
+
+    def find(self, path, size=None, divisor=None):
+        """Retorna o nome da sprite no atlas, ou None se ela não foi empacotada."""
+        if not self.loaded:
+            self.load()
+        if divisor:
+            return self.aliases.get(f"{path}//{divisor}")
+        if size:
+            name = sprite_name(path, size)
+            if name in self.sprites:
+                return name
+        return None
+
+    def subsurface(self, name, load_image):
+        """Recorta a sprite do atlas; a imagem do atlas é carregada com load_image na primeira vez."""
+        if self.sheet is None:
+            self.sheet = load_image(self.image_path)
+        return self.sheet.subsurface(self.sprites[name])
+
+
+def stale_sources(index_path):
+    """Arquivos originais cujo conteúdo não corresponde mais ao atlas empacotado."""
+    with open(index_path, encoding='utf-8') as index_file:
+        index = json.load(index_file)
+    return sorted(path for path, source in index['sources'].items()
+                  if not os.path.exists(path) or file_digest(path) != source['sha1'])
+
+
+def main(argv=None):
+    """Gera o atlas ou confere se ele está atualizado."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars (atlas de sprites)")
+    parser.add_argument('--check', action='store_true', help="apenas confere o conteúdo dos originais (código 1 se desatualizado)")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        stale = stale_sources(Settings().ATLAS['index'])
+        for path in stale:
+            print(f"Desatualizada: {path}")
+        print("Atlas desatualizado" if stale else "Atlas atualizado")
+        return 1 if stale else 0
+
+    os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    pygame.init()
+    count, size = build_atlas()
+    print(f"Atlas gerado com {count} sprites ({size[0]}x{size[1]})")
+    return 0
+
+
+if __name__ == '__main__':
+    raise SystemExit(main())
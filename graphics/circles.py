@@ -0,0 +1,92 @@
+"""Módulo que contém o cache compartilhado de círculos (discos e anéis) dos efeitos."""
+from collections import OrderedDict
+
+import pygame
+
+
+class CircleCache:
+    """
+    Desenha cada círculo uma única vez e guarda o resultado em um cache LRU.
+
+    Os raios e as opacidades são quantizados: cada círculo fica pronto com a
+    opacidade já aplicada aos pixels, pois o blit de uma superfície com
+    set_alpha() é mais lento do que desenhar o círculo de novo.
+    """
+
+    def __init__(self, max_surfaces=256, radius_step=1, alpha_levels=16):
+        self.surfaces = OrderedDict()  # Círculos desenhados, do menos para o mais recente
+        self.max_surfaces = max_surfaces
+        self.radius_step = radius_step  # Os raios são arredondados para múltiplos deste passo
+        self.alpha_levels = alpha_levels  # Níveis de opacidade
+
+        # Contadores para acompanhar o uso do cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def key(self, radius, color, alpha=255, width=0):
+        """Chave do círculo no cache: raio e nível de opacidade quantizados."""
+        radius = max(1, int(round(radius / self.radius_step)) * self.radius_step)
+        level = min(self.alpha_levels - 1, max(0, int(alpha)) * self.alpha_levels // 256)
+        return radius, tuple(color[:3]), level, width
+
+    def circle(self, radius, color, alpha=255, width=0):
+        """
+        Retorna o círculo compartilhado (disco se width for 0, anel caso contrário).
+
+        A superfície tem lado 2 * raio (quantizado) e não deve ser alterada.
+        """
+        key = self.key(radius, color, alpha, width)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self._draw(*key)
+        self.surfaces[key] = surface
+
+        # Descarta o círculo usado há mais tempo quando o cache enche
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def _draw(self, radius, color, level, width):
+        """Desenha o círculo com a opacidade do nível informado."""
+        alpha = (level + 1) * 255 // self.alpha_levels
+        surface = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(surface, (*color, alpha), (radius, radius), radius, width)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+        return surface
+
+    def warm(self, circles):
+        """Desenha antecipadamente os círculos informados como (raio, cor, opacidade)."""
+        for radius, color, alpha in circles:
+            self.circle(radius, color, alpha)
+
+    def blit_args(self, center, radius, color, alpha=255, width=0):
+        """Superfície e posição do círculo centralizado em center, para um lote de blits."""
+        surface = self.circle(radius, color, alpha, width)
+        half = surface.get_width() // 2
+        return surface, (center[0] - half, center[1] - half)
+
+    def blit(self, screen, center, radius, color, alpha=255, width=0):
+        """Desenha o círculo centralizado em center."""
+        screen.blit(*self.blit_args(center, radius, color, alpha, width))
+
+    def stats(self):
+        """Retorna os contadores de uso do cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'cached': len(self.surfaces),
+        }
+
+
+# Instância global do cache de círculos
+circles = CircleCache()
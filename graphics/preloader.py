@@ -0,0 +1,80 @@
+"""Módulo que contém o pré-carregador dos recursos do gameplay."""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from graphics.assets import assets
+from graphics.text import text_renderer, text_keyframes
+
+
+class Preloader:
+    """
+    Aquece os recursos de um estado enquanto outro está ocioso (ex: o gameplay durante o menu).
+
+    As imagens são decodificadas em uma thread; as conversões, que dependem do
+    modo de vídeo, a abertura das fontes e os quadros de texto agendados (ver
+    TextKeyframes.bake) são feitos na thread principal, em pequenas fatias a
+    cada quadro (pump). Se o jogador avançar antes do fim, finish() espera
+    apenas pelo que ainda falta.
+    """
+
+    def __init__(self, budget_ms=2):
+        self.budget_ms = budget_ms  # Tempo máximo gasto por quadro na thread principal
+        self.executor = None
+        self.images = []  # Sprites a preparar: (caminho, tamanho, divisor, alpha)
+        self.fonts = []  # Fontes a abrir: (arquivo, tamanho)
+
+    def start(self, manifest):
+        """Inicia a decodificação em segundo plano das imagens do manifesto."""
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="preloader")
+
+        for spec in manifest.get('images', []):
+            if assets.is_ready(*spec):
+                continue
+            self.images.append(spec)
+            source = assets.source_path(*spec)
+            if source not in assets.sources and source not in assets.pending:
+                assets.pending[source] = self.executor.submit(pygame.image.load, source)
+
+        self.fonts.extend(spec for spec in manifest.get('fonts', []) if tuple(spec) not in text_renderer.fonts)
+
+    def _ready(self, spec):
+        """Indica se a imagem de origem da sprite já foi decodificada."""
+        future = assets.pending.get(assets.source_path(*spec))
+        return future is None or future.done()
+
+    def pump(self):
+        """Prepara na thread principal o que já foi decodificado, respeitando o orçamento do quadro."""
+        deadline = time.perf_counter() + self.budget_ms / 1000
+
+        while self.fonts and time.perf_counter() < deadline:
+            text_renderer.font(self.fonts.pop(0))
+
+        for spec in list(self.images):
+            if time.perf_counter() >= deadline:
+                break
+            if self._ready(spec):
+                assets.image(*spec)  # Converte e guarda no cache
+                self.images.remove(spec)
+
+        text_keyframes.pump(deadline)  # Quadros das próximas animações de texto
+
+    def finish(self):
+        """Termina o pré-carregamento, esperando apenas pelos recursos que ainda faltam."""
+        for spec in self.fonts:
+            text_renderer.font(spec)
+        for spec in self.images:
+            assets.image(*spec)
+        self.fonts.clear()
+        self.images.clear()
+
+    @property
+    def done(self):
+        """Indica se não há mais nada a pré-carregar."""
+        return not self.images and not self.fonts and not text_keyframes.pending
+
+
+# Instância global do pré-carregador
+preloader = Preloader()
@@ -0,0 +1,256 @@
+"""Módulo que contém o serviço compartilhado de renderização de textos."""
+import time
+from collections import OrderedDict
+
+import pygame
+
+
+class TextRenderer:
+    """Abre cada fonte uma única vez e guarda os textos renderizados em um cache LRU."""
+
+    def __init__(self, max_surfaces=256):
+        self.fonts = {}  # Fontes abertas, por (arquivo, tamanho)
+        self.number_renderers = {}  # Renderizadores de números, por (arquivo, tamanho, cor)
+        self.surfaces = OrderedDict()  # Textos renderizados, do menos para o mais recente
+        self.max_surfaces = max_surfaces
+
+        # Contadores para acompanhar o uso do cache
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def font(self, font_spec):
+        """Retorna a fonte compartilhada para a tupla (arquivo, tamanho)."""
+        font_spec = (font_spec[0], int(font_spec[1]))
+        font = self.fonts.get(font_spec)
+        if font is None:
+            font = pygame.font.Font(*font_spec)
+            self.fonts[font_spec] = font
+        return font
+
+    def render(self, font_spec, text, color, antialias=True):
+        """
+        Retorna a superfície do texto, renderizando-a apenas na primeira vez.
+
+        A superfície é compartilhada: aplique set_alpha() apenas imediatamente antes do blit.
+        """
+        key = (font_spec[0], int(font_spec[1]), text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = self.font(font_spec).render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        # Descarta o texto usado há mais tempo quando o cache enche
+        if len(self.surfaces) > self.max_surfaces:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def numbers(self, font_spec, color):
+        """Retorna o renderizador de números compartilhado para a fonte e a cor."""
+        key = (font_spec[0], int(font_spec[1]), tuple(color))
+        renderer = self.number_renderers.get(key)
+        if renderer is None:
+            renderer = NumberRenderer(self.font(font_spec), color)
+            self.number_renderers[key] = renderer
+        return renderer
+
+    def stats(self):
+        """Retorna os contadores de uso do cache."""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'fonts': len(self.fonts),
+            'cached': len(self.surfaces),
+        }
+
+    def clear(self):
+        """Descarta as fontes e os textos em cache."""
+        self.fonts.clear()
+        self.number_renderers.clear()
+        self.surfaces.clear()
+
+
+class NumberRenderer:
+    """
+    Monta valores numéricos da HUD a partir de glifos rasterizados uma única vez.
+
+    Os dígitos são pré-renderizados na criação; outros caracteres (ex: 's', 'LV ')
+    são rasterizados no primeiro uso. Os últimos valores montados ficam guardados,
+    então um número que não mudou custa apenas um blit.
+    """
+
+    def __init__(self, font, color, max_values=16):
+        self.font = font
+        self.color = tuple(color)
+        self.height = font.get_height()
+        self.glyphs = {}  # Caractere -> (glifo, avanço horizontal)
+        self.values = OrderedDict()  # Texto -> superfície montada
+        self.max_values = max_values
+        self.composed = 0  # Quantidade de valores montados
+
+        for digit in "0123456789":
+            self._glyph(digit)
+
+    def _glyph(self, char):
+        """Retorna o glifo e o avanço de um caractere, rasterizando-o apenas uma vez."""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = (self.font.render(char, True, self.color), self.font.size(char)[0])
+            self.glyphs[char] = glyph
+        return glyph
+
+    def surface(self, text):
+        """Retorna a superfície do texto, montando-a com um lote de blits se o valor for novo."""
+        surface = self.values.get(text)
+        if surface is not None:
+            self.values.move_to_end(text)
+            return surface
+
+        glyphs = [self._glyph(char) for char in text]
+        surface = pygame.Surface((max(1, sum(advance for _, advance in glyphs)), self.height), pygame.SRCALPHA)
+        surface.fill((*self.color, 0))
+
+        # Os glifos são combinados pelo maior alpha para não escurecer as bordas suavizadas
+        blits = []
+        x = 0
+        for glyph, advance in glyphs:
+            blits.append((glyph, (x, 0), None, pygame.BLEND_RGBA_MAX))
+            x += advance
+        surface.blits(blits, doreturn=False)
+
+        self.values[text] = surface
+        self.composed += 1
+        if len(self.values) > self.max_values:
+            self.values.popitem(last=False)
+        return surface
+
+
+class TextKeyframes:
+    """
+    Quadros pré-montados para textos animados por tamanho (ex: 'Level 2').
+
+    Cada glifo é renderizado uma única vez por (fonte, tamanho, cor) e um quadro
+    é apenas a lista de glifos com suas posições. Assim, 'Level 3' reaproveita
+    os glifos já renderizados para 'Level 2' e 'Wave 2'. Os quadros agendados
+    em segundo plano são montados na thread principal, em pequenas fatias por
+    quadro (pump), pois as fontes do SDL_ttf não podem ser usadas por duas
+    threads ao mesmo tempo.
+    """
+
+    def __init__(self, renderer, max_glyphs=4096, max_texts=8):
+        self.renderer = renderer
+        self.glyphs = OrderedDict()  # Glifos renderizados, por (fonte, tamanho, caractere, cor)
+        self.frames = OrderedDict()  # Quadros montados, por (fonte, texto, cor) -> {tamanho: quadro}
+        self.max_glyphs = max_glyphs
+        self.max_texts = max_texts  # Textos com quadros guardados (os glifos continuam em cache)
+        self.pending = OrderedDict()  # Tamanhos agendados para pump(), pela mesma chave de frames
+
+    def _glyph(self, font_path, size, char, color):
+        """Retorna o glifo renderizado, criando-o apenas na primeira vez."""
+        key = (font_path, size, char, color)
+        glyph = self.glyphs.get(key)
+        if glyph is not None:
+            self.glyphs.move_to_end(key)
+            return glyph
+
+        glyph = self.renderer.font((font_path, size)).render(char, True, color)
+        self.glyphs[key] = glyph
+        if len(self.glyphs) > self.max_glyphs:
+            self.glyphs.popitem(last=False)
+        return glyph
+
+    def _frames(self, key):
+        """Quadros de um texto, descartando os do texto usado há mais tempo quando há textos demais."""
+        frames = self.frames.get(key)
+        if frames is not None:
+            self.frames.move_to_end(key)
+            return frames
+
+        frames = self.frames[key] = {}
+        if len(self.frames) > self.max_texts:
+            oldest, _ = self.frames.popitem(last=False)
+            self.pending.pop(oldest, None)
+        return frames
+
+    def _layout(self, font_path, text, size, color):
+        """Monta o quadro (largura, altura, [(glifo, x), ...]) do texto em um tamanho."""
+        font = self.renderer.font((font_path, size))
+        width, height = font.size(text)
+        glyphs = []
+        for index, char in enumerate(text):
+            if char.isspace():
+                continue
+            # A largura do prefixo já considera o kerning entre os caracteres
+            glyphs.append((self._glyph(font_path, size, char, color), font.size(text[:index])[0]))
+        return width, height, glyphs
+
+    def bake(self, font_path, text, sizes, color=(255, 255, 255), background=False):
+        """
+        Pré-renderiza o texto em todos os tamanhos inteiros da animação.
+
+        :param sizes: Tamanhos inteiros percorridos pela animação.
+        :param background: Apenas agenda os quadros, montados aos poucos por pump() sem bloquear o quadro atual.
+        """
+        key = (font_path, text, tuple(color))
+        frames = self._frames(key)
+        sizes = [size for size in dict.fromkeys(int(size) for size in sizes) if size not in frames]
+
+        if background:
+            if sizes:
+                self.pending[key] = sizes
+        else:
+            self.pending.pop(key, None)
+            for size in sizes:
+                frames[size] = self._layout(font_path, text, size, key[2])
+        return frames
+
+    def pump(self, deadline):
+        """Monta os quadros agendados, um tamanho por vez, até o prazo (em time.perf_counter())."""
+        while self.pending and time.perf_counter() < deadline:
+            key, sizes = next(iter(self.pending.items()))
+            frames = self.frames[key]
+            size = sizes.pop()
+            if size not in frames:
+                frames[size] = self._layout(key[0], key[1], size, key[2])
+            if not sizes:
+                del self.pending[key]
+
+    def frame(self, font_path, text, size, color=(255, 255, 255)):
+        """Retorna o quadro do texto no tamanho pedido, montando-o se ainda não existir."""
+        frames = self._frames((font_path, text, tuple(color)))
+        size = int(size)
+        frame = frames.get(size)
+        if frame is None:
+            frame = self._layout(font_path, text, size, tuple(color))
+            frames[size] = frame
+        return frame
+
+    def draw(self, screen, frame, center, alpha=255):
+        """Desenha um quadro centralizado, aplicando a opacidade em cada glifo."""
+        width, height, glyphs = frame
+        left = center[0] - width // 2
+        top = center[1] - height // 2
+        for glyph, x in glyphs:
+            glyph.set_alpha(alpha)
+            screen.blit(glyph, (left + x, top))
+
+    def discard(self, font_path, text, color=(255, 255, 255)):
+        """Descarta os quadros montados de um texto (os glifos continuam em cache)."""
+        key = (font_path, text, tuple(color))
+        self.frames.pop(key, None)
+        self.pending.pop(key, None)
+
+
+# Instância global do serviço de textos
+text_renderer = TextRenderer()
+
+# Quadros pré-montados para as animações de texto
+text_keyframes = TextKeyframes(text_renderer)
@@ -1,6 +1,33 @@
-from core.game import Game
+import argparse
+import time
+
+STARTED = time.perf_counter()  # Início do processo, para a medição da inicialização
+
+
+def main(argv=None):
+    """Ponto de entrada do jogo."""
+    parser = argparse.ArgumentParser(description="Invaders From Mars")
+    parser.add_argument('--startup-profile', action='store_true',
+                        help="mede as fases da inicialização e o tempo até o primeiro quadro, e encerra")
+    parser.add_argument('--record', metavar='ARQUIVO',
+                        help="grava cada partida para reprodução exata (python -m core.replay ARQUIVO)")
+    parser.add_argument('--seed', type=int, help="semente do gerador aleatório das partidas")
+    parser.add_argument('--speed', type=float, help="velocidade do relógio do jogo (ex: 10 para avançar dez vezes mais rápido)")
+    args = parser.parse_args(argv)
+
+    from utils.profiling import startup_profile
+    startup_profile.start(STARTED, enabled=args.startup_profile)
+
+    # A importação é tardia para que seu custo também seja medido
+    with startup_profile.phase('import'):
+        from core.game import Game
+
+    game = Game(seed=args.seed, record=args.record, speed=args.speed)
+    game.run(max_frames=1 if args.startup_profile else None)
+
+    if args.startup_profile:
+        print(startup_profile.report())
 
-game = Game()
 
 if __name__ == '__main__':
-    game.run()
+    main()
@@ -1,4 +1,27 @@
-import pygame
+from graphics.text import text_keyframes
+
+
+def size_keyframes(initial, transition, final, impact_speed, distance_speed):
+    """
+    Retorna os tamanhos inteiros percorridos por uma animação de impacto.
+
+    Reproduz a progressão usada nas animações: uma fase rápida até o tamanho de
+    transição (passo mínimo de 1) e uma fase lenta até o final (passo mínimo de 0.5),
+    tanto para textos que diminuem quanto para textos que crescem.
+    """
+    direction = 1 if transition > initial else -1
+    size = initial
+    sizes = {int(size)}
+
+    while (transition - size) * direction > 0:
+        size += direction * max(abs(transition - size) * impact_speed, 1)
+        sizes.add(int(size))
+
+    while (final - size) * direction > 0:
+        size += direction * max(abs(final - size) * distance_speed, 0.5)
+        sizes.add(int(size))
+
+    return sorted(sizes)
 
 
 class ImpactFadeAnimation:
@@ -25,11 +48,14 @@ class ImpactFadeAnimation:
         self.distance_speed = distance_speed
         self.fade_out_speed = fade_out_speed
 
+        # Pré-renderiza todos os tamanhos pelos quais a animação vai passar
+        text_keyframes.bake(self.font_path, self.text, size_keyframes(
+            self.initial_size, self.transition_size, self.final_size, impact_speed, distance_speed))
+
         # Propriedades visuais
         self.opacity = 255
-        self.font = pygame.font.Font(self.font_path, int(self.current_size))
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.rect = self.image.get_rect(center=self.window.get_rect().center)
+        self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
+        self.center = self.window.get_rect().center
 
         self.impact_finished = False
 
@@ -44,11 +70,8 @@ class ImpactFadeAnimation:
             if self.current_size > self.final_size:
                 self.current_size -= max((self.current_size - self.final_size) * self.distance_speed, 0.5)
 
-        # Atualiza o texto com o novo tamanho e opacidade
-        self.font = pygame.font.Font(self.font_path, int(self.current_size))
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.image.set_alpha(self.opacity)
-        self.rect = self.image.get_rect(center=self.window.get_rect().center)
+        # Seleciona o quadro pré-renderizado do novo tamanho
+        self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
 
         # Aplica fade-out
         if self.opacity > 0:
@@ -57,7 +80,7 @@ class ImpactFadeAnimation:
 
     def render(self):
         """Desenha o texto animado na tela."""
-        self.window.blit(self.image, self.rect)
+        text_keyframes.draw(self.window, self.frame, self.center, self.opacity)
 
     def is_finished(self):
         """Retorna True se a animação terminou completamente."""
@@ -101,13 +124,16 @@ class ExpandFadeAnimation:
         self.use_fade_out = use_fade_out
 
         # Configurar fonte inicial
-        self.font = pygame.font.Font(font_path, int(self.current_size))
+        self.font_path = font_path
         self.text = text
 
-        # Renderizar o texto inicial
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.rect = self.image.get_rect()
-        self.rect.center = self.window.get_rect().center
+        # Pré-renderiza todos os tamanhos pelos quais a animação vai passar
+        text_keyframes.bake(self.font_path, self.text, size_keyframes(
+            self.initial_size, self.transition_size, self.final_size, impact_speed, distance_speed))
+
+        # Quadro inicial do texto
+        self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
+        self.center = self.window.get_rect().center
 
         # Flags de estado
         self.impact_finished = False
@@ -134,11 +160,8 @@ class ExpandFadeAnimation:
             if self.current_size < self.final_size:
                 self.current_size += max((self.final_size - self.current_size) * self.distance_speed, 0.5)
 
-        # Atualiza a fonte e o texto renderizado
-        self.font = pygame.font.Font("fonts/Android Assassin.ttf", int(self.current_size))
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.rect = self.image.get_rect()
-        self.rect.center = self.window.get_rect().center
+        # Seleciona o quadro pré-renderizado do novo tamanho
+        self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
 
         # Fase 3: Fade-out se ativado
         if self.use_fade_out and self.impact_finished and self.current_size >= self.final_size:
@@ -146,9 +169,6 @@ class ExpandFadeAnimation:
                 self.opacity -= self.fade_out_speed
                 self.opacity = max(0, self.opacity)  # Garante que não fique negativo
 
-        # Define a opacidade do texto
-        self.image.set_alpha(self.opacity)
-
     def draw(self):
         """Exibe a animação na tela."""
-        self.window.blit(self.image, self.rect)
+        text_keyframes.draw(self.window, self.frame, self.center, self.opacity)
@@ -0,0 +1,94 @@
+"""
+Módulo do cache de efeitos sonoros já decodificados.
+
+Os efeitos em MP3/WAV são convertidos uma única vez para PCM bruto no formato
+do mixer (frequência, tamanho de amostra e canais) e guardados em um cache
+indexado pelo hash do arquivo original. Nas próximas execuções, o PCM é mapeado
+em memória e entregue direto ao mixer, sem decodificar MP3. Para gerar o cache
+antecipadamente, execute:
+
+    python -m utils.audio_cache
+"""
+import hashlib
+import mmap
+import os
+
+import pygame
+
+from utils.settings import Settings
+
+
+class AudioCache:
+    """Carrega efeitos sonoros a partir do cache de PCM, recorrendo aos originais quando necessário."""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or Settings().AUDIO['cache_dir']
+
+        # Contadores de uso do cache
+        self.hits = 0
+        self.misses = 0
+
+    def cache_path(self, path):
+        """Caminho do PCM em cache para o arquivo, no formato atual do mixer."""
+        with open(path, 'rb') as source:
+            digest = hashlib.sha1(source.read()).hexdigest()
+        frequency, size, channels = pygame.mixer.get_init()
+        return os.path.join(self.cache_dir, f"{digest}-{frequency}-{size}-{channels}.pcm")
+
+    def load(self, path):
+        """Retorna o Sound do arquivo, lido do cache ou decodificado (e então guardado no cache)."""
+        cached = self.cache_path(path)
+        if os.path.exists(cached) and os.path.getsize(cached) > 0:
+            # O Sound copia as amostras: o mapeamento pode ser fechado logo em seguida
+            with open(cached, 'rb') as cache_file, \
+                    mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                sound = pygame.mixer.Sound(buffer=data)
+            self.hits += 1
+            return sound
+
+        # Cache ausente ou desatualizado: decodifica o original e grava o PCM
+        self.misses += 1
+        sound = pygame.mixer.Sound(path)
+        self.store(cached, sound)
+        return sound
+
+    def store(self, cached, sound):
+        """Grava as amostras do som no cache, sem deixar arquivos incompletos."""
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = cached + '.tmp'
+            with open(temp_path, 'wb') as cache_file:
+                cache_file.write(sound.get_raw())
+            os.replace(temp_path, cached)
+        except OSError:
+            pass  # Sem permissão de escrita: o jogo continua usando o original
+
+    def build(self, paths):
+        """Converte os arquivos para o cache e remove entradas que não correspondem a nenhum deles."""
+        current = set()
+        for path in paths:
+            cached = self.cache_path(path)
+            current.add(os.path.basename(cached))
+            if not os.path.exists(cached):
+                self.store(cached, pygame.mixer.Sound(path))
+
+        if not os.path.isdir(self.cache_dir):
+            return len(current)  # Nada foi gravado (ex: sem permissão de escrita)
+
+        for name in os.listdir(self.cache_dir):
+            if name.endswith('.pcm') and name not in current:
+                os.remove(os.path.join(self.cache_dir, name))
+        return len(current)
+
+
+# Instância global do cache de efeitos sonoros
+audio_cache = AudioCache()
+
+
+if __name__ == '__main__':
+    os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+    pygame.mixer.init()
+    effects_dir = "sounds/effects"
+    effects = [os.path.join(effects_dir, name) for name in sorted(os.listdir(effects_dir))]
+    count = audio_cache.build(effects)
+    print(f"{count} efeitos sonoros em cache ({audio_cache.cache_dir})")
@@ -1,22 +1,106 @@
 import pygame
 
+from utils.audio_cache import audio_cache
+from utils.profiling import startup_profile
+from utils.settings import Settings
+
+
+class VoiceGroup:
+    """Grupo de canais reservados para um efeito sonoro, com limite de vozes simultâneas."""
+
+    def __init__(self, channel_ids, min_interval):
+        self.channels = [pygame.mixer.Channel(channel_id) for channel_id in channel_ids]
+        self.started = [0] * len(self.channels)  # Momento em que cada canal começou a tocar
+        self.min_interval = min_interval  # Intervalo mínimo entre disparos (ms)
+        self.last_play = None
+
+        # Contadores de reprodução
+        self.played = 0
+        self.dropped = 0
+        self.stolen = 0
+
+    def play(self, sound, now):
+        """Toca o som em um canal livre do grupo, roubando a voz mais antiga se necessário."""
+        if self.last_play is not None and now < self.last_play:
+            self.started = [now] * len(self.channels)  # Relógio reiniciado (nova partida)
+        elif self.last_play is not None and now - self.last_play < self.min_interval:
+            self.dropped += 1  # Disparo muito próximo do anterior: ignorado
+            return
+
+        index = next((i for i, channel in enumerate(self.channels) if not channel.get_busy()), None)
+        if index is None:
+            index = self.started.index(min(self.started))  # Voz mais antiga do grupo
+            self.channels[index].stop()
+            self.stolen += 1
+
+        self.channels[index].play(sound)
+        self.started[index] = now
+        self.last_play = now
+        self.played += 1
+
+
 class AudioManager:
     """Classe para gerenciar os efeitos sonoros e músicas do jogo."""
     
     def __init__(self):
-        pygame.mixer.init()
+        self.config = Settings()
+        self.sound_paths = {}  # Efeitos registrados, decodificados apenas na inicialização do mixer
         self.sounds = {}
+        self.voice_groups = {}  # Canais reservados por efeito sonoro
         self.musics = {}
         self.current_music = None  # Guarda a música atualmente tocando
+        self.clock = None  # Relógio do jogo (ver core/clock.py), lido pelos grupos de vozes
+        self.enabled = True  # Desativado sem janela: sons e músicas são ignorados
+        self.initialized = False
+
+    def init(self):
+        """Inicializa o mixer e decodifica os efeitos registrados (feito no primeiro som ou música)."""
+        if self.initialized:
+            return
+        self.initialized = True
+        with startup_profile.phase('mixer init'):
+            if not pygame.mixer.get_init():
+                pygame.mixer.init()
+            for sound_name, path in self.sound_paths.items():
+                self.sounds[sound_name] = audio_cache.load(path)
+            self.create_voice_groups()
+
+    def create_voice_groups(self):
+        """Reserva um grupo de canais para cada efeito com limite de vozes configurado."""
+        voices = self.config.AUDIO['voices']
+        reserved = sum(group['voices'] for group in voices.values())
+        pygame.mixer.set_num_channels(reserved + self.config.AUDIO['free_channels'])
+        pygame.mixer.set_reserved(reserved)  # Canais fora do alcance de Sound.play()
+
+        channel_id = 0
+        for sound_name, group in voices.items():
+            channel_ids = range(channel_id, channel_id + group['voices'])
+            self.voice_groups[sound_name] = VoiceGroup(channel_ids, group['min_interval'])
+            channel_id += group['voices']
 
     def load_sound(self, sound_name, path):
-        """Carrega um efeito sonoro."""
-        self.sounds[sound_name] = pygame.mixer.Sound(path)
+        """Registra um efeito sonoro (decodificado quando o mixer for inicializado)."""
+        self.sound_paths[sound_name] = path
+        if self.initialized:
+            self.sounds[sound_name] = audio_cache.load(path)
     
     def play_sound(self, sound_name):
         """Toca um efeito sonoro carregado."""
+        if not self.enabled:
+            return
+        self.init()
         if sound_name in self.sounds:
-            self.sounds[sound_name].play()
+            group = self.voice_groups.get(sound_name)
+            if group:
+                now = self.clock.now() if self.clock is not None else pygame.time.get_ticks()
+                group.play(self.sounds[sound_name], now)
+            else:
+                self.sounds[sound_name].play()
+
+    def stats(self):
+        """Retorna os contadores de reprodução de cada grupo de vozes."""
+        return {name: {'played': group.played, 'dropped': group.dropped, 'stolen': group.stolen}
+                for name, group in self.voice_groups.items()}
 
     def load_music(self, music_name, path):
         """Carrega uma música de fundo."""
@@ -24,6 +108,9 @@ class AudioManager:
 
     def play_music(self, music_name, loop=True):
         """Reproduz uma música de fundo sem reiniciar se já estiver tocando."""
+        if not self.enabled:
+            return
+        self.init()
         if music_name in self.musics:
             # Se já estiver tocando a mesma música, não reiniciar
             if self.current_music == music_name and pygame.mixer.music.get_busy():
@@ -37,14 +124,26 @@ class AudioManager:
 
     def stop_music(self):
         """Para qualquer música de fundo que esteja tocando."""
+        if not self.initialized:
+            return
         pygame.mixer.music.stop()
         self.current_music = None  # Reseta a música atual
 
+    def pause_music(self):
+        """Pausa a música de fundo, se o mixer já foi inicializado."""
+        if self.initialized:
+            pygame.mixer.music.pause()
+
+    def unpause_music(self):
+        """Retoma a música de fundo pausada, se o mixer já foi inicializado."""
+        if self.initialized:
+            pygame.mixer.music.unpause()
+
 
 # Instância global de gerenciamento de áudio
 audio_manager = AudioManager()
 
-# Carregar sons essenciais
+# Registrar sons essenciais
 audio_manager.load_sound("button_hover", "sounds/effects/Select #2.mp3")
 audio_manager.load_sound("button_click", "sounds/effects/Choose #4.mp3")
 audio_manager.load_sound("explosion", "sounds/effects/Down #5.mp3")
@@ -53,7 +152,7 @@ audio_manager.load_sound("level_up", "sounds/effects/LevelUp #1.mp3")
 audio_manager.load_sound("power_up", "sounds/effects/PowerUp #2.wav")
 audio_manager.load_sound("game_over", "sounds/effects/LevelUp #1.mp3")
 
-# Carregar trilha sonora do jogo
+# Registrar trilha sonora do jogo
 audio_manager.load_music("title_bg", "sounds/bgm/title.mp3")  # Alterado para MP3
 audio_manager.load_music("gameplay_bg", "sounds/bgm/gameplay.mp3")  # Alterado para MP3
         
\ No newline at end of file
@@ -1,6 +1,8 @@
 import pygame
 
 from utils.settings import Settings
+from graphics.assets import assets
+from graphics.text import text_renderer
 
 
 class Score:
@@ -9,9 +11,11 @@ class Score:
     def __init__(self, game):
         self.game = game
         self.config = Settings()
-        self.font = pygame.font.Font(*self.config.HUD['score_font'])
+        self.font = self.config.HUD['score_font']
         self.color = self.config.HUD['color']
+        self.numbers = text_renderer.numbers(self.font, self.color) # Glifos dos dígitos
         self.score = self.config.PLAYER['score'] # Pontuação inicial
+        self.rendered_score = None # Última pontuação montada
 
     def add_points(self, points):
         """Adiciona pontos ao jogador"""
@@ -19,6 +23,12 @@ class Score:
 
     def render(self, screen):
         """Exibe a pontuação na tela"""
+        # A pontuação só é formatada novamente quando muda
+        if self.score == self.rendered_score:
+            screen.blit(self.text, (10, 10))
+            return
+        self.rendered_score = self.score
+
         # Arredondar a pontuação para multiplos de dez;
         self.rounded_score = int(round(self.score, -1))
         # Inserir uma vírgula nos agrupamentos decimais;
@@ -27,8 +37,8 @@ class Score:
         self.decimals = 10 - len(self.str_score)
         # Formatar string da pontuação de modo elegante;
         self.formated_score = ("0" * self.decimals) + self.str_score
-        # Renderizar a string da pontuação;
-        self.text = self.font.render(self.formated_score, True, self.color)
+        # Montar a string da pontuação com os glifos dos dígitos;
+        self.text = self.numbers.surface(self.formated_score)
         # Renderizar a pontuação na tela
         screen.blit(self.text, (10, 10))
 
@@ -43,18 +53,16 @@ class Lives:
         # Obtém a quantidade de vidas inicial
         self.lives = self.config.PLAYER['lives']
         
-        # Carrega e redimensiona a imagem da vida
-        self.image = pygame.image.load(self.config.SHIP['image'])
-        self.image = pygame.transform.scale(self.image, (28, 28))
+        # Obtém a imagem da vida já redimensionada
+        self.image = assets.image(self.config.SHIP['image'], size=(28, 28))
         
         # Cria um fundo a partir da imagem da vida
         self.bg_image = self.image.copy()
         self.bg_image.fill((255, 255, 255), special_flags=pygame.BLEND_RGB_MULT)
         self.bg_image.set_alpha(120)
 
-        # Carrega e configura a imagem do fundo do temporizador
-        self.powerup_bg = pygame.image.load('graphics/sprites/powerups/powerup_bg.png')
-        self.powerup_bg = pygame.transform.scale(self.powerup_bg, (32, 32))
+        # Configura a imagem do fundo do temporizador (cópia própria por causa da opacidade)
+        self.powerup_bg = assets.image('graphics/sprites/powerups/powerup_bg.png', size=(32, 32)).copy()
         self.powerup_bg.set_alpha(100)
         self.powerup_bg_rect = self.powerup_bg.get_rect()
         self.powerup_bg_rect.x = 425
@@ -89,14 +97,14 @@ class Level:
     def __init__(self, game):
         self.game = game
         self.config = Settings()
-        self.font = pygame.font.Font(*self.config.HUD['lvl_font'])
+        self.font = self.config.HUD['lvl_font']
         self.lvl = self.config.LEVEL # Nivel inicial
-        self.text = self.font.render(f"{self.config.HUD['lvl_text']}{self.lvl}", True, self.config.HUD['color'])
+        self.text = text_renderer.render(self.font, f"{self.config.HUD['lvl_text']}{self.lvl}", self.config.HUD['color'])
         self.rect = self.text.get_rect()
         
     def update_level(self, level):
         """Atualiza a exibição do nível"""
-        self.text = self.font.render(f"{self.config.HUD['lvl_text']}{self.lvl}", True, (255, 255, 255))
+        self.text = text_renderer.render(self.font, f"{self.config.HUD['lvl_text']}{self.lvl}", (255, 255, 255))
         self.rect = self.text.get_rect()
         self.rect.right = self.config.SCREEN['width'] - 20
         self.lvl = level
@@ -115,9 +123,17 @@ class PowerUpTimer:
         self.game = game
         self.config = Settings()
 
-        self.font = pygame.font.Font(*self.config.HUD['score_font'])
+        self.font = self.config.HUD['score_font']
+        self.numbers = text_renderer.numbers(self.font, (255, 255, 255)) # Glifos dos segundos restantes
         self.base_x_offset = x_offset  # Posição inicial dos temporizadores
 
+        # Ícones de cada power-up
+        self.icons = {
+            'speed': self.config.SPEED['image'],
+            'shield': self.config.SHIELD['image'],
+            'double_shoot': self.config.DOUBLE_BULLET['image'],
+        }
+
     def render(self, screen):
         """Renderiza o temporizador na tela"""
         if self.game.powerup_freeze or self.game.paused:  
@@ -127,21 +143,14 @@ class PowerUpTimer:
 
         for powerup_type in self.game.powerup_manager.active_powerups:
             remaining_time = self.game.powerup_manager.get_remaining_time(powerup_type)
-            if powerup_type == 'speed':
-                powerup_image = pygame.image.load('graphics/sprites/powerups/powerup_7.png')
-            elif powerup_type == 'shield':
-                powerup_image = pygame.image.load('graphics/sprites/powerups/powerup_2.png')
-            elif powerup_type == 'double_shoot':
-                powerup_image = pygame.image.load('graphics/sprites/powerups/powerup_1.png')
-            
-            # Redimensiona a imagem do power-up e obtém o rect da mesma
-            powerup_image = pygame.transform.scale(powerup_image, (32, 32))
+            # Obtém a imagem redimensionada do power-up e o rect da mesma
+            powerup_image = assets.image(self.icons[powerup_type], size=(32, 32))
             powerup_rect = powerup_image.get_rect()
             powerup_rect.x = x_offset
             powerup_rect.y = 5
             
             # Cria o texto que exibe os segundos restantes para o efeito do power-up
-            powerup_text = self.font.render(f"{remaining_time}s", True, (255, 255, 255))
+            powerup_text = self.numbers.surface(f"{remaining_time}s")
 
             # Renderiza a imagem do power-up e os segundos restantes
             x, y = x_offset, 5
@@ -151,3 +160,77 @@ class PowerUpTimer:
             
             # Move para a direita a cada power-up
             x_offset += 80
+
+
+class _BlitRecorder:
+    """Registra os blits dos elementos da HUD em vez de desenhá-los."""
+
+    def __init__(self):
+        self.blits = []
+
+    def blit(self, surface, dest):
+        self.blits.append((surface, tuple(dest)[:2]))  # Cópia da posição: os retângulos dos elementos mudam
+
+
+class HudLayer:
+    """
+    Mantém a barra superior da HUD pronta para desenhar, recompondo-a apenas quando muda.
+
+    A barra é guardada como o fundo translúcido mais a lista de blits dos
+    elementos, desenhados com um blit e um único lote de blits. Compor os elementos
+    translúcidos (bordas suavizadas, fundos dos power-ups) em uma superfície
+    intermediária mudaria a mistura de cores; assim, o resultado é idêntico,
+    pixel a pixel, ao desenho direto de cada elemento na tela.
+    """
+
+    def __init__(self, game, score, lives, level, powerup_timer, height=45):
+        self.game = game
+        self.config = Settings()
+        self.score = score
+        self.lives = lives
+        self.level = level
+        self.powerup_timer = powerup_timer
+
+        # Fundo translúcido da barra e blits dos elementos da última composição
+        self.background = pygame.Surface((self.config.SCREEN['width'], height))
+        self.background.set_alpha(160)
+        self.rect = self.background.get_rect()
+        self.blits = []
+        self.signature = None  # Estado da HUD na última composição
+
+        # Contadores para confirmar a economia de redesenhos
+        self.frames = 0
+        self.invalidations = 0
+
+    def state(self):
+        """Retorna tudo o que é exibido na HUD; a barra só é redesenhada quando isso muda."""
+        if self.game.powerup_freeze or self.game.paused:
+            timers = None  # O temporizador fica oculto durante paralisações
+        else:
+            manager = self.game.powerup_manager
+            timers = tuple((p, manager.get_remaining_time(p)) for p in manager.active_powerups)
+        return self.score.score, self.lives.lives, self.level.lvl, timers
+
+    def redraw(self):
+        """Compõe novamente a barra da HUD."""
+        recorder = _BlitRecorder()
+        self.score.render(recorder)
+        self.lives.render(recorder)
+        self.level.render(recorder)
+        self.powerup_timer.render(recorder)
+        self.blits = recorder.blits
+
+    def render(self, screen):
+        """Exibe o fundo da barra e seus elementos com um único lote de blits."""
+        self.frames += 1
+        signature = self.state()
+        if signature != self.signature:
+            self.signature = signature
+            self.invalidations += 1
+            self.redraw()
+        screen.blit(self.background, self.rect)
+        screen.blits(self.blits, doreturn=False)
+
+    def stats(self):
+        """Retorna quantas vezes a barra foi redesenhada."""
+        return {'frames': self.frames, 'invalidations': self.invalidations}
@@ -1,5 +1,3 @@
-import time
-
 from utils.settings import Settings
 from entities.ships import Ship, DoubleShootShip
 
@@ -12,9 +10,11 @@ class PowerUpManager:
         self.config = Settings()
         self.active_powerups = {}  # Armazena os power-ups ativos e seus tempos
 
-    def activate_powerup(self, powerup_type, duration=10):
+    def activate_powerup(self, powerup_type, duration=None):
         """Ativa um power-up e define seu tempo de expiração"""
-        self.active_powerups[powerup_type] = time.time() + duration  # Marca o tempo de expiração
+        if duration is None:
+            duration = self.config.POWERUP['durations'][powerup_type]
+        self.active_powerups[powerup_type] = self.game.now() / 1000 + duration  # Marca o tempo de expiração
 
         if powerup_type == "speed":
             self.game.ship.speed_boost_active = True  # Ativa o boost de velocidade
@@ -28,12 +28,12 @@ class PowerUpManager:
     def get_remaining_time(self, powerup_type):
         """Retorna o tempo restante de um power-up ativo"""
         if powerup_type in self.active_powerups:
-            return max(0, int(self.active_powerups[powerup_type] - time.time()))  # Retorna tempo em segundos
+            return max(0, int(self.active_powerups[powerup_type] - self.game.now() / 1000))  # Retorna tempo em segundos
         return 0
 
     def update(self):
         """Verifica se algum power-up expirou e remove seus efeitos"""
-        current_time = time.time()
+        current_time = self.game.now() / 1000
         expired_powerups = [p for p, end_time in self.active_powerups.items() if current_time >= end_time]
 
         for powerup in expired_powerups:
@@ -0,0 +1,51 @@
+"""Módulo com a medição do tempo de inicialização do jogo."""
+import time
+from contextlib import contextmanager
+
+
+class StartupProfile:
+    """Mede o tempo de cada fase da inicialização e o tempo até o primeiro quadro."""
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()  # Início do processo (ou da medição)
+        self.phases = []  # Lista de (nome, duração em segundos)
+        self.first_frame_time = None
+
+    def start(self, started=None, enabled=True):
+        """Inicia a medição a partir do instante informado."""
+        self.enabled = enabled
+        self.started = started if started is not None else time.perf_counter()
+        self.phases.clear()
+        self.first_frame_time = None
+
+    @contextmanager
+    def phase(self, name):
+        """Mede a duração de uma fase da inicialização."""
+        if not self.enabled:
+            yield
+            return
+
+        begin = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - begin))
+
+    def first_frame(self):
+        """Registra o momento em que o primeiro quadro foi apresentado."""
+        if self.enabled and self.first_frame_time is None:
+            self.first_frame_time = time.perf_counter() - self.started
+
+    def report(self):
+        """Retorna um relatório em texto com as fases medidas."""
+        lines = ["Perfil de inicialização:"]
+        for name, duration in self.phases:
+            lines.append(f"  {name:<16}{duration * 1000:9.1f} ms")
+        if self.first_frame_time is not None:
+            lines.append(f"  {'primeiro quadro':<16}{self.first_frame_time * 1000:9.1f} ms (desde o início)")
+        return "\n".join(lines)
+
+
+# Instância global da medição de inicialização
+startup_profile = StartupProfile()
@@ -1,3 +1,8 @@
+# Substituições das configurações padrão, no formato {'SEÇÃO.chave': valor}
+# (ex: {'ALIEN.speedup_scale': .3}); usadas nas varreduras de parâmetros
+OVERRIDES = {}
+
+
 class Settings:
     """Classe que contém as configurações do jogo."""
 
@@ -7,7 +12,43 @@ class Settings:
             'caption': "Invaders From Mars",
             'width': 800,
             'height': 600,
-            'fps': 60
+            'fps': 60,  # Limite de quadros renderizados por segundo
+            'tick_rate': 60,  # Passos de lógica por segundo (independente da taxa de quadros)
+            'max_steps': 5,  # Máximo de passos de lógica por quadro (evita a espiral da morte em máquinas lentas)
+            'speed': 1  # Velocidade do relógio do jogo (ex: 10 executa a partida dez vezes mais rápido)
+        }
+        # Configurações de renderização;
+        self.RENDER = {
+            'dirty_rects': False,  # Apresenta apenas as áreas alteradas da tela
+            'dirty_threshold': 0.75,  # Fração da tela a restaurar (áreas sobrepostas contam duas vezes) acima da qual a tela inteira é apresentada
+            'static_background': False  # Desativa a rolagem do fundo (aproveita melhor os retângulos sujos)
+        }
+        # Configurações da gravação de partidas (ver core/replay.py);
+        self.REPLAY = {
+            'checksum_interval': 60  # Passos entre os checksums do estado gravados
+        }
+        # Configurações das partículas (explosões, rastros e pontuações);
+        self.PARTICLES = {
+            'capacity': 4096,  # Partículas vivas ao mesmo tempo (as excedentes são descartadas)
+            'alpha_levels': 16  # Níveis de opacidade pré-renderizados de cada sprite
+        }
+        # Configurações das colisões;
+        self.COLLISION = {
+            'cell_size': 64  # Tamanho (px) das células da grade espacial
+        }
+        # Configurações de áudio: canais reservados por efeito sonoro;
+        self.AUDIO = {
+            'cache_dir': ".cache/sounds",  # Efeitos já decodificados em PCM (gerado com python -m utils.audio_cache)
+            'free_channels': 4,  # Canais livres para efeitos sem grupo próprio
+            'voices': {
+                # Vozes simultâneas e intervalo mínimo entre disparos (ms)
+                'explosion': {'voices': 4, 'min_interval': 30},
+                'shoot': {'voices': 3, 'min_interval': 40},
+                'power_up': {'voices': 1, 'min_interval': 100},
+                'level_up': {'voices': 1, 'min_interval': 250},
+                'button_hover': {'voices': 1, 'min_interval': 50},
+                'button_click': {'voices': 1, 'min_interval': 50}
+            }
         }
         # Configurações do jogador;
         self.PLAYER = {
@@ -44,6 +85,12 @@ class Settings:
         # Configurações dos PowerUps
         self.POWERUP = {
             'speed': 2,
+            'drop_chance': 5,  # Chance (%) de um alienigena destruído soltar um power-up
+            'durations': {  # Duração de cada power-up (s)
+                'speed': 10,
+                'shield': 10,
+                'double_shoot': 10
+            }
         }
         # Configurações dos alienigenas;
         self.ALIEN = {
@@ -68,6 +115,11 @@ class Settings:
             'speed': 2,
             'scale': 2.5
         }
+        # Atlas de sprites gerado por graphics/atlas.py;
+        self.ATLAS = {
+            'image': 'graphics/atlas/sprites.png',
+            'index': 'graphics/atlas/sprites.json'
+        }
         # Configurações dos planos de fundo do jogo;
         self.BACKGROUND = {
             'menu': 'graphics/backgrounds/title_menu_bg.jpg',
@@ -110,4 +162,24 @@ class Settings:
                         "Editar Perfil": "profile_edit"}
         # Configura da Tela de Créditos;
         self.credits = False
+
+        self.apply_overrides()
+
+    def apply_overrides(self):
+        """Aplica as substituições registradas em OVERRIDES."""
+        for name, value in OVERRIDES.items():
+            section, _, key = name.partition('.')
+            if not hasattr(self, section):
+                raise KeyError(f"Configuração desconhecida: {name}")
+            if not key:
+                setattr(self, section, value)
+                continue
+            config = getattr(self, section)
+            # Chaves aninhadas usam pontos (ex: 'POWERUP.durations.shield')
+            *path, key = key.split('.')
+            for part in path:
+                config = config[part]
+            if key not in config:
+                raise KeyError(f"Configuração desconhecida: {name}")
+            config[key] = value
         
\ No newline at end of file
@@ -0,0 +1,74 @@
+"""Módulo com o índice espacial usado na fase ampla das colisões."""
+from collections import defaultdict
+
+
+class SpatialHash:
+    """
+    Grade uniforme que associa cada célula aos objetos cujos retângulos a tocam.
+
+    A grade é reconstruída a cada quadro com os alvos (ex: alienigenas) e depois
+    consultada com os objetos em movimento (ex: tiros), que só são comparados
+    com os alvos das células que ocupam. Assim, o custo cresce com a quantidade
+    de objetos, e não com o produto entre eles.
+    """
+
+    def __init__(self, cell_size=64):
+        self.cell_size = cell_size
+        self.cells = defaultdict(list) # (coluna, linha) -> [(ordem, retângulo, objeto), ...]
+        self.count = 0 # Quantidade de objetos indexados
+
+    def _cells(self, rect):
+        """Células ocupadas por um retângulo"""
+        size = self.cell_size
+        for col in range(rect.left // size, (rect.right - 1) // size + 1):
+            for row in range(rect.top // size, (rect.bottom - 1) // size + 1):
+                yield col, row
+
+    def clear(self):
+        """Remove todos os objetos da grade"""
+        self.cells.clear()
+        self.count = 0
+
+    def insert(self, rect, item):
+        """Adiciona um objeto à grade (a ordem de inserção é preservada nas consultas)"""
+        entry = (self.count, rect, item)
+        for cell in self._cells(rect):
+            self.cells[cell].append(entry)
+        self.count += 1
+
+    def rebuild(self, bodies):
+        """Reconstrói a grade a partir de pares (retângulo, objeto)"""
+        self.clear()
+        for rect, item in bodies:
+            self.insert(rect, item)
+
+    def _candidates(self, rect):
+        """Objetos das células tocadas pelo retângulo, sem repetição e na ordem de inserção"""
+        cells = self.cells
+        found = {}
+        for cell in self._cells(rect):
+            for entry in cells.get(cell, ()):
+                found[entry[0]] = entry
+        return [found[order] for order in sorted(found)]
+
+    def query(self, rect):
+        """Retorna os objetos que colidem com o retângulo"""
+        return [item for _, other, item in self._candidates(rect) if rect.colliderect(other)]
+
+    def first_hits(self, movers):
+        """
+        Retorna, em lote, os pares (objeto em movimento, alvo) que colidiram.
+
+        Cada objeto em movimento atinge no máximo um alvo (o primeiro inserido)
+        e cada alvo é atingido no máximo uma vez; a resolução (remoções,
+        efeitos, pontos) fica a cargo de quem chama.
+        """
+        taken = set()
+        hits = []
+        for rect, item in movers:
+            for order, other, target in self._candidates(rect):
+                if order not in taken and rect.colliderect(other):
+                    taken.add(order)
+                    hits.append((item, target))
+                    break
+        return hits
@@ -2,43 +2,48 @@ import pygame
 
 from utils.settings import Settings
 from utils.audio_manager import audio_manager
-from utils.animations import ImpactFadeAnimation, ExpandFadeAnimation
+from utils.animations import ImpactFadeAnimation, ExpandFadeAnimation, size_keyframes
 
 
 import pygame
 from utils.settings import Settings
 from utils.audio_manager import audio_manager
+from graphics.text import text_keyframes
 
 
 class NextLevelTransition:
     """Animação de transição visual ao subir de nível (ex: 'Wave X')."""
 
+    font_path = "fonts/Android Assassin.ttf"
+
+    # Tamanhos de animação
+    size_init = 300
+    size_transition = 90
+    size_end = 60
+
+    # Velocidades da animação
+    impact_speed = 0.3
+    shrink_speed = 0.01
+    fade_out_speed = 5
+
     def __init__(self, game, text="Onda 1"):
         self.game = game
         self.config = Settings()
         self.text = text
-        self.font_path = "fonts/Android Assassin.ttf"
         self.opacity = 255
-
-        # Tamanhos de animação
-        self.size_init = 300
-        self.size_transition = 90
-        self.size_end = 60
         self.current_size = self.size_init
 
-        # Velocidades da animação
-        self.impact_speed = 0.3
-        self.shrink_speed = 0.01
-        self.fade_out_speed = 5
-
         # Controle de fases
         self.impact_done = False
         self.finished = False
 
-        # Tempo de exibição
-        self.font = pygame.font.Font(self.font_path, int(self.current_size))
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.rect = self.image.get_rect(center=self.game.screen.get_rect().center)
+        # Pré-renderiza os tamanhos da animação (instantâneo se o texto já foi pré-carregado);
+        # sem renderização, apenas a progressão da animação é simulada
+        self.frame = None
+        if self.game.renders:
+            self.frames = self.prefetch(self.text)
+            self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
+        self.center = self.game.screen.get_rect().center
 
         # Toca som de nível
         audio_manager.play_sound("level_up")
@@ -63,18 +68,31 @@ class NextLevelTransition:
                 self.opacity -= self.fade_out_speed
                 if self.opacity <= 0:
                     self.finished = True
+                    text_keyframes.discard(self.font_path, self.text)  # Os glifos continuam em cache
                     return
 
-        # Atualiza o texto com novo tamanho e opacidade
-        self.font = pygame.font.Font(self.font_path, int(self.current_size))
-        self.image = self.font.render(self.text, True, (255, 255, 255))
-        self.image.set_alpha(self.opacity)
-        self.rect = self.image.get_rect(center=self.game.screen.get_rect().center)
+        # Seleciona o quadro pré-renderizado do novo tamanho
+        if self.game.renders:
+            self.frame = text_keyframes.frame(self.font_path, self.text, self.current_size)
 
     def render(self, screen):
         """Renderiza a transição no centro da tela."""
         if not self.finished:
-            screen.blit(self.image, self.rect)
+            text_keyframes.draw(screen, self.frame, self.center, self.opacity)
+
+    def dirty_rect(self):
+        """Área ocupada pelo texto, com folga para os glifos que ultrapassam a caixa da fonte."""
+        width, height = self.frame[:2]
+        rect = pygame.Rect(0, 0, width, height).inflate(height // 2, height // 2)
+        rect.center = self.center
+        return rect
+
+    @classmethod
+    def prefetch(cls, text, background=False):
+        """Pré-renderiza os quadros da transição para um texto (ex: o próximo 'Level N')."""
+        sizes = size_keyframes(cls.size_init, cls.size_transition, cls.size_end,
+                               cls.impact_speed, cls.shrink_speed)
+        return text_keyframes.bake(cls.font_path, text, sizes, background=background)
 
 
 class GameOverTransition: